@@ -7,10 +7,19 @@ Python.
 
 Available documentation :
 	* linuxutil.pid
-	* linuxutil.net"""
+	* linuxutil.net
+	* linuxutil.disk
+	* linuxutil.memory
+	* linuxutil.cgroup (not imported by default)
+	* linuxutil.pressure (not imported by default)
+	* linuxutil.offcpu (not imported by default)
+	* linuxutil.topology (not imported by default)
+	* linuxutil.aio (asyncio front-end, not imported by default)
+	* linuxutil.fixture (fake /proc and /sys trees, not imported by default)
+	* linuxutil.bench (benchmarks on the fake trees, not imported by default)"""
 
 #from linuxutil._common import *
-import linuxutil.net, linuxutil.pid, linuxutil.disk
+import linuxutil.net, linuxutil.pid, linuxutil.disk, linuxutil.memory
 
 __version__ = '0.1.1'
 __author__ = 'G. LE MEUR'
@@ -4,7 +4,9 @@
 import os, sys, time
 
 if os.uname()[0].lower() == 'linux':
-	ProcessPath = '/proc'
+	#Roots of procfs and sysfs, can be moved to a fake tree (see setroot and linuxutil.fixture)
+	ProcessPath = os.environ.get('LINUXUTIL_PROC', '/proc')
+	SysPath = os.environ.get('LINUXUTIL_SYS', '/sys')
 else:
 	raise OSError('%s not supported' % os.uname[0])
 	sys.exit(1)
@@ -13,6 +15,34 @@ else:
 	#raise OSError('This program needs to be run with root account !')
 	#sys.exit(1)
 	
+def setroot(proc = None, sysfs = None):
+	"""
+	Desc : Move the roots of procfs and sysfs in all the linuxutil modules loaded (the environment variables LINUXUTIL_PROC and LINUXUTIL_SYS do the same at import)
+	Args :	* proc : path of the procfs tree (None to keep the current one)
+		* sysfs : path of the sysfs tree (None to keep the current one)
+	Ret  : None
+
+	Exemple :
+		>>> linuxutil._common.setroot('/tmp/fixture/proc', '/tmp/fixture/sys')
+	"""
+	global ProcessPath, SysPath
+
+	if proc != None:
+		ProcessPath = proc
+	if sysfs != None:
+		SysPath = sysfs
+
+	#Each module has its own copy of the roots (from linuxutil._common import *) and some paths built from them
+	for _name, _module in list(sys.modules.items()):
+		if _module == None or not (_name == __package__ or _name.startswith('%s.' % __package__)):
+			continue
+		if hasattr(_module, 'ProcessPath'):
+			_module.ProcessPath = ProcessPath
+		if hasattr(_module, 'SysPath'):
+			_module.SysPath = SysPath
+		if hasattr(_module, '_setroot'):
+			_module._setroot()
+
 #Decorator
 def wrapException(f):
 	def wrapped(*args, **kwargs):
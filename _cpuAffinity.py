@@ -23,16 +23,79 @@ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 try:
 	import ctypes, ctypes.util
 	import os
-
-	_ncpus = os.sysconf('SC_NPROCESSORS_ONLN')
+	import linuxutil._syscall
+	from linuxutil._common import *
+
+	def parse_cpulist(data):
+		"""
+		Desc : Parse a cpu list string of the kernel (cpuset.cpus, local_cpulist, node cpulist...)
+		Args : data (string) : ex 0-3,8-11 or 0-15:2 (stride)
+		Ret  : List of Int sorted
+		"""
+		_x = set()
+		for _range in data.strip().split(','):
+			if not _range:
+				continue
+			_range, _sep, _stride = _range.partition(':')
+			_start, _sep, _end = _range.partition('-')
+			_x.update(range(int(_start), int(_end or _start) + 1, int(_stride or 1)))
+		return sorted(_x)
+
+	def format_cpulist(cpus):
+		"""
+		Desc : Format a cpu list string like the kernel
+		Args : cpus (iterable of int)
+		Ret  : String ex 0-3,8-11
+		"""
+		_x = []
+		for _cpu in sorted(set(cpus)):
+			if _x and _x[-1][1] == _cpu - 1:
+				_x[-1][1] = _cpu
+			else:
+				_x.append([_cpu, _cpu])
+		return ','.join([str(_a) if _a == _b else '%d-%d' % (_a, _b) for _a, _b in _x])
+
+	def _read_cpulist(path):
+		return parse_cpulist(open(path, 'r').read())
+
+	def possible_cpus():
+		"""
+		Desc : CPUs which can be brought online (/sys/devices/system/cpu/possible)
+		Args : None
+		Ret  : List of Int
+		"""
+		return _read_cpulist(os.path.join(SysPath, 'devices', 'system', 'cpu', 'possible'))
+
+	def online_cpus():
+		"""
+		Desc : CPUs online (/sys/devices/system/cpu/online)
+		Args : None
+		Ret  : List of Int
+		"""
+		return _read_cpulist(os.path.join(SysPath, 'devices', 'system', 'cpu', 'online'))
+
+	def node_cpus(node):
+		"""
+		Desc : CPUs of a NUMA node
+		Args : node (int)
+		Ret  : List of Int
+		"""
+		return _read_cpulist(os.path.join(SysPath, 'devices', 'system', 'node', 'node%d' % int(node), 'cpulist'))
+
+	#The cpu ids are bounded by the possible mask (offline and hotpluggable cpus included), not by the number of cpus online. The mask is given to the kernel, so it is sized from the real /sys even when SysPath has been moved
+	try:
+		_ncpus = _read_cpulist('/sys/devices/system/cpu/possible')[-1] + 1
+	except (IOError, OSError, IndexError):
+		_ncpus = os.sysconf('SC_NPROCESSORS_CONF')
 
 	if _ncpus < 1:
 		raise ImportError('Unsupported platform')
 
-	_libc = ctypes.CDLL(ctypes.util.find_library('c'))
+	_libc = linuxutil._syscall.libc()
 
-	_NCPUBITS = ctypes.sizeof(ctypes.c_ulong)
-	_CPU_SET_SIZE = 1024
+	_NCPUBITS = 8 * ctypes.sizeof(ctypes.c_ulong)
+	#At least the 1024 cpus of the glibc cpu_set_t, more if the kernel can have more cpus
+	_CPU_SET_SIZE = max(1024, (_ncpus + _NCPUBITS - 1) // _NCPUBITS * _NCPUBITS)
 
 	class _cpuset(ctypes.Structure):
 		_fields_ = [("bits", ctypes.c_ulong * (int(_CPU_SET_SIZE / _NCPUBITS)))]
@@ -74,6 +137,8 @@ try:
 		return _errno_location().contents.value
 
 	def set_cpu_affinity(cpus, pid = 0):
+		if isinstance(cpus, str):
+			cpus = parse_cpulist(cpus)
 		mask = _cpuset(cpus)
 		result = _sched_setaffinity(pid, ctypes.sizeof(_cpuset), mask)
 		#if result != 0:
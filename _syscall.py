@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Shared bindings of the libc functions and syscalls used by linuxutil.
+The libc is looked up (find_library can fork ldconfig) and bound only once,
+at the first call.
+'''
+
+import os, ctypes, ctypes.util
+
+_libc = None
+
+#See id syscall in /usr/src/`uname -r`/Documentation/block/ioprio.txt
+_ioprio_set = {
+	'i386': 289,
+	'i586': 289,
+	'i686': 289,
+	'x86_64': 251,
+	'ppc': 273,
+	'ppc64': 273,
+	'ppc64le': 273,
+	'ia64': 1274,
+	'armv7l': 314,
+	'aarch64': 30,
+	's390x': 282
+}
+
+_ioprio_get = {
+	'i386': 290,
+	'i586': 290,
+	'i686': 290,
+	'x86_64': 252,
+	'ppc': 274,
+	'ppc64': 274,
+	'ppc64le': 274,
+	'ia64': 1275,
+	'armv7l': 315,
+	'aarch64': 31,
+	's390x': 283
+}
+
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_SHIFT = 13
+
+def libc():
+	"""
+	Desc : The libc, loaded at the first call
+	Args : None
+	Ret  : ctypes.CDLL
+	"""
+	global _libc
+
+	if _libc == None:
+		_x = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno = True)
+		_x.setpriority.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+		_x.setpriority.restype = ctypes.c_int
+		_x.syscall.restype = ctypes.c_long
+		_libc = _x
+	return _libc
+
+def lasterrno():
+	"""
+	Desc : errno of the last failed call
+	Args : None
+	Ret  : Int
+	"""
+	return ctypes.get_errno()
+
+def setpriority(which, who, prio):
+	"""
+	Desc : setpriority(2)
+	Args : which (PRIO_PROCESS = 0, PRIO_PGRP = 1, PRIO_USER = 2), who, prio
+	Ret  : Bool
+	"""
+	return libc().setpriority(int(which), int(who), int(prio)) == 0
+
+def _syscallid(table):
+	_arch = os.uname()[-1].lower()
+	if _arch not in table:
+		raise OSError("Architecture %s is not yet supported" % _arch)
+	return table[_arch]
+
+def ioprio_set(pid, ioclass, iolevel):
+	"""
+	Desc : ioprio_set(2) with IOPRIO_WHO_PROCESS
+	Args : pid (int), ioclass (int), iolevel (int)
+	Ret  : Bool
+	"""
+	return libc().syscall(_syscallid(_ioprio_set), IOPRIO_WHO_PROCESS, int(pid), (int(ioclass) << IOPRIO_CLASS_SHIFT) | int(iolevel)) == 0
+
+def ioprio_get(pid):
+	"""
+	Desc : ioprio_get(2) with IOPRIO_WHO_PROCESS
+	Args : pid (int)
+	Ret  : Int (-1 if the call has failed)
+	"""
+	return libc().syscall(_syscallid(_ioprio_get), IOPRIO_WHO_PROCESS, int(pid))
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""asyncio front-end of linuxutil.pid, linuxutil.net and linuxutil.disk.
+The reads of /proc and /sys are grouped in batches and run on a bounded pool
+of threads so the event loop is never blocked.
+
+Exemple :
+	>>> import asyncio, linuxutil.aio as aio
+	>>> asyncio.run(aio.snapshots())
+	>>> asyncio.run(aio.wait(603, 10))"""
+
+import os, time, asyncio, functools, concurrent.futures
+from linuxutil._common import *
+import linuxutil.pid as pid
+import linuxutil.net
+import linuxutil.disk as disk
+
+_workers = 4
+_executor = None
+
+#@wrapException
+def workers(number = 4):
+	"""
+	Desc : Set the size of the pool of threads used for the reads (the current pool is closed)
+	Args : number (int) : number of threads (4 by default)
+	Ret  : None
+	"""
+	global _workers, _executor
+
+	if int(number) < 1:
+		raise ValueError("At least one worker is needed")
+
+	_workers = int(number)
+	if _executor != None:
+		_executor.shutdown(wait = False)
+		_executor = None
+
+def _pool():
+	global _executor
+
+	if _executor == None:
+		_executor = concurrent.futures.ThreadPoolExecutor(max_workers = _workers, thread_name_prefix = 'linuxutil')
+	return _executor
+
+async def _run(func, *args, **kwargs):
+	"""
+	Desc : Run a blocking function in the pool of threads
+	Args : func and its arguments
+	Ret  : Return of func
+	"""
+	return await asyncio.get_running_loop().run_in_executor(_pool(), functools.partial(func, *args, **kwargs))
+
+def _records(pids):
+	"""
+	Desc : Read the record of many processes (run in a thread)
+	Args : pids : List of Int
+	Ret  : Dict of Int -> record (processes which have disappeared are skipped)
+	"""
+	_x = {}
+	for _pid in pids:
+		try:
+			_x[_pid] = pid.record(_pid)
+		except (IOError, OSError):
+			continue
+	return _x
+
+def _diskstats(names):
+	"""
+	Desc : Read /sys/block/<disk>/stat of many disks (run in a thread)
+	Args : names : List of disk names
+	Ret  : Dict of String -> Dict (see disk.name.stat)
+	"""
+	_x = {}
+	for _name in names:
+		try:
+			_x[_name] = disk._parsestat(open(os.path.join(disk._diskPath, _name, 'stat')).readline())
+		except (IOError, OSError):
+			continue
+	return _x
+
+#@wrapException
+async def snapshot(number):
+	"""
+	Desc : Read stat, status, statm and io of a process (see pid.id.snapshot)
+	Args : number (int) : pid
+	Ret  : Object pid.record
+	"""
+	return await _run(pid.record, int(number))
+
+#@wrapException
+async def snapshots(pids = None, batch = 256):
+	"""
+	Desc : Snapshot of many processes, the pids are split in batches read in parallel by the pool of threads
+	Args :	* pids : List of Int (None for all the processes)
+		* batch (int) : number of processes read by a thread at once (256 by default)
+	Ret  : Dict of Int -> pid.record (processes which have disappeared are skipped)
+	"""
+	if pids == None:
+		pids = await _run(pid.ls)
+	pids = list(pids)
+
+	_x = {}
+	for _y in await asyncio.gather(*[_run(_records, pids[_i:_i+batch]) for _i in range(0, len(pids), batch)]):
+		_x.update(_y)
+	return _x
+
+#@wrapException
+async def scan(fields = ['ppid', 'comm']):
+	"""
+	Desc : Walk /proc in a thread (see pid.scan)
+	Args : fields : List of fields
+	Ret  : List of records
+	"""
+	return await _run(lambda: list(pid.scan(fields)))
+
+#@wrapException
+async def connections(net = 'inet', dns = False, inode = False, user = False, filterUser = None):
+	"""
+	Desc : List network connections in a thread (see net.connections)
+	Args : see net.connections
+	Ret  : Array
+	"""
+	return await _run(linuxutil.net.connections, net = net, dns = dns, inode = inode, user = user, filterUser = filterUser)
+
+#@wrapException
+async def listen(net = 'inet', dns = False, inode = False, user = False, filterUser = None):
+	"""
+	Desc : List connections with LISTEN state in a thread (see net.listen)
+	Args : see net.connections
+	Ret  : Array
+	"""
+	return await _run(linuxutil.net.listen, net = net, dns = dns, inode = inode, user = user, filterUser = filterUser)
+
+#@wrapException
+async def diskstats(names = None, batch = 64):
+	"""
+	Desc : /sys/block/<disk>/stat of many disks read in parallel by the pool of threads
+	Args :	* names : List of disk names (None for disk.ls())
+		* batch (int) : number of disks read by a thread at once (64 by default)
+	Ret  : Dict of String -> Dict (see disk.name.stat)
+	"""
+	if names == None:
+		names = await _run(disk.ls)
+	names = list(names)
+
+	_x = {}
+	for _y in await asyncio.gather(*[_run(_diskstats, names[_i:_i+batch]) for _i in range(0, len(names), batch)]):
+		_x.update(_y)
+	return _x
+
+#@wrapException
+async def wait(number, timeout = 0, sleep = 0.1):
+	"""
+	Desc : Wait the end of a process without blocking the event loop. The pidfd of the process is watched by the event loop itself (no thread), else /proc/<pid> is checked every sleep seconds
+	Args :	* number (int) : pid
+		* timeout : the time to wait in seconds (default is 0 means infinite time)
+		* sleep : step time of the check if pidfd_open is not supported
+	Ret  : Bool (True if the process has finished before the timeout)
+	"""
+	try:
+		_fd = pid._pidfd(int(number))
+	except OSError:
+		return True
+
+	if _fd == None:
+		_start = time.time()
+		while os.path.isdir(os.path.join(ProcessPath, str(number))):
+			if timeout != 0 and time.time() - _start > timeout:
+				return False
+			await asyncio.sleep(sleep)
+		return True
+
+	_loop = asyncio.get_running_loop()
+	_event = asyncio.Event()
+	_loop.add_reader(_fd, _event.set)
+	try:
+		await asyncio.wait_for(_event.wait(), None if timeout == 0 else timeout)
+		return True
+	except asyncio.TimeoutError:
+		return False
+	finally:
+		_loop.remove_reader(_fd)
+		os.close(_fd)
+
+#@wrapException
+async def wait_all(pids, timeout = 0, sleep = 0.1):
+	"""
+	Desc : Wait the end of many processes without blocking the event loop
+	Args :	* pids : List of Int
+		* timeout : the time to wait in seconds (default is 0 means infinite time)
+		* sleep : step time of the check if pidfd_open is not supported
+	Ret  : Dict of Int -> Bool (True if the process has finished before the timeout)
+	"""
+	pids = list(set(pids))
+	return dict(zip(pids, await asyncio.gather(*[wait(_pid, timeout, sleep) for _pid in pids])))
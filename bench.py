@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmarks of linuxutil on fake hosts written by linuxutil.fixture. Each
+benchmark is run on each scale and reports the operations by second, the
+read/write syscalls by operation and the peak of memory allocated by
+Python during one operation.
+
+Exemple :
+	>>> import linuxutil.bench as bench
+	>>> bench.report(bench.run(['small', 'medium']))
+
+	$ python -m linuxutil.bench --scale small --scale large --duration 2"""
+
+import os, time, tempfile, shutil, tracemalloc
+import linuxutil._common, linuxutil.fixture
+
+#Arguments of fixture.generate for each scale
+scales = {
+	'small': {'processes': 200, 'sockets': 1000, 'disks': 4, 'routes': 16, 'interfaces': 4, 'cpus': 4},
+	'medium': {'processes': 5000, 'sockets': 50000, 'disks': 64, 'routes': 256, 'interfaces': 8, 'cpus': 32, 'nodes': 2},
+	'large': {'processes': 100000, 'sockets': 1000000, 'disks': 500, 'routes': 4096, 'interfaces': 16, 'cpus': 256, 'nodes': 4}
+}
+
+#Properties of pid.id timed by the benchmarks pid.id.<property>
+properties = ['name', 'ppid', 'state', 'uid', 'vmrss', 'utime', 'cmdline', 'exe', 'numfd']
+
+#@wrapException
+def _syscalls():
+	"""
+	Desc : read and write syscalls done by the current process (syscr + syscw, the other syscalls are not counted by /proc/<pid>/io). The real /proc is read, not the fake tree
+	Args : None
+	Ret  : Int
+	"""
+	_x = {}
+	for _line in open('/proc/self/io', 'r'):
+		_k, _s, _v = _line.partition(':')
+		_x[_k] = int(_v)
+	return _x['syscr'] + _x['syscw']
+
+#@wrapException
+def measure(func, duration = 1.0):
+	"""
+	Desc : Time a function. It is called once to warm up, then in a loop during duration seconds, then once more with tracemalloc for the memory
+	Args :	* func : function without argument, returning the number of items processed (or None)
+		* duration : time of the loop in seconds (1 by default)
+	Ret  : Dict
+		* ops : number of calls in the loop
+		* ops_s : calls by second
+		* items : items processed by one call (None if func does not return it)
+		* rwsyscalls : read and write syscalls by call (syscr + syscw of /proc/self/io, open, close, stat and getdents are not counted)
+		* peak : peak of the memory allocated by Python during one call (bytes)
+	"""
+	_items = func()
+	_before = _syscalls()
+	_start = time.perf_counter()
+	_end = _start + duration
+	_n = 0
+	while True:
+		func()
+		_n += 1
+		_now = time.perf_counter()
+		if _now >= _end:
+			break
+	_elapsed = _now - _start
+	_calls = (_syscalls() - _before) / float(_n)
+
+	tracemalloc.start()
+	try:
+		func()
+		_peak = tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+	return {'ops': _n, 'ops_s': _n / _elapsed, 'items': _items, 'rwsyscalls': _calls, 'peak': _peak}
+
+#@wrapException
+def benchmarks():
+	"""
+	Desc : Benchmarks on the current roots (see linuxutil._common.setroot). A benchmark returns the number of items it has processed
+	Args : None
+	Ret  : List of Tuple (name, function)
+	"""
+	from linuxutil import pid, net, disk, pci
+
+	_pids = pid.ls()
+
+	def _property(_name):
+		def _f():
+			_n = 0
+			for _pid in _pids:
+				try:
+					getattr(pid.id(_pid, cache = False), _name)
+				except (IOError, OSError):
+					continue
+				_n += 1
+			return _n
+		return _f
+
+	def _diskstat():
+		return len([disk.name(_x).stat for _x in disk.ls()])
+
+	def _pciname():
+		_n = 0
+		for _x in net.physical():
+			_dev = net.dev(_x)
+			pci.pciname(_dev.vendorid, _dev.deviceid, _dev.subvendorid, _dev.subdeviceid)
+			_n += 1
+		return _n
+
+	_x = [('pid.ls', lambda: len(pid.ls()))]
+	_x += [('pid.id.%s' % _name, _property(_name)) for _name in properties]
+	_x += [
+		('net.connections', lambda: len(net.connections())),
+		('net.connections(inode)', lambda: len(net.connections(inode = True))),
+		('net.route', lambda: len(net.route())),
+		('disk.ls', lambda: len(disk.ls())),
+		('disk.name.stat', _diskstat),
+		('pci.pciname', _pciname)
+	]
+	return _x
+
+#@wrapException
+def run(names = ['small', 'medium'], root = None, duration = 1.0, only = None, keep = False):
+	"""
+	Desc : Write the fake hosts and run the benchmarks on them
+	Args :	* names : List of String, scales (keys of scales)
+		* root (string) : directory of the fake hosts (a temporary directory by default). A host already written in root/<scale> is reused
+		* duration : time of each benchmark in seconds (1 by default)
+		* only : List of String, names of the benchmarks to run (None for all)
+		* keep (bool) : keep the temporary directory (False by default)
+	Ret  : List of Dict (scale, name and see measure)
+	"""
+	_tmp = root == None
+	root = root or tempfile.mkdtemp(prefix = 'linuxutil-bench-')
+	_proc, _sys = linuxutil._common.ProcessPath, linuxutil._common.SysPath
+	_y = []
+
+	try:
+		for _scale in names:
+			_path = os.path.join(root, _scale)
+			if not os.path.isdir(os.path.join(_path, 'proc')):
+				linuxutil.fixture.generate(_path, **scales[_scale])
+			linuxutil._common.setroot(os.path.join(_path, 'proc'), os.path.join(_path, 'sys'))
+			try:
+				for _name, _func in benchmarks():
+					if only != None and _name not in only:
+						continue
+					_x = measure(_func, duration)
+					_x['scale'] = _scale
+					_x['name'] = _name
+					_y.append(_x)
+			finally:
+				linuxutil._common.setroot(_proc, _sys)
+	finally:
+		if _tmp and not keep:
+			shutil.rmtree(root, ignore_errors = True)
+	return _y
+
+#@wrapException
+def report(results):
+	"""
+	Desc : Print the results of run() as a table
+	Args : results (list of dict)
+	Ret  : None
+	"""
+	print('%-8s %-24s %12s %10s %14s %12s' % ('scale', 'benchmark', 'ops/s', 'items', 'rw syscalls/op', 'peak KiB'))
+	for _x in results:
+		print('%-8s %-24s %12.2f %10s %14.1f %12.1f' % (_x['scale'], _x['name'], _x['ops_s'], _x['items'] if _x['items'] != None else '-', _x['rwsyscalls'], _x['peak'] / 1024.0))
+
+if __name__ == '__main__':
+	import argparse
+
+	_parser = argparse.ArgumentParser(description = 'Benchmarks of linuxutil on fake /proc and /sys trees')
+	_parser.add_argument('--scale', action = 'append', choices = sorted(scales), help = 'scale to run, can be repeated (small and medium by default)')
+	_parser.add_argument('--root', help = 'directory of the fake hosts, reused between runs (temporary by default)')
+	_parser.add_argument('--duration', type = float, default = 1.0, help = 'time of each benchmark in seconds')
+	_parser.add_argument('--only', action = 'append', help = 'benchmark to run, can be repeated (all by default)')
+	_args = _parser.parse_args()
+	report(run(_args.scale or ['small', 'medium'], _args.root, _args.duration, _args.only))
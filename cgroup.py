@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Control groups v2 (unified hierarchy). The counters of cpu.stat,
+memory.current, memory.stat and io.stat are hierarchical : the usage of a
+service or a container is read in its group instead of summing its
+processes.
+
+Exemple :
+	>>> import linuxutil.cgroup as cgroup
+	>>> cgroup.of(603)
+	>>> cgroup.stat('/system.slice/sshd.service')['cpu']['usage_usec']
+	>>> s = cgroup.sampler()
+	>>> s.sample()
+	>>> time.sleep(1)
+	>>> s.top(5, 'cpu')"""
+
+import os, time
+from linuxutil._common import *
+
+#Mount point of the unified hierarchy, found at the first call of root()
+_cgroupPath = None
+
+def _setroot():
+	"""
+	Desc : Forget the mount point, root() looks for it again (called by setroot)
+	Args : None
+	Ret  : None
+	"""
+	global _cgroupPath
+
+	_cgroupPath = None
+
+#@wrapException
+def root():
+	"""
+	Desc : Mount point of the cgroup v2 hierarchy (/sys/fs/cgroup, or /sys/fs/cgroup/unified on hybrid hosts)
+	Args : None
+	Ret  : String
+	"""
+	global _cgroupPath
+
+	if _cgroupPath == None:
+		_cgroupPath = os.path.join(SysPath, 'fs', 'cgroup')
+		try:
+			for _line in open(os.path.join(ProcessPath, 'self', 'mountinfo'), 'r'):
+				_x = _line.split(' - ')
+				if len(_x) == 2 and _x[1].split()[0] == 'cgroup2':
+					#The mount point is relative to /sys when sysfs has been moved (see setroot)
+					_cgroupPath = os.path.join(SysPath, os.path.relpath(_x[0].split()[4], '/sys'))
+					break
+		except IOError:
+			pass
+	return _cgroupPath
+
+#@wrapException
+def path(cgroup):
+	"""
+	Desc : Directory of a cgroup
+	Args : cgroup (string) : cgroup path as in /proc/<pid>/cgroup (ex /system.slice/sshd.service)
+	Ret  : String
+	"""
+	return os.path.join(root(), cgroup.lstrip('/'))
+
+#@wrapException
+def of(pid):
+	"""
+	Desc : cgroup v2 of a process (line 0:: of /proc/<pid>/cgroup)
+	Args : pid (int)
+	Ret  : String (None if the process is only in cgroup v1 hierarchies)
+	"""
+	for _x in open(os.path.join(ProcessPath, str(pid), 'cgroup'), 'r').read().splitlines():
+		if _x.startswith('0::'):
+			return _x[3:]
+	return None
+
+#@wrapException
+def mapping(pids = None):
+	"""
+	Desc : Processes of each cgroup
+	Args : pids : List of Int (None for all the processes)
+	Ret  : Dict of String (cgroup) -> List of Int (pids)
+	"""
+	if pids == None:
+		pids = [int(_x) for _x in os.listdir(ProcessPath) if _x.isdigit()]
+
+	_x = {}
+	for _pid in pids:
+		try:
+			_cgroup = of(_pid)
+		except (IOError, OSError):
+			#Process has disappeared
+			continue
+		if _cgroup != None:
+			_x.setdefault(_cgroup, []).append(int(_pid))
+	return _x
+
+#@wrapException
+def procs(cgroup, threads = False):
+	"""
+	Desc : Processes of a cgroup (its descendants are not included)
+	Args :	* cgroup (string)
+		* threads (bool) : return the threads (cgroup.threads) instead of the processes (False by default)
+	Ret  : List of Int
+	"""
+	return [int(_x) for _x in open(os.path.join(path(cgroup), 'cgroup.threads' if threads == True else 'cgroup.procs'), 'r').read().split()]
+
+#@wrapException
+def _parsekv(data):
+	"""
+	Desc : Parse a flat keyed file (cpu.stat, memory.stat...)
+	Args : data (string)
+	Ret  : Dict of Int
+	"""
+	_x = {}
+	for _line in data.splitlines():
+		_k, _s, _v = _line.partition(' ')
+		if _v:
+			_x[_k] = int(_v)
+	return _x
+
+#@wrapException
+def _parseiostat(data):
+	"""
+	Desc : Parse io.stat
+	Args : data (string) : lines like 8:0 rbytes=1 wbytes=2 rios=3 wios=4 dbytes=0 dios=0
+	Ret  : Dict of String (major:minor) -> Dict of Int
+	"""
+	_x = {}
+	for _line in data.splitlines():
+		_y = _line.split()
+		if _y:
+			_x[_y[0]] = dict([(_k, int(_v)) for _k, _s, _v in [_z.partition('=') for _z in _y[1:]]])
+	return _x
+
+#@wrapException
+def _read(directory, name):
+	"""
+	Desc : Content of a file of a cgroup, None if the controller is not enabled
+	Args : directory, name (string)
+	Ret  : String or None
+	"""
+	try:
+		return open(os.path.join(directory, name), 'r').read()
+	except IOError:
+		return None
+
+#@wrapException
+def _stat(directory):
+	"""
+	Desc : Counters of a cgroup directory
+	Args : directory (string)
+	Ret  : Dict see stat()
+	"""
+	_x = {'cpu': {}, 'memory_current': None, 'memory': {}, 'io': {}}
+
+	_data = _read(directory, 'cpu.stat')
+	if _data != None:
+		_x['cpu'] = _parsekv(_data)
+	_data = _read(directory, 'memory.current')
+	if _data != None:
+		_x['memory_current'] = int(_data)
+	_data = _read(directory, 'memory.stat')
+	if _data != None:
+		_x['memory'] = _parsekv(_data)
+	_data = _read(directory, 'io.stat')
+	if _data != None:
+		_x['io'] = _parseiostat(_data)
+	return _x
+
+#@wrapException
+def stat(cgroup = '/'):
+	"""
+	Desc : Counters of a cgroup, its descendants included. A key is empty (or None) if its controller is not enabled for the cgroup
+	Args : cgroup (string) : cgroup path (/ by default)
+	Ret  : Dict
+		* cpu : Dict of Int, cpu.stat (usage_usec, user_usec, system_usec, nr_throttled, throttled_usec...)
+		* memory_current : Int (bytes)
+		* memory : Dict of Int, memory.stat (anon, file, ... in bytes)
+		* io : Dict of String (major:minor) -> Dict of Int (rbytes, wbytes, rios, wios, dbytes, dios)
+	"""
+	return _stat(path(cgroup))
+
+class sampler:
+	"""
+	Desc : Rates of all the cgroups of a subtree, computed in one walk of the hierarchy (the cost depends on the number of cgroups, not of processes)
+	Type : Class
+	Ret  : Object
+	"""
+
+	def __init__(self, cgroup = '/', depth = None):
+		"""
+		Desc : Prepare the sampler, nothing is read before the first sample
+		Args :	* cgroup (string) : top of the subtree (/ by default)
+			* depth (int) : maximum depth below the top (None for all)
+		Ret  : Objet
+		"""
+		self.cgroup = cgroup
+		self.depth = depth
+		self._last = {}
+		self._time = None
+
+	#@wrapException
+	def _walk(self):
+		"""
+		Desc : cgroup directories of the subtree
+		Args : None
+		Ret  : Generator of Tuple (cgroup, directory, inode)
+		"""
+		_top = path(self.cgroup)
+		_stack = [('/' + self.cgroup.strip('/') if self.cgroup.strip('/') else '/', _top, os.stat(_top).st_ino, 0)]
+
+		while _stack:
+			_cgroup, _dir, _ino, _depth = _stack.pop()
+			yield (_cgroup, _dir, _ino)
+			if self.depth != None and _depth >= self.depth:
+				continue
+			try:
+				for _entry in os.scandir(_dir):
+					if _entry.is_dir(follow_symlinks = False):
+						_stack.append((_cgroup.rstrip('/') + '/' + _entry.name, _entry.path, _entry.inode(), _depth + 1))
+			except OSError:
+				#cgroup has been removed
+				continue
+
+	#@wrapException
+	def sample(self):
+		"""
+		Desc : Read all the cgroups and compute the rates since the previous sample (nothing at the first sample, new cgroups are skipped)
+		Args : None
+		Ret  : List of Dict
+			* cgroup (string)
+			* cpu, user, system : cpus used (1.0 = one cpu)
+			* throttled : seconds throttled by second
+			* memory : Int, memory.current (bytes)
+			* rbytes, wbytes, rios, wios : io.stat of all the devices by second
+		"""
+		_now = time.time()
+		_dt = _now - self._time if self._time != None else None
+		_new = {}
+		_y = []
+
+		for _cgroup, _dir, _ino in self._walk():
+			_counters = _stat(_dir)
+			_io = {}
+			for _dev in _counters['io'].values():
+				for _k, _v in _dev.items():
+					_io[_k] = _io.get(_k, 0) + _v
+			_cur = {
+				'usage_usec': _counters['cpu'].get('usage_usec', 0),
+				'user_usec': _counters['cpu'].get('user_usec', 0),
+				'system_usec': _counters['cpu'].get('system_usec', 0),
+				'throttled_usec': _counters['cpu'].get('throttled_usec', 0),
+				'rbytes': _io.get('rbytes', 0),
+				'wbytes': _io.get('wbytes', 0),
+				'rios': _io.get('rios', 0),
+				'wios': _io.get('wios', 0)
+			}
+			#A cgroup removed then created again has a new inode
+			_new[(_cgroup, _ino)] = _cur
+
+			_prev = self._last.get((_cgroup, _ino))
+			if _prev == None or not _dt:
+				continue
+
+			_d = dict([(_k, _cur[_k] - _prev[_k]) for _k in _cur])
+			_y.append({
+				'cgroup': _cgroup,
+				'cpu': _d['usage_usec'] / 1e6 / _dt,
+				'user': _d['user_usec'] / 1e6 / _dt,
+				'system': _d['system_usec'] / 1e6 / _dt,
+				'throttled': _d['throttled_usec'] / 1e6 / _dt,
+				'memory': _counters['memory_current'],
+				'rbytes': _d['rbytes'] / _dt,
+				'wbytes': _d['wbytes'] / _dt,
+				'rios': _d['rios'] / _dt,
+				'wios': _d['wios'] / _dt
+			})
+
+		self._last = _new
+		self._time = _now
+		return _y
+
+	#@wrapException
+	def top(self, number = 10, key = 'cpu', leaves = False):
+		"""
+		Desc : Sample and return the cgroups with the highest rate
+		Args :	* number (int) : number of cgroups (10 by default)
+			* key : cpu (default), user, system, throttled, memory, rbytes, wbytes, rios or wios
+			* leaves (bool) : skip the cgroups which have children, their counters include the children (False by default)
+		Ret  : List of Dict (see sample)
+		"""
+		_x = self.sample()
+		if leaves == True:
+			_parents = set([_y['cgroup'].rsplit('/', 1)[0] or '/' for _y in _x if _y['cgroup'] != '/'])
+			_x = [_y for _y in _x if _y['cgroup'] not in _parents]
+		_x = [_y for _y in _x if _y[key]]
+		_x.sort(key = lambda _y: _y[key], reverse = True)
+		return _x[:number]
@@ -4,11 +4,23 @@
 import os, re
 from linuxutil._common import *
 
-_diskPath = '/sys/block/'
-_virtualDiskPath = '/sys/devices/virtual/block'
-_procMounts = '/proc/mounts'
+_diskPath = os.path.join(SysPath, 'block', '')
+_virtualDiskPath = os.path.join(SysPath, 'devices', 'virtual', 'block')
+_procMounts = os.path.join(ProcessPath, 'mounts')
 _fstab = '/etc/fstab'
 
+def _setroot():
+	"""
+	Desc : Build again the paths from ProcessPath and SysPath (called by setroot)
+	Args : None
+	Ret  : None
+	"""
+	global _diskPath, _virtualDiskPath, _procMounts
+
+	_diskPath = os.path.join(SysPath, 'block', '')
+	_virtualDiskPath = os.path.join(SysPath, 'devices', 'virtual', 'block')
+	_procMounts = os.path.join(ProcessPath, 'mounts')
+
 #@wrapException
 def ls(all = False): 
 	"""
@@ -91,6 +103,16 @@ def fstab_not_mounted():
 			tab.append(i)
 	return tab
 
+#@wrapException
+def _parsestat(line):
+	"""
+	Desc : Parse a line of /sys/block/<disk>/stat (see name.stat)
+	Args : line (string)
+	Ret  : Dict of Int
+	"""
+	_x = [int(_y) for _y in line.split()]
+	return {'r_io':_x[0], 'r_merges':_x[1], 'r_sectors':_x[2], 'r_ticks':_x[3], 'w_io':_x[4], 'w_merges':_x[5], 'w_sectors':_x[6], 'w_ticks':_x[7], 'in_flight':_x[8], 'io_ticks':_x[9], 'time_in_queue':_x[10]}
+
 class name:
 	"""
 	Desc : Represents a disk name
@@ -106,13 +128,13 @@ class name:
 		Ret  : Objet
 		"""
 		self.name = str(name)
-		self.path = '/sys/block/%s' % self.name
+		self.path = os.path.join(_diskPath, self.name)
 		
 		if self.name not in ls(all = True):
 			raise OSError("No such disk found with name %s" % self.name)
 			
 		if os.path.exists(os.path.join(self.path, 'device')) and not re.match('c[0-9]+d[0-9]+', os.readlink(os.path.join(self.path, 'device')).split(os.sep)[-1]):
-			self.dev = device(self.name)
+			self.device = device(self.name)
 
 		if os.path.exists(os.path.join(self.path, 'queue')):
 			self.queue = queue(self.name)
@@ -399,7 +421,7 @@ class name:
 		value will increase as the product of the number of milliseconds times the
 		number of requests waiting (see "read ticks" above for an example).
 		"""
-		return [{'r_io':int(_x.split()[0]), 'r_merges':int(_x.split()[1]), 'r_sectors':int(_x.split()[2]), 'r_ticks':int(_x.split()[3]), 'w_io':int(_x.split()[4]), 'w_merges':int(_x.split()[5]), 'w_sectors':int(_x.split()[6]), 'r_ticks':int(_x.split()[7]), 'in_flight':int(_x.split()[8]), 'io_ticks':int(_x.split()[9]), 'time_in_queue':int(_x.split()[10])} for _x in open(os.path.join(self.path, 'stat')).readlines()]
+		return [_parsestat(_x) for _x in open(os.path.join(self.path, 'stat')).readlines()]
 		#return [int(_x) for _x in open(os.path.join(self.path, 'stat')).readline().split()]
 		
 
@@ -417,7 +439,7 @@ class device:
 		Ret  : Objet
 		"""
 		self.name = str(name)
-		self.path = '/sys/block/%s/device' % self.name
+		self.path = os.path.join(_diskPath, self.name, 'device')
 			
 		if not os.path.exists(self.path) or re.match('c[0-9]+d[0-9]+', self.id):
 			raise OSError("Not compatible with disk %s !" % self.name)
@@ -622,7 +644,7 @@ class queue:
 		Ret  : Objet
 		"""
 		self.name = str(name)
-		self.path = '/sys/block/%s/queue' % self.name
+		self.path = os.path.join(_diskPath, self.name, 'queue')
 
 		if not os.path.exists(os.path.join(self.path)):
 			raise OSError("Not compatible with disk %s !" % self.name)
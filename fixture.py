@@ -0,0 +1,440 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Generator of fake /proc and /sys trees, to run linuxutil (and the
+benchmarks of linuxutil.bench) on a host of any size. The files have the
+format of the kernel ones, the values are random but consistent (ppid,
+sockets of /proc/net held by fd of the processes, disks of diskstats...).
+
+Exemple :
+	>>> import linuxutil.fixture as fixture
+	>>> fixture.generate('/tmp/fixture', processes = 100000, sockets = 1000000, disks = 500)
+	>>> linuxutil._common.setroot('/tmp/fixture/proc', '/tmp/fixture/sys')
+
+	$ python -m linuxutil.fixture /tmp/fixture --processes 100000 --sockets 1000000 --disks 500
+	$ LINUXUTIL_PROC=/tmp/fixture/proc LINUXUTIL_SYS=/tmp/fixture/sys python -c 'import linuxutil; print(len(linuxutil.pid.ls()))'"""
+
+import os, random, socket, struct, base64
+
+#Names of the fake processes, kernel threads first
+_names = ['kthreadd', 'rcu_sched', 'kworker/0:1', 'ksoftirqd/0', 'migration/0', 'systemd', 'sshd', 'nginx', 'postgres', 'python3', 'java', 'bash', 'redis-server', 'containerd', 'dockerd', 'chronyd', 'rsyslogd', 'cron', 'node', 'envoy']
+
+#States of the fake tcp sockets (mostly ESTABLISHED, some TIME_WAIT, CLOSE_WAIT and LISTEN)
+_tcpstates = ['01', '01', '01', '06', '08', '0A']
+
+def _write(path, data):
+	with open(path, 'w') as _f:
+		_f.write(data)
+
+def _mkdir(path):
+	os.makedirs(path, exist_ok = True)
+
+def _symlink(target, path):
+	try:
+		os.symlink(target, path)
+	except FileExistsError:
+		pass
+
+def _hex4(address):
+	"""
+	Desc : Address of /proc/net/tcp (little endian hex)
+	Args : address (string)
+	Ret  : String
+	"""
+	return base64.b16encode(socket.inet_pton(socket.AF_INET, address)[::-1]).decode()
+
+def _hex6(address):
+	"""
+	Desc : Address of /proc/net/tcp6 (4 words in host order)
+	Args : address (string)
+	Ret  : String
+	"""
+	return base64.b16encode(struct.pack('=4I', *struct.unpack('=4I', socket.inet_pton(socket.AF_INET6, address)))).decode()
+
+def _letters(n):
+	"""
+	Desc : Suffix of a sd disk (0 -> a, 25 -> z, 26 -> aa)
+	Args : n (int)
+	Ret  : String
+	"""
+	_x = ''
+	n += 1
+	while n:
+		n, _r = divmod(n - 1, 26)
+		_x = chr(97 + _r) + _x
+	return _x
+
+def _stat(pid, name, state, ppid, threads, starttime, rand):
+	"""
+	Desc : Content of /proc/<pid>/stat (52 fields)
+	Args : pid, name, state, ppid, threads, starttime, rand (random.Random)
+	Ret  : String
+	"""
+	_kernel = ppid in (0, 2)
+	_vsize = 0 if _kernel else rand.randint(1 << 22, 1 << 34)
+	_rss = 0 if _kernel else rand.randint(100, 1 << 18)
+	_x = [pid, '(%s)' % name, state, ppid, pid, pid, 0, -1, 4194560 if not _kernel else 2129984,
+		rand.randint(0, 1 << 20), 0, rand.randint(0, 1000), 0,
+		rand.randint(0, 1 << 20), rand.randint(0, 1 << 18), 0, 0, 20, 0, threads, 0, starttime,
+		_vsize, _rss, 18446744073709551615, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17,
+		rand.randint(0, 7), 0, 0, rand.randint(0, 1000), 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+	return ' '.join([str(_y) for _y in _x]) + '\n'
+
+def _status(pid, name, state, ppid, threads, uid, fds, rand):
+	"""
+	Desc : Content of /proc/<pid>/status
+	Args : pid, name, state, ppid, threads, uid, fds, rand (random.Random)
+	Ret  : String
+	"""
+	_states = {'R': 'R (running)', 'S': 'S (sleeping)', 'D': 'D (disk sleep)', 'I': 'I (idle)', 'Z': 'Z (zombie)'}
+	_x = [
+		('Name', name), ('Umask', '0022'), ('State', _states[state]), ('Tgid', pid), ('Ngid', 0), ('Pid', pid), ('PPid', ppid), ('TracerPid', 0),
+		('Uid', '%d\t%d\t%d\t%d' % (uid, uid, uid, uid)), ('Gid', '%d\t%d\t%d\t%d' % (uid, uid, uid, uid)), ('FDSize', max(64, 1 << (fds - 1).bit_length())),
+		('Groups', ''), ('NStgid', pid), ('NSpid', pid), ('NSpgid', pid), ('NSsid', pid)
+	]
+	if ppid not in (0, 2):
+		_rss = rand.randint(1024, 1 << 20)
+		_x += [
+			('VmPeak', '%8d kB' % (_rss * 4)), ('VmSize', '%8d kB' % (_rss * 3)), ('VmLck', '%8d kB' % 0), ('VmPin', '%8d kB' % 0),
+			('VmHWM', '%8d kB' % (_rss + 512)), ('VmRSS', '%8d kB' % _rss), ('RssAnon', '%8d kB' % (_rss * 2 // 3)), ('RssFile', '%8d kB' % (_rss // 3)),
+			('RssShmem', '%8d kB' % 0), ('VmData', '%8d kB' % (_rss * 2)), ('VmStk', '%8d kB' % 132), ('VmExe', '%8d kB' % 1024),
+			('VmLib', '%8d kB' % 8192), ('VmPTE', '%8d kB' % (_rss // 512 + 4)), ('VmSwap', '%8d kB' % 0), ('HugetlbPages', '%8d kB' % 0),
+			('CoreDumping', 0), ('THP_enabled', 1)
+		]
+	_x += [
+		('Threads', threads), ('SigQ', '0/63448'), ('SigPnd', '0000000000000000'), ('ShdPnd', '0000000000000000'),
+		('SigBlk', '0000000000000000'), ('SigIgn', '0000000000001000'), ('SigCgt', '0000000180004a03'),
+		('CapInh', '0000000000000000'), ('CapPrm', '000001ffffffffff'), ('CapEff', '000001ffffffffff'), ('CapBnd', '000001ffffffffff'), ('CapAmb', '0000000000000000'),
+		('NoNewPrivs', 0), ('Seccomp', 0), ('Seccomp_filters', 0), ('Speculation_Store_Bypass', 'thread vulnerable'),
+		('Cpus_allowed', 'ff'), ('Cpus_allowed_list', '0-7'), ('Mems_allowed', '00000000,00000001'), ('Mems_allowed_list', 0),
+		('voluntary_ctxt_switches', rand.randint(0, 1 << 20)), ('nonvoluntary_ctxt_switches', rand.randint(0, 1 << 12))
+	]
+	return ''.join(['%s:\t%s\n' % (_k, _v) for _k, _v in _x])
+
+def _smaps(rand):
+	"""
+	Desc : Content of /proc/<pid>/smaps_rollup
+	Args : rand (random.Random)
+	Ret  : String
+	"""
+	_rss = rand.randint(1024, 1 << 20)
+	_x = [('Rss', _rss), ('Pss', _rss * 9 // 10), ('Pss_Anon', _rss * 2 // 3), ('Pss_File', _rss // 5), ('Pss_Shmem', 0),
+		('Shared_Clean', _rss // 10), ('Shared_Dirty', 0), ('Private_Clean', _rss // 5), ('Private_Dirty', _rss * 2 // 3),
+		('Referenced', _rss), ('Anonymous', _rss * 2 // 3), ('LazyFree', 0), ('AnonHugePages', 0), ('ShmemPmdMapped', 0),
+		('FilePmdMapped', 0), ('Shared_Hugetlb', 0), ('Private_Hugetlb', 0), ('Swap', 0), ('SwapPss', 0), ('Locked', 0)]
+	return '00400000-7ffc0000 ---p 00000000 00:00 0                          [rollup]\n' + ''.join(['%-15s %8d kB\n' % (_k + ':', _v) for _k, _v in _x])
+
+def _process(proc, pid, ppid, name, threads, uid, sockets, files, cgroup, rand):
+	"""
+	Desc : Write /proc/<pid>
+	Args : proc (root of the tree), pid, ppid, name, threads, uid, sockets (list of inodes held), files (number of regular files opened), cgroup, rand
+	Ret  : None
+	"""
+	_path = os.path.join(proc, str(pid))
+	_kernel = ppid in (0, 2) and pid != 1
+	_state = rand.choice('SSSSSSSRD') if not _kernel else 'I'
+	_starttime = rand.randint(1, 1 << 24)
+	_fds = 0 if _kernel else 3 + files + len(sockets)
+	_statdata = _stat(pid, name, _state, ppid, threads, _starttime, rand)
+
+	_mkdir(os.path.join(_path, 'fd'))
+	_write(os.path.join(_path, 'stat'), _statdata)
+	_write(os.path.join(_path, 'status'), _status(pid, name, _state, ppid, threads, uid, _fds, rand))
+	_write(os.path.join(_path, 'statm'), '0 0 0 0 0 0 0\n' if _kernel else '%d %d %d %d 0 %d 0\n' % (rand.randint(1 << 12, 1 << 20), rand.randint(100, 1 << 16), rand.randint(100, 1 << 12), rand.randint(10, 1000), rand.randint(100, 1 << 16)))
+	_write(os.path.join(_path, 'io'), 'rchar: %d\nwchar: %d\nsyscr: %d\nsyscw: %d\nread_bytes: %d\nwrite_bytes: %d\ncancelled_write_bytes: 0\n' % tuple([rand.randint(0, 1 << 32) for _i in range(6)]))
+	_write(os.path.join(_path, 'comm'), name + '\n')
+	_write(os.path.join(_path, 'cmdline'), '' if _kernel else '\0'.join(['/usr/bin/%s' % name, '--config', '/etc/%s.conf' % name]) + '\0')
+	_write(os.path.join(_path, 'environ'), '' if _kernel else 'PATH=/usr/bin:/bin\0LANG=C.UTF-8\0HOME=/\0')
+	_write(os.path.join(_path, 'cgroup'), '0::%s\n' % cgroup)
+	_write(os.path.join(_path, 'wchan'), rand.choice(['0', 'do_epoll_wait', 'do_select', 'futex_wait_queue', 'pipe_read']) if _state != 'R' else '0')
+	_write(os.path.join(_path, 'schedstat'), '%d %d %d\n' % (rand.randint(0, 1 << 40), rand.randint(0, 1 << 36), rand.randint(0, 1 << 20)))
+	_write(os.path.join(_path, 'smaps_rollup'), '' if _kernel else _smaps(rand))
+
+	if not _kernel:
+		_symlink('/usr/bin/%s' % name, os.path.join(_path, 'exe'))
+		_symlink('/', os.path.join(_path, 'cwd'))
+		_symlink('/', os.path.join(_path, 'root'))
+		for _fd in range(3):
+			_symlink('/dev/null', os.path.join(_path, 'fd', str(_fd)))
+		for _i in range(files):
+			_symlink('/var/lib/%s/data.%d' % (name, _i), os.path.join(_path, 'fd', str(3 + _i)))
+		for _i, _inode in enumerate(sockets):
+			_symlink('socket:[%d]' % _inode, os.path.join(_path, 'fd', str(3 + files + _i)))
+
+	for _i in range(threads):
+		_tid = pid if _i == 0 else pid * 100 + _i
+		_task = os.path.join(_path, 'task', str(_tid))
+		_mkdir(_task)
+		_write(os.path.join(_task, 'stat'), _statdata.replace('%d (' % pid, '%d (' % _tid, 1))
+		_write(os.path.join(_task, 'status'), _status(_tid, name, _state, ppid, threads, uid, _fds, rand))
+		_write(os.path.join(_task, 'schedstat'), '%d %d %d\n' % (rand.randint(0, 1 << 40), rand.randint(0, 1 << 36), rand.randint(0, 1 << 20)))
+
+def _net(proc, inodes, interfaces, routes, rand):
+	"""
+	Desc : Write /proc/net
+	Args : proc (root of the tree), inodes (list of socket inodes), interfaces (list of names), routes (number), rand
+	Ret  : None
+	"""
+	_path = os.path.join(proc, 'net')
+	_mkdir(_path)
+	_header = '  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n'
+	_header6 = '  sl  local_address                         remote_address                        st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n'
+	_files = {'tcp': [_header], 'tcp6': [_header6], 'udp': [_header], 'udp6': [_header6], 'udplite': [_header], 'udplite6': [_header6]}
+
+	for _inode in inodes:
+		_kind = rand.random()
+		_file = 'tcp' if _kind < 0.7 else 'tcp6' if _kind < 0.9 else 'udp'
+		_n = len(_files[_file]) - 1
+		if _file == 'tcp6':
+			_local = _hex6('2001:db8::%x' % rand.randint(1, 0xffff))
+			_remote = _hex6('2001:db8:1::%x' % rand.randint(1, 0xffff))
+		else:
+			_local = _hex4('10.%d.%d.%d' % (rand.randint(0, 255), rand.randint(0, 255), rand.randint(1, 254)))
+			_remote = _hex4('192.168.%d.%d' % (rand.randint(0, 255), rand.randint(1, 254)))
+		_state = '07' if _file == 'udp' else rand.choice(_tcpstates)
+		_files[_file].append('%4d: %s:%04X %s:%04X %s 00000000:00000000 00:00000000 00000000 %5d        0 %d 1 0000000000000000 100 0 0 10 0\n' % (_n, _local, rand.randint(1024, 65535), _remote, rand.randint(1, 65535), _state, rand.choice([0, 33, 1000]), _inode))
+
+	for _file, _lines in _files.items():
+		_write(os.path.join(_path, _file), ''.join(_lines))
+
+	_x = ['Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n', '%s\t00000000\t0100000A\t0003\t0\t0\t0\t00000000\t0\t0\t0\n' % interfaces[0]]
+	_y = ['00000000000000000000000000000000 00 00000000000000000000000000000000 00 20010db8000000000000000000000001 00000400 00000001 00000000 00000003 %8s\n' % interfaces[0]]
+	for _i in range(routes):
+		_iface = interfaces[_i % len(interfaces)]
+		_x.append('%s\t%s\t00000000\t0001\t0\t0\t0\t00FFFFFF\t0\t0\t0\n' % (_iface, _hex4('10.%d.%d.0' % (_i // 256 % 256, _i % 256))))
+		_y.append('%s 40 00000000000000000000000000000000 00 00000000000000000000000000000000 00000100 00000001 00000000 00000001 %8s\n' % (_hex6('2001:db8:%x::' % _i), _iface))
+	_write(os.path.join(_path, 'route'), ''.join(_x))
+	_write(os.path.join(_path, 'ipv6_route'), ''.join(_y))
+
+	_write(os.path.join(_path, 'arp'), 'IP address       HW type     Flags       HW address            Mask     Device\n' + ''.join(['10.0.0.%-8d 0x1         0x2         02:00:00:00:%02x:%02x     *        %s\n' % (_i + 1, _i // 256, _i % 256, interfaces[_i % len(interfaces)]) for _i in range(min(routes, 250))]))
+	_write(os.path.join(_path, 'if_inet6'), ''.join(['%s %02x 40 00 80 %8s\n' % (_hex6('2001:db8::%x' % (_i + 1)), _i + 1, _iface) for _i, _iface in enumerate(interfaces)]))
+	_write(os.path.join(_path, 'dev'), 'Inter-|   Receive                                                |  Transmit\n face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n' + ''.join(['%6s: %d %d 0 0 0 0 0 0 %d %d 0 0 0 0 0 0\n' % (_iface, rand.randint(0, 1 << 40), rand.randint(0, 1 << 30), rand.randint(0, 1 << 40), rand.randint(0, 1 << 30)) for _iface in interfaces]))
+
+def _disks(proc, sys, disks, virtual, rand):
+	"""
+	Desc : Write /sys/block, /sys/devices/virtual/block, /proc/diskstats and /proc/mounts
+	Args : proc, sys (roots of the trees), disks (number of scsi disks), virtual (number of device-mapper disks), rand
+	Ret  : None
+	"""
+	_block = os.path.join(sys, 'block')
+	_mkdir(_block)
+	_mkdir(os.path.join(sys, 'devices', 'virtual', 'block'))
+	_diskstats = []
+	_mounts = ['proc /proc proc rw,nosuid,nodev,noexec,relatime 0 0\n', 'sysfs /sys sysfs rw,nosuid,nodev,noexec,relatime 0 0\n']
+
+	#sd majors are 8 then 65 to 71 then 128 to 135, 16 disks by major
+	_names = [('sd%s' % _letters(_i), 8 if _i < 16 else 64 + _i // 16 if _i < 128 else 120 + _i // 16, _i % 16 * 16, False) for _i in range(disks)]
+	_names += [('dm-%d' % _i, 253, _i, True) for _i in range(virtual)]
+
+	for _index, (_name, _major, _minor, _virtual) in enumerate(_names):
+		if _virtual:
+			_path = os.path.join(sys, 'devices', 'virtual', 'block', _name)
+			_mkdir(os.path.join(_path, 'dm'))
+			_write(os.path.join(_path, 'dm', 'name'), 'vg0-lv%s\n' % _name[3:])
+			_symlink(os.path.join('..', 'devices', 'virtual', 'block', _name), os.path.join(_block, _name))
+		else:
+			_path = os.path.join(_block, _name)
+			_device = os.path.join(sys, 'devices', 'pci0000:00', '0000:00:10.0', 'host0', 'target0:0:%d' % _index, '0:0:%d:0' % _index)
+			_mkdir(_device)
+			for _file, _value in (('model', 'Virtual disk    '), ('vendor', 'VMware  '), ('rev', '2.0 '), ('state', 'running'), ('queue_depth', 32),
+					('queue_type', 'simple'), ('timeout', 180), ('device_blocked', 0), ('scsi_level', 7), ('type', 0), ('iocounterbits', 32),
+					('iorequest_cnt', '0x%x' % rand.randint(0, 1 << 24)), ('evt_media_change', 0), ('modalias', 'scsi:t-0x00'), ('dh_state', 'detached')):
+				_write(os.path.join(_device, _file), '%s\n' % _value)
+			_mkdir(_path)
+			_symlink(_device, os.path.join(_path, 'device'))
+
+		_sectors = rand.randint(1 << 21, 1 << 32)
+		_stat = [rand.randint(0, 1 << 24) for _i in range(8)] + [rand.randint(0, 4)] + [rand.randint(0, 1 << 24) for _i in range(2)]
+		for _file, _value in (('size', _sectors), ('removable', 0), ('ro', 0), ('dev', '%d:%d' % (_major, _minor)), ('capability', 50),
+				('alignment_offset', 0), ('discard_alignment', 0), ('ext_range', 16), ('inflight', '%8d %8d' % (0, _stat[8])),
+				('stat', ' '.join(['%8d' % _x for _x in _stat])), ('uevent', 'MAJOR=%d\nMINOR=%d\nDEVNAME=%s\nDEVTYPE=disk' % (_major, _minor, _name))):
+			_write(os.path.join(_path, _file), '%s\n' % _value)
+
+		_queue = os.path.join(_path, 'queue')
+		_mkdir(_queue)
+		for _file, _value in (('rotational', 0 if _virtual else 1), ('hw_sector_size', 512), ('logical_block_size', 512), ('physical_block_size', 4096),
+				('minimum_io_size', 4096), ('optimal_io_size', 0), ('nr_requests', 256), ('read_ahead_kb', 128), ('max_sectors_kb', 1280),
+				('max_hw_sectors_kb', 32767), ('max_segments', 128), ('max_segment_size', 65536), ('max_integrity_segments', 0),
+				('add_random', 0), ('iostats', 1), ('nomerges', 0), ('rq_affinity', 1), ('discard_granularity', 0),
+				('discard_max_bytes', 0), ('discard_zeroes_data', 0), ('scheduler', '[mq-deadline] kyber bfq none')):
+			_write(os.path.join(_queue, _file), '%s\n' % _value)
+
+		_diskstats.append('%4d %7d %s %s\n' % (_major, _minor, _name, ' '.join([str(_x) for _x in _stat])))
+		if not _virtual:
+			_mounts.append('/dev/%s1 /srv/%s ext4 rw,relatime 0 0\n' % (_name, _name))
+
+	_write(os.path.join(proc, 'diskstats'), ''.join(_diskstats))
+	_write(os.path.join(proc, 'mounts'), ''.join(_mounts))
+
+def _interfaces(sys, interfaces, cpus, rand):
+	"""
+	Desc : Write /sys/class/net and /sys/devices/virtual/net
+	Args : sys (root of the tree), interfaces (list of names, lo is virtual), cpus (number), rand
+	Ret  : None
+	"""
+	_class = os.path.join(sys, 'class', 'net')
+	_mkdir(_class)
+	_mkdir(os.path.join(sys, 'devices', 'virtual', 'net'))
+
+	for _i, _name in enumerate(interfaces):
+		if _name == 'lo':
+			_path = os.path.join(sys, 'devices', 'virtual', 'net', _name)
+		else:
+			_pci = os.path.join(sys, 'devices', 'pci0000:00', '0000:00:%02x.0' % (_i + 3))
+			_path = os.path.join(_pci, 'net', _name)
+			_mkdir(_pci)
+			_half = max(cpus // 2, 1)
+			_local = range(0, _half) if _i % 2 == 0 or cpus == 1 else range(_half, cpus)
+			for _file, _value in (('vendor', '0x8086'), ('device', '0x10fb'), ('subsystem_vendor', '0x8086'), ('subsystem_device', '0x0003'),
+					('class', '0x020000'), ('modalias', 'pci:v00008086d000010FBsv00008086sd00000003bc02sc00i00'), ('enable', 1), ('irq', 24 + _i),
+					('local_cpulist', '%d-%d' % (_local[0], _local[-1])), ('local_cpus', '%x' % sum([1 << _c for _c in _local]))):
+				_write(os.path.join(_pci, _file), '%s\n' % _value)
+		_mkdir(os.path.join(_path, 'statistics'))
+		if _name != 'lo':
+			_symlink(os.path.dirname(os.path.dirname(_path)), os.path.join(_path, 'device'))
+		for _file, _value in (('address', '00:00:00:00:00:00' if _name == 'lo' else '02:00:00:%02x:%02x:%02x' % (_i, rand.randint(0, 255), rand.randint(0, 255))),
+				('mtu', 65536 if _name == 'lo' else 1500), ('operstate', 'unknown' if _name == 'lo' else 'up'), ('ifindex', _i + 1), ('iflink', _i + 1),
+				('type', 772 if _name == 'lo' else 1), ('tx_queue_len', 1000), ('speed', 10000), ('duplex', 'full'), ('carrier', 1),
+				('dormant', 0), ('dev_id', '0x0'), ('addr_assign_type', 0), ('link_mode', 0), ('netdev_group', 0), ('ifalias', ''), ('flags', '0x1003')):
+			_write(os.path.join(_path, _file), '%s\n' % _value)
+		for _file in ('rx_bytes', 'rx_packets', 'rx_errors', 'rx_dropped', 'tx_bytes', 'tx_packets', 'tx_errors', 'tx_dropped'):
+			_write(os.path.join(_path, 'statistics', _file), '%d\n' % rand.randint(0, 1 << 40))
+		_symlink(_path, os.path.join(_class, _name))
+
+def _cpus(proc, sys, cpus, nodes, rand):
+	"""
+	Desc : Write /sys/devices/system/{cpu,node}, /proc/stat and /proc/pressure (2 threads by core)
+	Args : proc, sys (roots of the trees), cpus, nodes (numbers), rand
+	Ret  : None
+	"""
+	_cpu = os.path.join(sys, 'devices', 'system', 'cpu')
+	_node = os.path.join(sys, 'devices', 'system', 'node')
+	_cores = max(cpus // 2, 1)
+	_pernode = max(_cores // nodes, 1)
+
+	_mkdir(_cpu)
+	_write(os.path.join(_cpu, 'online'), '0-%d\n' % (cpus - 1))
+	_write(os.path.join(_cpu, 'possible'), '0-%d\n' % (cpus - 1))
+	_nodecpus = dict([(_n, []) for _n in range(nodes)])
+
+	for _id in range(cpus):
+		_core = _id % _cores
+		_siblings = sorted(set([_core, _core + _cores]) & set(range(cpus)))
+		_n = min(_core // _pernode, nodes - 1)
+		_nodecpus[_n].append(_id)
+		_topology = os.path.join(_cpu, 'cpu%d' % _id, 'topology')
+		_mkdir(_topology)
+		for _file, _value in (('core_id', _core), ('physical_package_id', _n), ('die_id', 0), ('thread_siblings_list', ','.join([str(_x) for _x in _siblings]))):
+			_write(os.path.join(_topology, _file), '%s\n' % _value)
+		for _i, (_level, _type, _size, _shared) in enumerate(((1, 'Data', '48K', _siblings), (1, 'Instruction', '32K', _siblings), (2, 'Unified', '2048K', _siblings), (3, 'Unified', '32768K', None))):
+			_index = os.path.join(_cpu, 'cpu%d' % _id, 'cache', 'index%d' % _i)
+			_mkdir(_index)
+			for _file, _value in (('level', _level), ('type', _type), ('size', _size), ('coherency_line_size', 64), ('shared_cpu_list', ','.join([str(_x) for _x in _shared]) if _shared else 'NODE%d' % _n)):
+				_write(os.path.join(_index, _file), '%s\n' % _value)
+
+	for _n, _ids in _nodecpus.items():
+		_path = os.path.join(_node, 'node%d' % _n)
+		_mkdir(_path)
+		for _index in [os.path.join(_cpu, 'cpu%d' % _x, 'cache', 'index3', 'shared_cpu_list') for _x in _ids]:
+			_write(_index, '%s\n' % ','.join([str(_x) for _x in _ids]))
+		_write(os.path.join(_path, 'cpulist'), '%s\n' % ','.join([str(_x) for _x in _ids]))
+		_write(os.path.join(_path, 'distance'), '%s\n' % ' '.join(['10' if _m == _n else '21' for _m in range(nodes)]))
+
+	_x = ['cpu  %s\n' % ' '.join([str(rand.randint(0, 1 << 30)) for _i in range(10)])]
+	_x += ['cpu%d %s\n' % (_id, ' '.join([str(rand.randint(0, 1 << 26)) for _i in range(10)])) for _id in range(cpus)]
+	_x += ['intr 0\n', 'ctxt %d\n' % rand.randint(0, 1 << 40), 'btime 1700000000\n', 'processes %d\n' % rand.randint(0, 1 << 24), 'procs_running 1\n', 'procs_blocked 0\n']
+	_write(os.path.join(proc, 'stat'), ''.join(_x))
+
+	_mkdir(os.path.join(proc, 'pressure'))
+	for _resource in ('cpu', 'memory', 'io'):
+		_write(os.path.join(proc, 'pressure', _resource), 'some avg10=%.2f avg60=%.2f avg300=%.2f total=%d\nfull avg10=0.00 avg60=0.00 avg300=0.00 total=0\n' % (rand.random() * 5, rand.random() * 5, rand.random() * 5, rand.randint(0, 1 << 32)))
+
+def _cgroups(sys, groups, rand):
+	"""
+	Desc : Write a cgroup v2 hierarchy in /sys/fs/cgroup (system.slice/<service>)
+	Args : sys (root of the tree), groups (list of cgroup paths), rand
+	Ret  : None
+	"""
+	for _cgroup in ['/', '/system.slice'] + groups:
+		_path = os.path.join(sys, 'fs', 'cgroup', _cgroup.lstrip('/'))
+		_mkdir(_path)
+		_usage = rand.randint(0, 1 << 40)
+		_write(os.path.join(_path, 'cpu.stat'), 'usage_usec %d\nuser_usec %d\nsystem_usec %d\nnr_periods 0\nnr_throttled 0\nthrottled_usec 0\n' % (_usage, _usage * 2 // 3, _usage // 3))
+		_write(os.path.join(_path, 'cgroup.procs'), '')
+		for _resource in ('cpu', 'memory', 'io'):
+			_write(os.path.join(_path, '%s.pressure' % _resource), 'some avg10=0.00 avg60=0.00 avg300=0.00 total=%d\nfull avg10=0.00 avg60=0.00 avg300=0.00 total=0\n' % rand.randint(0, 1 << 30))
+		if _cgroup != '/':
+			_memory = rand.randint(1 << 20, 1 << 34)
+			_write(os.path.join(_path, 'memory.current'), '%d\n' % _memory)
+			_write(os.path.join(_path, 'memory.stat'), 'anon %d\nfile %d\nkernel %d\nsock 0\nshmem 0\n' % (_memory * 2 // 3, _memory // 4, _memory // 12))
+			_write(os.path.join(_path, 'io.stat'), '8:0 rbytes=%d wbytes=%d rios=%d wios=%d dbytes=0 dios=0\n' % tuple([rand.randint(0, 1 << 36) for _i in range(4)]))
+
+def generate(root, processes = 1000, threads = 2, files = 4, sockets = 1000, routes = 16, disks = 8, virtual = 2, interfaces = 4, cpus = 8, nodes = 1, services = 16, seed = 0):
+	"""
+	Desc : Write a fake host in root/proc and root/sys
+	Args :	* root (string) : directory of the trees (created if needed, the files already there are overwritten)
+		* processes (int) : number of processes (1000 by default), the first ones are init and kernel threads
+		* threads (int) : threads of each user process (2 by default)
+		* files (int) : regular files opened by each user process besides 0, 1, 2 and the sockets (4 by default)
+		* sockets (int) : sockets in /proc/net/{tcp,tcp6,udp}, held by fds of the user processes (1000 by default)
+		* routes (int) : routes in /proc/net/route and ipv6_route (16 by default)
+		* disks (int) : scsi disks (8 by default)
+		* virtual (int) : device-mapper disks (2 by default)
+		* interfaces (int) : network interfaces, lo included (4 by default)
+		* cpus (int) : logical cpus, 2 threads by core (8 by default)
+		* nodes (int) : NUMA nodes (1 by default)
+		* services (int) : cgroups in system.slice (16 by default)
+		* seed (int) : seed of the random values, the same seed gives the same tree (0 by default)
+	Ret  : Dict {proc, sys} (paths of the trees)
+	"""
+	_rand = random.Random(seed)
+	_proc = os.path.join(root, 'proc')
+	_sys = os.path.join(root, 'sys')
+	_mkdir(_proc)
+	_mkdir(_sys)
+
+	_kernel = max(min(processes // 10, 200), 1) if processes > 1 else 0
+	_users = max(processes - 1 - _kernel, 0)
+	_groups = ['/system.slice/%s%d.service' % (_names[5 + _i % (len(_names) - 5)], _i) for _i in range(services)]
+
+	#Sockets are spread over the user processes (or over init if there is none)
+	_inodes = list(range(100000, 100000 + sockets))
+	_holders = max(_users, 1)
+	_held = [_inodes[_i::_holders] for _i in range(_holders)]
+
+	_process(_proc, 1, 0, 'systemd', 1, 0, _held[0] if _users == 0 else [], files, '/init.scope', _rand)
+	if _kernel:
+		_process(_proc, 2, 0, 'kthreadd', 1, 0, [], 0, '/', _rand)
+		for _i in range(_kernel - 1):
+			_process(_proc, 3 + _i, 2, _names[1 + _i % 4], 1, 0, [], 0, '/', _rand)
+
+	_pid = 3 + max(_kernel - 1, 0)
+	_parents = [1]
+	for _i in range(_users):
+		_name = _names[5 + _i % (len(_names) - 5)]
+		_ppid = _rand.choice(_parents) if _parents else 1
+		_process(_proc, _pid, _ppid, _name, threads, _rand.choice([0, 0, 33, 1000]), _held[_i], files, _groups[_i % len(_groups)] if _groups else '/', _rand)
+		if len(_parents) < 64:
+			_parents.append(_pid)
+		_pid += 1
+
+	_ifaces = ['lo'] + ['eth%d' % _i for _i in range(max(interfaces - 1, 0))]
+	_net(_proc, _inodes, _ifaces[1:] or _ifaces, routes, _rand)
+	_disks(_proc, _sys, disks, virtual, _rand)
+	_interfaces(_sys, _ifaces, cpus, _rand)
+	_cpus(_proc, _sys, cpus, nodes, _rand)
+	_cgroups(_sys, _groups, _rand)
+	_write(os.path.join(_proc, 'uptime'), '%d.00 %d.00\n' % (_rand.randint(1000, 1 << 24), _rand.randint(1000, 1 << 26)))
+	_write(os.path.join(_proc, 'loadavg'), '0.50 0.40 0.30 1/%d %d\n' % (processes, _pid))
+
+	return {'proc': _proc, 'sys': _sys}
+
+if __name__ == '__main__':
+	import argparse
+
+	_parser = argparse.ArgumentParser(description = 'Write fake /proc and /sys trees')
+	_parser.add_argument('root', help = 'directory of the trees')
+	for _arg, _default in (('processes', 1000), ('threads', 2), ('files', 4), ('sockets', 1000), ('routes', 16), ('disks', 8), ('virtual', 2), ('interfaces', 4), ('cpus', 8), ('nodes', 1), ('services', 16), ('seed', 0)):
+		_parser.add_argument('--%s' % _arg, type = int, default = _default)
+	_args = vars(_parser.parse_args())
+	print(generate(_args.pop('root'), **_args))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from linuxutil._common import *
+
+#Keys of smaps_rollup / smaps summed by usage() (values are in kB in the files)
+_smapskeys = {
+	'Rss': 'rss',
+	'Pss': 'pss',
+	'Pss_Anon': 'pss_anon',
+	'Pss_File': 'pss_file',
+	'Pss_Shmem': 'pss_shmem',
+	'Shared_Clean': 'shared_clean',
+	'Shared_Dirty': 'shared_dirty',
+	'Private_Clean': 'private_clean',
+	'Private_Dirty': 'private_dirty',
+	'Anonymous': 'anon',
+	'AnonHugePages': 'anonhuge',
+	'ShmemPmdMapped': 'shmemhuge',
+	'FilePmdMapped': 'filehuge',
+	'Shared_Hugetlb': 'shared_hugetlb',
+	'Private_Hugetlb': 'private_hugetlb',
+	'Swap': 'swap',
+	'SwapPss': 'swappss',
+	'Locked': 'locked'
+}
+
+#@wrapException
+def _parsesmaps(lines):
+	"""
+	Desc : Sum the kB lines of smaps or smaps_rollup. Only the lines ending by kB are split, the headers of the mappings and VmFlags are skipped
+	Args : lines (iterable of string)
+	Ret  : Dict of Int (bytes)
+	"""
+	_x = dict([(_v, 0) for _v in _smapskeys.values()])
+	for _line in lines:
+		if not _line.endswith('kB\n'):
+			continue
+		_k, _s, _v = _line.partition(':')
+		if _k in _smapskeys:
+			_x[_smapskeys[_k]] += int(_v[:-3]) * 1024
+	return _x
+
+#@wrapException
+def usage(pid):
+	"""
+	Desc : Memory accounting of a process read in /proc/<pid>/smaps_rollup (Linux >= 4.14), or in /proc/<pid>/smaps with a streaming parser
+	Args : pid (int)
+	Ret  : Dict of Int (bytes)
+		* rss : resident set size (shared pages are counted in each process)
+		* pss : proportional set size (shared pages are divided between the processes which share them)
+		* uss : unique set size (private_clean + private_dirty), the memory freed if the process exits
+		* swap, swappss : swapped memory, and its proportional share
+		* anon, pss_anon, pss_file, pss_shmem : anonymous memory and the proportional share of anonymous, file and shmem pages (pss_* are 0 before Linux 5.9 or with the smaps fallback)
+		* anonhuge, shmemhuge, filehuge : pages mapped with transparent huge pages
+		* hugetlb : hugetlbfs pages (shared + private)
+		* shared_clean, shared_dirty, private_clean, private_dirty, locked
+	"""
+	_path = os.path.join(ProcessPath, str(pid))
+
+	try:
+		with open(os.path.join(_path, 'smaps_rollup'), 'r') as _f:
+			_x = _parsesmaps(_f)
+	except IOError:
+		#Process has disappeared or permission denied, smaps_rollup exists since Linux 4.14
+		if os.path.exists(os.path.join(_path, 'smaps_rollup')):
+			raise
+		with open(os.path.join(_path, 'smaps'), 'r') as _f:
+			_x = _parsesmaps(_f)
+
+	_x['uss'] = _x['private_clean'] + _x['private_dirty']
+	_x['hugetlb'] = _x['shared_hugetlb'] + _x['private_hugetlb']
+	return _x
+
+def _usage(pid):
+	"""
+	Desc : usage() of a process, None if the process has disappeared, is a kernel thread or is not readable
+	Args : pid (int)
+	Ret  : Tuple (pid, Dict) or None
+	"""
+	try:
+		_x = usage(pid)
+	except (IOError, OSError, ValueError):
+		return None
+	if _x['rss'] == 0:
+		return None
+	return (pid, _x)
+
+#@wrapException
+def ranking(key = 'pss', top = None, workers = 8, pids = None):
+	"""
+	Desc : System-wide ranking of the processes by memory usage. The files are read in parallel by a pool of threads (the kernel builds smaps while the GIL is released)
+	Args :	* key : key of usage() used to sort (pss by default)
+		* top (int) : number of processes to return (None for all)
+		* workers (int) : number of threads (8 by default)
+		* pids : List of Int (None for all the processes)
+	Ret  : List of Tuple (pid, Dict see usage()) sorted by key, the biggest first. Kernel threads and processes not readable are skipped
+	"""
+	import concurrent.futures
+
+	if pids == None:
+		pids = [int(_x) for _x in os.listdir(ProcessPath) if _x.isdigit()]
+
+	with concurrent.futures.ThreadPoolExecutor(max_workers = workers) as _pool:
+		_x = [_y for _y in _pool.map(_usage, pids) if _y != None]
+
+	_x.sort(key = lambda _y: _y[1][key], reverse = True)
+	if top != None:
+		return _x[:top]
+	return _x
+
+#@wrapException
+def total(pids = None, workers = 8):
+	"""
+	Desc : Sum of usage() of the processes, pss and uss can be summed without counting the shared pages many times
+	Args :	* pids : List of Int (None for all the processes)
+		* workers (int) : number of threads (8 by default)
+	Ret  : Dict of Int (bytes)
+	"""
+	_x = dict([(_v, 0) for _v in list(_smapskeys.values()) + ['uss', 'hugetlb']])
+	for _pid, _y in ranking(workers = workers, pids = pids):
+		for _k in _y:
+			_x[_k] += _y[_k]
+	return _x
@@ -5,6 +5,8 @@ import os, sys, socket, re, fcntl, struct, base64
 from linuxutil._common import *
 
 _procNet = os.path.join(ProcessPath,'net')
+_sysNet = os.path.join(SysPath, 'class', 'net')
+_sysVirtualNet = os.path.join(SysPath, 'devices', 'virtual', 'net')
 
 _tcp4 = [socket.AF_INET, socket.SOCK_STREAM, os.path.join(_procNet,'tcp')]
 _tcp6 = [socket.AF_INET6, socket.SOCK_STREAM, os.path.join(_procNet,'tcp6')]
@@ -13,6 +15,20 @@ _udp6 = [socket.AF_INET6, socket.SOCK_DGRAM, os.path.join(_procNet,'udp6')]
 _udplite4 = [socket.AF_INET, socket.SOCK_DGRAM, os.path.join(_procNet,'udplite')]
 _udplite6 = [socket.AF_INET6, socket.SOCK_DGRAM, os.path.join(_procNet,'udplite6')]
 
+def _setroot():
+	"""
+	Desc : Build again the paths from ProcessPath and SysPath (called by setroot)
+	Args : None
+	Ret  : None
+	"""
+	global _procNet, _sysNet, _sysVirtualNet
+
+	_procNet = os.path.join(ProcessPath, 'net')
+	_sysNet = os.path.join(SysPath, 'class', 'net')
+	_sysVirtualNet = os.path.join(SysPath, 'devices', 'virtual', 'net')
+	for _x, _file in ((_tcp4, 'tcp'), (_tcp6, 'tcp6'), (_udp4, 'udp'), (_udp6, 'udp6'), (_udplite4, 'udplite'), (_udplite6, 'udplite6')):
+		_x[2] = os.path.join(_procNet, _file)
+
 _familymap = {
 	socket.AF_INET: 'IPV4',
 	socket.AF_INET6: 'IPV6'
@@ -132,6 +148,47 @@ def resolvname(ip):
 	except:
 		return ip
 
+#@wrapException
+def socketmap():
+	"""
+	Desc : Index of the sockets opened by the processes, built in one walk of /proc/*/fd
+	Args : None
+	Ret  : Dict of Int (inode) -> Tuple (pid, fd, name of the process). If a socket is shared by many processes, the first one found is kept
+	"""
+	_y = {}
+
+	for _entry in os.scandir(ProcessPath):
+		if not _entry.name.isdigit():
+			continue
+
+		_fdpath = os.path.join(_entry.path, 'fd')
+		try:
+			_fds = os.listdir(_fdpath)
+		except OSError: #Process has disappeared or permission denied
+			continue
+
+		_name = None
+		for _fd in _fds:
+			try:
+				_x = os.readlink(os.path.join(_fdpath, _fd))
+			except OSError:
+				continue
+
+			if not _x.startswith('socket:['):
+				continue
+
+			_inode = int(_x[8:-1])
+			if _inode in _y:
+				continue
+
+			if _name == None:
+				try:
+					_name = open(os.path.join(_entry.path, 'comm'), 'r').read().rstrip('\n')
+				except (IOError, OSError):
+					_name = ''
+			_y[_inode] = (int(_entry.name), int(_fd), _name)
+	return _y
+
 #@wrapException
 def connections(net = 'inet', dns = False, inode = False, user = False, filterUser = None):
 	"""
@@ -164,6 +221,9 @@ def connections(net = 'inet', dns = False, inode = False, user = False, filterUs
 	if net not in _netmap:
 		return False
 	_y = []
+
+	if inode == True:
+		_sockets = socketmap()
 	
 	for _netpath in _netmap[net]:
 		if not os.path.exists(_netpath[2]):
@@ -189,14 +249,11 @@ def connections(net = 'inet', dns = False, inode = False, user = False, filterUs
 				_localIP = resolvname(_localIP)
 				_remoteIP = resolvname(_remoteIP)
 			
-			# Must be impoved (very bad performance)
 			if inode == True:
-				import linuxutil.pid as pid
-				try:
-					_x[9] = [pid.id(_z).name for _z in pid.ls() if int(_x[9]) in pid.id(_z).socket()][0]
-				except:
+				if int(_x[9]) in _sockets:
+					_x[9] = _sockets[int(_x[9])][2]
+				else:
 					_x[9] = 'kernel'
-					#pass
 				
 			#if len(_x) <= 12:
 			#	for _i in range(5):
@@ -277,11 +334,11 @@ def arp(dns = False):
 
 #@wrapException
 def ls():
-	return os.listdir('/sys/class/net')
+	return os.listdir(_sysNet)
 	
 #@wrapException
 def virtual():
-	return os.listdir('/sys/devices/virtual/net')
+	return os.listdir(_sysVirtualNet)
 	
 #@wrapException
 def physical():
@@ -291,8 +348,8 @@ class dev:
 	"""Represents an interface card"""
 
 	def __init__(self, inet):
-		self.name = inet
-		self.path = '/sys/class/net/%s/' % self.name
+		self._name = inet
+		self.path = os.path.join(_sysNet, self._name, '')
 		
 		if inet not in ls():
 			raise SystemError("%s is not a valid interface" % inet)
@@ -300,7 +357,7 @@ class dev:
 	@property
 	#@wrapException
 	def name(self):
-		return self.name
+		return self._name
 	
 	@property
 	#@wrapException
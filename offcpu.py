@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Off-CPU / wait-channel sampling profiler. The threads are polled at a fixed
+frequency and their state, wait channel, current syscall (and kernel stack if
+permitted) are aggregated in collapsed stacks, the input format of
+flamegraph.pl, and in time histograms by state.
+
+Exemple :
+	>>> import linuxutil.offcpu as offcpu
+	>>> s = offcpu.sampler(603, frequency = 50)
+	>>> s.run(10)
+	>>> s.histogram()
+	>>> open('out.folded', 'w').write('\\n'.join(s.collapsed()))"""
+
+import os, time
+from linuxutil._common import *
+import linuxutil.pid as pid
+
+#See man proc, /proc/<pid>/stat field state
+_statemap = {
+	'R': 'running',
+	'S': 'sleeping',
+	'D': 'disk sleep',
+	'T': 'stopped',
+	't': 'tracing stop',
+	'Z': 'zombie',
+	'X': 'dead',
+	'I': 'idle',
+	'P': 'parked',
+	'W': 'waking',
+	'K': 'wakekill'
+}
+
+#@wrapException
+def _read(path):
+	"""
+	Desc : Content of a file, None if it is not readable (permission denied, process has disappeared)
+	Args : path (string)
+	Ret  : String or None
+	"""
+	try:
+		return open(path, 'r').read()
+	except (IOError, OSError):
+		return None
+
+#@wrapException
+def _syscall(data):
+	"""
+	Desc : Current syscall from /proc/<pid>/task/<tid>/syscall
+	Args : data (string or None)
+	Ret  : String (syscall_<number>, running, user or None)
+	"""
+	if not data:
+		return None
+	_x = data.split()[0]
+	if _x == 'running':
+		return 'running'
+	if _x == '-1':
+		#Blocked but not in a syscall (page fault...)
+		return 'user'
+	return 'syscall_%s' % _x
+
+#@wrapException
+def _stack(data):
+	"""
+	Desc : Kernel stack from /proc/<pid>/task/<tid>/stack, root function first
+	Args : data (string or None)
+	Ret  : List of String
+	"""
+	if not data:
+		return []
+	_x = []
+	for _line in data.splitlines():
+		_y = _line.split()
+		if len(_y) >= 2:
+			_x.append(_y[1].split('+')[0])
+	_x.reverse()
+	return _x
+
+class sampler:
+	"""
+	Desc : Sampling profiler of the wait channels and states of threads
+	Type : Class
+	Ret  : Object
+		* samples : number of samples taken
+		* stacks : Dict of String (collapsed stack) -> Int (number of sampling periods of 1 / frequency seen, a late sample counts for all the periods since the previous one)
+		* states : Dict of Int (pid) -> Dict of String (state) -> Float (seconds)
+	"""
+
+	def __init__(self, pids = None, frequency = 10, stack = False, running = False):
+		"""
+		Desc : Prepare the profiler
+		Args :	* pids : Int or List of Int (None for all the processes of the host)
+			* frequency : number of samples by second (10 by default)
+			* stack (bool) : read the kernel stack of the threads, needs root (False by default)
+			* running (bool) : keep the running threads in the collapsed stacks (False by default, only off-cpu time)
+		Ret  : Objet
+		"""
+		if isinstance(pids, int):
+			pids = [pids]
+		self.pids = pids
+		self.frequency = float(frequency)
+		self.stack = stack
+		self.running = running
+		self.reset()
+
+	#@wrapException
+	def reset(self):
+		"""
+		Desc : Drop the aggregated samples
+		Args : None
+		Ret  : None
+		"""
+		self.samples = 0
+		self.stacks = {}
+		self.states = {}
+		self._last = None
+
+	#@wrapException
+	def sample(self):
+		"""
+		Desc : Take one sample of all the threads and aggregate it. The state of each thread is counted for the time elapsed since the previous sample (1 / frequency for the first one)
+		Args : None
+		Ret  : Int (number of threads sampled)
+		"""
+		_now = time.time()
+		#A sample which comes late (big host, loaded system) stands for all the time since the previous one
+		_step = _now - self._last if self._last != None else 1 / self.frequency
+		self._last = _now
+		#Weight of the sample in the collapsed stacks, in sampling periods (flamegraph.pl wants integers)
+		_periods = max(1, int(round(_step * self.frequency)))
+		_count = 0
+
+		for _pid in (self.pids if self.pids != None else pid.ls()):
+			_taskpath = os.path.join(ProcessPath, str(_pid), 'task')
+			try:
+				_tids = os.listdir(_taskpath)
+			except OSError:
+				continue
+
+			for _tid in _tids:
+				_path = os.path.join(_taskpath, _tid)
+				try:
+					_stat = pid._parsestat(open(os.path.join(_path, 'stat'), 'r').read())
+				except (IOError, OSError):
+					continue
+
+				_state = _stat[2]
+				_count += 1
+				_x = self.states.setdefault(_pid, {})
+				_x[_state] = _x.get(_state, 0) + _step
+
+				if _state == 'R' and self.running == False:
+					continue
+
+				_frames = [_stat[1], _statemap.get(_state, _state)]
+				_call = _syscall(_read(os.path.join(_path, 'syscall')))
+				if _call != None and _state != 'R':
+					_frames.append(_call)
+
+				_kstack = _stack(_read(os.path.join(_path, 'stack'))) if self.stack == True else []
+				if _kstack:
+					_frames += _kstack
+				else:
+					_wchan = _read(os.path.join(_path, 'wchan'))
+					if _wchan and _wchan.strip() != '0':
+						_frames.append(_wchan.strip())
+
+				_key = ';'.join([_y.replace(';', '_').replace(' ', '_') for _y in _frames])
+				self.stacks[_key] = self.stacks.get(_key, 0) + _periods
+
+		self.samples += 1
+		return _count
+
+	#@wrapException
+	def run(self, duration):
+		"""
+		Desc : Take samples at the frequency of the profiler during a time
+		Args : duration : time in seconds
+		Ret  : Int (number of samples taken)
+		"""
+		_step = 1 / self.frequency
+		_next = time.time()
+		_end = _next + duration
+		_n = 0
+		#The time between two runs is not sampled
+		self._last = None
+
+		while _next < _end:
+			self.sample()
+			_n += 1
+			_next += _step
+			_wait = _next - time.time()
+			if _wait > 0:
+				time.sleep(_wait)
+			else:
+				#The host is too big for this frequency, samples are skipped
+				_next = time.time()
+		return _n
+
+	#@wrapException
+	def collapsed(self):
+		"""
+		Desc : Aggregated samples in the collapsed stack format (name;state;syscall;wait channel or kernel stack count), see flamegraph.pl
+		Args : None
+		Ret  : List of String, the most frequent first
+		"""
+		return ['%s %d' % (_k, _v) for _k, _v in sorted(self.stacks.items(), key = lambda _x: _x[1], reverse = True)]
+
+	#@wrapException
+	def histogram(self, pid = None):
+		"""
+		Desc : Time spent in each state (sum of the threads)
+		Args : pid (int) : process (None for the sum of all the processes)
+		Ret  : Dict of String (state) -> Float (seconds)
+		"""
+		if pid != None:
+			return dict([(_statemap.get(_k, _k), _v) for _k, _v in self.states.get(int(pid), {}).items()])
+
+		_x = {}
+		for _y in self.states.values():
+			for _k, _v in _y.items():
+				_x[_statemap.get(_k, _k)] = _x.get(_statemap.get(_k, _k), 0) + _v
+		return _x
@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import os, re, time
+import os, re, time, errno, collections
 from linuxutil._common import *
-import linuxutil._cpuAffinity
+import linuxutil._cpuAffinity, linuxutil._syscall, linuxutil.cgroup
 
 #@wrapException
 def ls(): 
@@ -23,23 +23,1704 @@ def renice(who, prio = 0, which = 0):
 		* prio (int) : Priority between -20 and 19 (0 by default)
 	Ret  : Bool
 	"""
-	import ctypes, ctypes.util
-
-	#who = ctypes.c_int(who).value
-	#prio = ctypes.c_int(prio).value
-	#which = ctypes.c_int(which).value
-	
-	int(who)
-	int(prio)
-	int(which)
-	
-	libc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('c'))
-	_ret = libc.setpriority(which, who, prio)
-	
-	if _ret == 0:
-		return True
+	return linuxutil._syscall.setpriority(which, who, prio)
+
+#@wrapException
+def _tasks(pid):
+	"""
+	Desc : Threads of a process
+	Args : pid (int)
+	Ret  : List of Int
+	"""
+	return [int(_x) for _x in os.listdir(os.path.join(ProcessPath, str(pid), 'task'))]
+
+#@wrapException
+def _many(func, pids, threads):
+	"""
+	Desc : Call func on each pid (or on each thread of each pid)
+	Args :	* func : function taking a pid and returning a Bool
+		* pids : List of Int
+		* threads (bool) : apply func to every thread of the processes
+	Ret  : Dict of Int -> Bool (True if func has succeeded for the process and all its threads)
+	"""
+	_x = {}
+	for _pid in pids:
+		_pid = int(_pid)
+		if threads == True:
+			try:
+				_x[_pid] = all([func(_tid) for _tid in _tasks(_pid)])
+			except OSError:
+				_x[_pid] = False
+		else:
+			_x[_pid] = func(_pid)
+	return _x
+
+#@wrapException
+def _placement(dev = None, node = None, cpus = None):
+	"""
+	Desc : Target cpus of a placement
+	Args :	* dev (string) : network device, the cpus local to its bus
+		* node (int) : NUMA node
+		* cpus : List of Int or cpu list string
+	Ret  : List of Int
+	"""
+	if dev != None:
+		from linuxutil import net
+		_x = net.dev(dev).localcpulist
+		if _x == None:
+			raise ValueError('%s is a virtual device without local cpus' % dev)
+		return linuxutil._cpuAffinity.parse_cpulist(_x)
+	if node != None:
+		return linuxutil._cpuAffinity.node_cpus(node)
+	if isinstance(cpus, str):
+		return linuxutil._cpuAffinity.parse_cpulist(cpus)
+	return list(cpus)
+
+#@wrapException
+def setcpu_many(pids, cpus = None, threads = True, dev = None, node = None):
+	"""
+	Desc : Set the authorized cpus of many processes
+	Args :	* pids : List of Int
+		* cpus : List of Int or cpu list string (ex 0-3,8-11)
+		* threads (bool) : apply to every thread of /proc/<pid>/task (True by default)
+		* dev (string) : use the cpus local to this network device instead of cpus
+		* node (int) : use the cpus of this NUMA node instead of cpus
+	Ret  : Dict of Int -> Bool
+
+	Exemple : pin a process to the cpus local to eth0
+		>>> pid.setcpu_many([603], dev = 'eth0')
+	"""
+	_cpus = _placement(dev, node, cpus)
+	return _many(lambda _tid: linuxutil._cpuAffinity.set_cpu_affinity(_cpus, _tid), pids, threads)
+
+#@wrapException
+def renice_many(pids, prio = 0, threads = False):
+	"""
+	Desc : Alter cpu priority of many processes, the libc is bound only once
+	Args :	* pids : List of Int
+		* prio (int) : Priority between -20 and 19 (0 by default)
+		* threads (bool) : alter every thread of the processes, needed for a multi-threaded process because the priority is per thread on Linux (False by default)
+	Ret  : Dict of Int -> Bool
+	"""
+	return _many(lambda _pid: linuxutil._syscall.setpriority(0, _pid, prio), pids, threads)
+
+#@wrapException
+def ionice_many(pids, ioclass = 0, iolevel = 0, threads = False):
+	"""
+	Desc : Alter io priority of many processes (see id.iorenice)
+	Args :	* pids : List of Int
+		* ioclass (int) : scheduling class -> 0: none, 1: realtime, 2: best-effort, 3: idle
+		* iolevel (int) : scheduling class data -> 0-7 for realtime and best-effort classes
+		* threads (bool) : alter every thread of the processes (False by default)
+	Ret  : Dict of Int -> Bool
+	"""
+	return _many(lambda _pid: linuxutil._syscall.ioprio_set(_pid, ioclass, iolevel), pids, threads)
+
+#@wrapException
+def _parsestat(data):
+	"""
+	Desc : Parse the content of /proc/<pid>/stat. The comm field may contain spaces and parenthesis so it is cut on the last ')'
+	Args : data (string)
+	Ret  : List (index are the same as man proc : 0 is pid, 1 is comm, 2 is state, 3 is ppid...), numbers are converted in Int
+	"""
+	_i = data.index('(')
+	_j = data.rindex(')')
+	_x = data[_j+2:].split()
+	return [int(data[:_i])] + [data[_i+1:_j], _x[0]] + [int(_y) for _y in _x[1:]]
+
+#@wrapException
+def _parsestatus(data):
+	"""
+	Desc : Parse the content of /proc/<pid>/status
+	Args : data (string)
+	Ret  : Dict containing List
+	"""
+	_x = {}
+	for _i in data.splitlines():
+		_k, _s, _v = _i.partition(':')
+		_x[_k] = _v.split()
+	return _x
+
+def _kb(value):
+	return int(value.split()[0]) * 1024
+
+def _ints(value):
+	return tuple([int(_x) for _x in value.split()])
+
+#Keys of /proc/<pid>/status -> (slot of statusinfo, converter). Sizes in kB are converted in bytes
+_statusinfokeys = {
+	'Name': ('name', str.strip),
+	'Umask': ('umask', lambda _v: int(_v, 8)),
+	'Tgid': ('tgid', int),
+	'Ngid': ('ngid', int),
+	'Pid': ('pid', int),
+	'PPid': ('ppid', int),
+	'TracerPid': ('tracerpid', int),
+	'Uid': ('uid', _ints),
+	'Gid': ('gid', _ints),
+	'FDSize': ('fdsize', int),
+	'Groups': ('groups', _ints),
+	'NStgid': ('nstgid', _ints),
+	'NSpid': ('nspid', _ints),
+	'NSpgid': ('nspgid', _ints),
+	'NSsid': ('nssid', _ints),
+	'VmPeak': ('vmpeak', _kb),
+	'VmSize': ('vmsize', _kb),
+	'VmLck': ('vmlck', _kb),
+	'VmPin': ('vmpin', _kb),
+	'VmHWM': ('vmhwm', _kb),
+	'VmRSS': ('vmrss', _kb),
+	'RssAnon': ('rssanon', _kb),
+	'RssFile': ('rssfile', _kb),
+	'RssShmem': ('rssshmem', _kb),
+	'VmData': ('vmdata', _kb),
+	'VmStk': ('vmstk', _kb),
+	'VmExe': ('vmexe', _kb),
+	'VmLib': ('vmlib', _kb),
+	'VmPTE': ('vmpte', _kb),
+	'VmSwap': ('vmswap', _kb),
+	'HugetlbPages': ('hugetlbpages', _kb),
+	'Threads': ('threads', int),
+	'Cpus_allowed_list': ('cpus_allowed_list', str.strip),
+	'Mems_allowed_list': ('mems_allowed_list', str.strip),
+	'voluntary_ctxt_switches': ('voluntary_ctxt_switches', int),
+	'nonvoluntary_ctxt_switches': ('nonvoluntary_ctxt_switches', int)
+}
+
+def _kbdict(value):
+	"""
+	Desc : Size in bytes of statusinfo to the format of the id.vm* properties
+	Args : value (int or None)
+	Ret  : Dict {value: size in kB, unit: kB} (None if value is None)
+	"""
+	if value == None:
+		return None
+	return {'value': value // 1024, 'unit': 'kB'}
+
+class statusinfo:
+	"""
+	Desc : Typed content of /proc/<pid>/status, the file is tokenized only once. Sizes are in bytes, uid/gid/groups/ns* are Tuple of Int. A field missing in the file (kernel thread, old kernel) is None
+	Type : Class
+	Ret  : Object
+		* name, state (one letter), statelong (one word), umask
+		* tgid, ngid, pid, ppid, tracerpid, fdsize, threads
+		* uid, gid (real, effective, saved, filesystem), groups, nstgid, nspid, nspgid, nssid
+		* vmpeak, vmsize, vmlck, vmpin, vmhwm, vmrss, rssanon, rssfile, rssshmem, vmdata, vmstk, vmexe, vmlib, vmpte, vmswap, hugetlbpages
+		* cpus_allowed_list, mems_allowed_list (String, ex : 0-3,8-11)
+		* voluntary_ctxt_switches, nonvoluntary_ctxt_switches
+	"""
+	__slots__ = ('state', 'statelong') + tuple([_x[0] for _x in _statusinfokeys.values()])
+
+	def __init__(self, data):
+		"""
+		Desc : Parse the content of /proc/<pid>/status
+		Args : data (string)
+		Ret  : Objet
+		"""
+		for _slot in self.__slots__:
+			setattr(self, _slot, None)
+
+		for _line in data.splitlines():
+			_k, _s, _v = _line.partition(':')
+			if _k in _statusinfokeys:
+				_slot, _func = _statusinfokeys[_k]
+				setattr(self, _slot, _func(_v))
+			elif _k == 'State':
+				_v = _v.strip()
+				self.state, self.statelong = _v[0], _v[1:].strip()[1:-1]
+
+	def __repr__(self):
+		return '<statusinfo pid=%s name=%s state=%s>' % (self.pid, self.name, self.state)
+
+#@wrapException
+def _parsestatm(data):
+	"""
+	Desc : Parse the content of /proc/<pid>/statm
+	Args : data (string)
+	Ret  : Dict of Int (in pages)
+	"""
+	_size, _resident, _shared, _text, _lib, _data, _dt = [int(_x) for _x in data.split()]
+	return {'size': _size, 'resident': _resident, 'shared': _shared, 'text': _text, 'lib': _lib, 'data': _data, 'dt': _dt}
+
+#@wrapException
+def _parseio(data):
+	"""
+	Desc : Parse the content of /proc/<pid>/io
+	Args : data (string)
+	Ret  : Dict of Int
+	"""
+	_x = {}
+	for _i in data.splitlines():
+		_k, _s, _v = _i.partition(':')
+		_x[_k] = int(_v)
+	return _x
+
+#@wrapException
+def _parsefdinfo(data):
+	"""
+	Desc : Parse the content of /proc/<pid>/fdinfo/<fd>. Values are converted in Int when possible (pos, flags are octal, mnt_id, ino...)
+	Args : data (string)
+	Ret  : Dict
+	"""
+	_x = {}
+	for _i in data.splitlines():
+		_k, _s, _v = _i.partition(':')
+		_v = _v.strip()
+		if _k == 'flags':
+			_x[_k] = int(_v, 8)
+			continue
+		try:
+			_x[_k] = int(_v)
+		except ValueError:
+			_x[_k] = _v
+	return _x
+
+class record:
+	"""
+	Desc : Consistent view of a process read by id.snapshot(). stat, status, statm and io are read only once each
+	Type : Class
+	Ret  : Object
+		* pid (int)
+		* time (float) : time.time() when the files were read
+		* stat (list) : see _parsestat
+		* status (dict) : see _parsestatus, built from the same read at the first access
+		* statusinfo (object) : see statusinfo
+		* statm (dict) : see _parsestatm
+		* io (dict) : see _parseio (None if not readable, /proc/<pid>/io needs the same user or root)
+	"""
+	__slots__ = ('pid', 'time', 'stat', '_status', '_statusdict', 'statusinfo', 'statm', 'io')
+
+	def __init__(self, pid, path = None):
+		"""
+		Desc : Read all the files of the process
+		Args :	* pid (int)
+			* path : directory of the process (/proc/<pid> by default)
+		Ret  : Objet
+		"""
+		self.pid = int(pid)
+		if path == None:
+			path = os.path.join(ProcessPath, str(self.pid))
+
+		self.time = time.time()
+		self.stat = _parsestat(open(os.path.join(path, 'stat'), 'r').read())
+		self._status = open(os.path.join(path, 'status'), 'r').read()
+		self._statusdict = None
+		self.statusinfo = statusinfo(self._status)
+		self.statm = _parsestatm(open(os.path.join(path, 'statm'), 'r').read())
+
+		try:
+			self.io = _parseio(open(os.path.join(path, 'io'), 'r').read())
+		except (IOError, OSError):
+			self.io = None
+
+	@property
+	#@wrapException
+	def status(self):
+		"""
+		Desc : status as a Dict of List (see _parsestatus), parsed only if it is used
+		Args : None
+		Ret  : Dict containing List
+		"""
+		if self._statusdict == None:
+			self._statusdict = _parsestatus(self._status)
+		return self._statusdict
+
+	def __repr__(self):
+		return '<record pid=%d time=%f>' % (self.pid, self.time)
+
+#Index of the fields in /proc/<pid>/stat (see man proc)
+_statfields = {
+	'comm': 1,
+	'statechar': 2,
+	'ppid': 3,
+	'pgrp': 4,
+	'session': 5,
+	'ttynr': 6,
+	'tpgid': 7,
+	'flags': 8,
+	'minflt': 9,
+	'cminflt': 10,
+	'majflt': 11,
+	'cmajflt': 12,
+	'utime': 13,
+	'stime': 14,
+	'cutime': 15,
+	'cstime': 16,
+	'priority': 17,
+	'nice': 18,
+	'numthreads': 19,
+	'itrealvalue': 20,
+	'starttime': 21,
+	'vsize': 22,
+	'rss': 23,
+	'rsslim': 24,
+	'startcode': 25,
+	'endcode': 26,
+	'startstack': 27,
+	'kstkesp': 28,
+	'kstkeip': 29,
+	'wchan': 34,
+	'exitsignal': 37,
+	'processor': 38,
+	'rt_priority': 39,
+	'policy': 40,
+	'delayacct_blkio_ticks': 41,
+	'guest_time': 42,
+	'cguest_time': 43
+}
+
+#Keys of /proc/<pid>/status
+_statusfields = {
+	'name': 'Name',
+	'tid': 'Tgid',
+	'tracerpid': 'TracerPid',
+	'uid': 'Uid',
+	'gid': 'Gid',
+	'fdsize': 'FDSize',
+	'vmpeak': 'VmPeak',
+	'vmsize': 'VmSize',
+	'vmlck': 'VmLck',
+	'vmhwm': 'VmHWM',
+	'vmrss': 'VmRSS',
+	'vmdata': 'VmData',
+	'vmlib': 'VmLib',
+	'vmpte': 'VmPTE',
+	'state': 'State'
+}
+
+#Keys of /proc/<pid>/io
+_iofields = ['rchar', 'wchar', 'syscr', 'syscw', 'read_bytes', 'write_bytes', 'cancelled_write_bytes']
+
+#Fields of scan() which are Int (allowed by scan.columns)
+_numericfields = set([_x for _x in _statfields if _x not in ('comm', 'statechar')] + [_x for _x in _statusfields if _x not in ('name', 'state', 'uid', 'gid')] + _iofields)
+
+#@wrapException
+def columns(fields = ['ppid', 'utime', 'stime', 'rss', 'vsize', 'majflt', 'numthreads', 'read_bytes', 'write_bytes'], numpy = False, path = None):
+	"""
+	Desc : Process table in columns (see scan.columns), for vectorized aggregations
+	Args :	* fields : List of numeric fields (ppid, utime, stime, rss, vsize, majflt, numthreads, read_bytes and write_bytes by default)
+		* numpy (bool) : return a NumPy structured array (False by default)
+		* path : proc directory (ProcessPath by default)
+	Ret  : Dict of String -> array.array('q') or numpy.ndarray
+
+	Exemple :
+		>>> c = pid.columns(numpy = True)
+		>>> c['rss'].sum()
+		>>> pandas.DataFrame(c)
+	"""
+	return scan(fields, path).columns(numpy)
+
+#@wrapException
+def _scanfield(field):
+	"""
+	Desc : Which file is needed by a field of scan() and how to extract the field from the parsed file
+	Args : field (string)
+	Ret  : Tuple (file, function)
+	"""
+	if field in _statfields:
+		_i = _statfields[field]
+		return ('stat', lambda _x: _x[_i])
+	if field in _statusfields:
+		_k = _statusfields[field]
+		if field == 'name':
+			#A name can contain spaces (ex : Web Content)
+			return ('status', lambda _x: ' '.join(_x[_k]))
+		if field == 'state':
+			return ('status', lambda _x: _x[_k][0])
+		if field in ('uid', 'gid'):
+			return ('status', lambda _x: [int(_y) for _y in _x[_k]])
+		if field.startswith('vm'):
+			#Sizes in bytes like statusinfo
+			return ('status', lambda _x: int(_x[_k][0]) * 1024 if _k in _x else None)
+		return ('status', lambda _x: int(_x[_k][0]) if _k in _x else None)
+	if field in _iofields:
+		return ('io', lambda _x: _x[field])
+	if field in ('stat', 'status', 'statm', 'io', 'cmdline', 'exe'):
+		return (field, lambda _x: _x)
+	raise ValueError("%s is not a valid field" % field)
+
+class scan:
+	"""
+	Desc : Walk /proc once and read only the files needed by the requested fields. Iterate over the object to get the records (pids which disappear during the walk are skipped)
+	Type : Class
+	Ret  : Object (iterable of namedtuple with pid + fields)
+		* fields : fields of the records
+		* count : number of records returned by the last walk
+		* skipped : number of pids which have disappeared during the last walk
+		* syscalls : number of syscalls done by the last walk (open, read, close, readlink and getdents)
+		* latency : duration of the last walk in seconds
+
+	Exemple :
+		>>> s = pid.scan(['ppid', 'utime', 'vmrss'])
+		>>> for r in s: print(r.pid, r.ppid, r.utime)
+		>>> s.syscalls, s.latency
+	"""
+
+	def __init__(self, fields = ['ppid', 'comm'], path = None):
+		"""
+		Desc : Prepare the walk, nothing is read before the iteration
+		Args :	* fields : list of fields, a name of a stat or status field (ppid, utime, rss, vmrss, uid...), of an io field (read_bytes...) or a whole file (stat, status, statm, io, cmdline, exe). The vm* status fields are in bytes (see statusinfo)
+			* path : proc directory (ProcessPath by default)
+		Ret  : Objet
+		"""
+		self.fields = list(fields)
+		self._path = path or ProcessPath
+		self._getters = [_scanfield(_x) for _x in self.fields]
+		self._files = set([_x[0] for _x in self._getters])
+		self._record = collections.namedtuple('scanrecord', ['pid'] + self.fields)
+		self.count, self.skipped, self.syscalls, self.latency = 0, 0, 0, 0.0
+
+	def _read(self, path):
+		"""
+		Desc : Read a whole file with the lowest number of syscalls
+		Args : path (string)
+		Ret  : String
+		"""
+		_fd = os.open(path, os.O_RDONLY)
+		self.syscalls += 2
+		try:
+			_data = []
+			while True:
+				_x = os.read(_fd, 65536)
+				self.syscalls += 1
+				if not _x:
+					break
+				_data.append(_x)
+				if len(_x) < 65536 and not path.endswith('cmdline'):
+					break
+		finally:
+			os.close(_fd)
+		return b''.join(_data).decode('utf-8', 'replace')
+
+	def _load(self, pid):
+		"""
+		Desc : Read and parse the needed files of one process
+		Args : pid (string)
+		Ret  : Dict (file -> parsed content)
+		"""
+		_path = os.path.join(self._path, pid)
+		_x = {}
+		for _file in self._files:
+			try:
+				if _file == 'exe':
+					self.syscalls += 1
+					_x[_file] = os.readlink(os.path.join(_path, 'exe'))
+				elif _file == 'stat':
+					_x[_file] = _parsestat(self._read(os.path.join(_path, 'stat')))
+				elif _file == 'status':
+					_x[_file] = _parsestatus(self._read(os.path.join(_path, 'status')))
+				elif _file == 'statm':
+					_x[_file] = _parsestatm(self._read(os.path.join(_path, 'statm')))
+				elif _file == 'io':
+					_x[_file] = _parseio(self._read(os.path.join(_path, 'io')))
+				elif _file == 'cmdline':
+					_x[_file] = self._read(os.path.join(_path, 'cmdline')).split('\x00')
+			except (IOError, OSError) as _e:
+				if _e.errno in (errno.ENOENT, errno.ESRCH):
+					#The process has disappeared or it is a kernel thread (no exe)
+					self.syscalls += 1
+					if not os.path.isdir(_path):
+						raise
+				#Permission denied (io, exe of an other user)
+				_x[_file] = None
+		return _x
+
+	def _walk(self):
+		"""
+		Desc : Walk /proc and extract the fields
+		Args : None
+		Ret  : Generator of List (pid + values of the fields, None if a file is not readable)
+		"""
+		self.count, self.skipped, self.syscalls = 0, 0, 2
+		_start = time.time()
+
+		try:
+			for _entry in os.scandir(self._path):
+				if not _entry.name.isdigit():
+					continue
+
+				try:
+					_x = self._load(_entry.name)
+				except (IOError, OSError):
+					self.skipped += 1
+					continue
+
+				_values = [int(_entry.name)]
+				for _file, _func in self._getters:
+					if _x[_file] == None:
+						_values.append(None)
+					else:
+						_values.append(_func(_x[_file]))
+
+				self.count += 1
+				yield _values
+		finally:
+			self.latency = time.time() - _start
+
+	def __iter__(self):
+		for _values in self._walk():
+			yield self._record(*_values)
+
+	#@wrapException
+	def columns(self, numpy = False):
+		"""
+		Desc : Walk /proc and store the fields in columns instead of records, no Python object is kept by process. Only numeric fields are allowed, values not readable (None) are stored as -1
+		Args : numpy (bool) : return a NumPy structured array instead of arrays (False by default, needs numpy)
+		Ret  : Dict of String (pid + fields) -> array.array('q'), or numpy.ndarray with one int64 column by field
+		"""
+		import array
+
+		for _field in self.fields:
+			if _field not in _numericfields:
+				raise ValueError("%s is not a numeric field" % _field)
+
+		if numpy == True:
+			import numpy as np
+
+		_names = ['pid'] + self.fields
+		_columns = [array.array('q') for _x in _names]
+		_appends = [_x.append for _x in _columns]
+
+		for _values in self._walk():
+			for _i, _v in enumerate(_values):
+				_appends[_i](-1 if _v == None else _v)
+
+		if numpy == False:
+			return dict(zip(_names, _columns))
+
+		_x = np.empty(self.count, dtype = [(_name, np.int64) for _name in _names])
+		for _name, _column in zip(_names, _columns):
+			_x[_name] = np.frombuffer(_column, dtype = np.int64)
+		return _x
+
+	def __repr__(self):
+		return '<scan fields=%s count=%d skipped=%d syscalls=%d latency=%f>' % (self.fields, self.count, self.skipped, self.syscalls, self.latency)
+
+class tree:
+	"""
+	Desc : Index of the process tree built in one walk of /proc/*/stat. The index is kept until refresh() is called
+	Type : Class
+	Ret  : Object
+		* ppid : Dict pid -> ppid
+		* cpid : Dict pid -> List of children pid
+		* time : time.time() of the last walk
+
+	Exemple :
+		>>> t = pid.tree()
+		>>> t.descendants(1)
+		>>> t.subtree_totals(603)
+	"""
+
+	def __init__(self, io = False, path = None):
+		"""
+		Desc : Build the index
+		Args :	* io (bool) : also read /proc/<pid>/io to sum the io bytes in subtree_totals (False by default)
+			* path : proc directory (ProcessPath by default)
+		Ret  : Objet
+		"""
+		_fields = ['ppid', 'utime', 'stime', 'rss']
+		if io == True:
+			_fields += ['read_bytes', 'write_bytes']
+		self._scan = scan(_fields, path)
+		self.refresh()
+
+	#@wrapException
+	def refresh(self):
+		"""
+		Desc : Walk /proc again and rebuild the index
+		Args : None
+		Ret  : None
+		"""
+		self.ppid, self.cpid, self._data = {}, {}, {}
+		self.time = time.time()
+
+		for _x in self._scan:
+			self.ppid[_x.pid] = _x.ppid
+			self.cpid.setdefault(_x.ppid, []).append(_x.pid)
+			self._data[_x.pid] = _x
+
+	def __contains__(self, pid):
+		return pid in self.ppid
+
+	def __len__(self):
+		return len(self.ppid)
+
+	#@wrapException
+	def children(self, pid):
+		"""
+		Desc : Children pid of a process
+		Args : pid (int)
+		Ret  : List of Int
+		"""
+		return list(self.cpid.get(pid, []))
+
+	#@wrapException
+	def descendants(self, pid):
+		"""
+		Desc : All the pid of the subtree of a process (without the process itself), in breadth-first order
+		Args : pid (int)
+		Ret  : List of Int
+		"""
+		_x = list(self.cpid.get(pid, []))
+		for _y in _x:
+			_x.extend(self.cpid.get(_y, []))
+		return _x
+
+	#@wrapException
+	def ancestors(self, pid):
+		"""
+		Desc : Parents pid of a process up to the root of the tree (same order as id.parents)
+		Args : pid (int)
+		Ret  : List of Int
+		"""
+		_x = []
+		while pid in self.ppid and self.ppid[pid] != 0:
+			pid = self.ppid[pid]
+			_x.append(pid)
+		return _x
+
+	#@wrapException
+	def subtree_totals(self, pid):
+		"""
+		Desc : Sum of the counters of a process and of all its descendants
+		Args : pid (int)
+		Ret  : Dict of Int
+			* processes : number of processes in the subtree
+			* utime, stime, cpu (utime + stime) : clock ticks
+			* rss : pages
+			* read_bytes, write_bytes : bytes (only if the tree has been built with io = True, processes not readable are counted as 0)
+		"""
+		if pid not in self._data:
+			raise OSError("No such process found with pid %d" % pid)
+
+		_x = {'processes': 0, 'utime': 0, 'stime': 0, 'cpu': 0, 'rss': 0}
+		if 'read_bytes' in self._scan.fields:
+			_x['read_bytes'], _x['write_bytes'] = 0, 0
+
+		for _y in [pid] + self.descendants(pid):
+			_z = self._data[_y]
+			_x['processes'] += 1
+			_x['utime'] += _z.utime
+			_x['stime'] += _z.stime
+			_x['cpu'] += _z.utime + _z.stime
+			_x['rss'] += _z.rss
+			if 'read_bytes' in _x:
+				_x['read_bytes'] += _z.read_bytes or 0
+				_x['write_bytes'] += _z.write_bytes or 0
+		return _x
+
+	def __repr__(self):
+		return '<tree processes=%d time=%f>' % (len(self.ppid), self.time)
+
+#@wrapException
+def find(name = None, exe = None, uid = None, state = None, ppid = None, cmdline_re = None):
+	"""
+	Desc : Find processes, all the given predicates must match. The cheapest files are read first and the next ones only for the processes still matching : stat (name, state, ppid), then exe (readlink), then status (uid), then cmdline
+	Args :	* name (string) : name of the process (comm, truncated to 15 characters by the kernel)
+		* exe (string) : absolute path of the executable
+		* uid (int) : real uid
+		* state (string or List) : one letter state(s) (R, S, D, T, Z...)
+		* ppid (int) : parent pid
+		* cmdline_re (string or compiled regex) : searched in the command line (arguments joined by spaces)
+	Ret  : Generator of Int (pid)
+
+	Exemple :
+		>>> list(pid.find(name = 'nginx', uid = 33, state = 'D'))
+	"""
+	if name != None:
+		name = name[:15]
+	if isinstance(state, str):
+		state = [state]
+	if isinstance(cmdline_re, str):
+		cmdline_re = re.compile(cmdline_re)
+
+	for _entry in os.scandir(ProcessPath):
+		if not _entry.name.isdigit():
+			continue
+
+		try:
+			if name != None or state != None or ppid != None:
+				_stat = _parsestat(open(os.path.join(_entry.path, 'stat'), 'r').read())
+				if name != None and _stat[1] != name:
+					continue
+				if state != None and _stat[2] not in state:
+					continue
+				if ppid != None and _stat[3] != ppid:
+					continue
+
+			if exe != None:
+				try:
+					if os.readlink(os.path.join(_entry.path, 'exe')) != exe:
+						continue
+				except OSError as _e:
+					if _e.errno in (errno.ENOENT, errno.EACCES):
+						continue
+					raise
+
+			if uid != None:
+				if int(_parsestatus(open(os.path.join(_entry.path, 'status'), 'r').read())['Uid'][0]) != int(uid):
+					continue
+
+			if cmdline_re != None:
+				if not cmdline_re.search(open(os.path.join(_entry.path, 'cmdline'), 'r').read().rstrip('\x00').replace('\x00', ' ')):
+					continue
+		except (IOError, OSError):
+			#The process has disappeared
+			continue
+
+		yield int(_entry.name)
+
+class threads:
+	"""
+	Desc : Sampler of the threads of processes. Each sample walks /proc/<pid>/task/*/stat (and status for the context switches) and computes the cpu usage and the context switch rates since the previous sample
+	Type : Class
+	Ret  : Object
+
+	Exemple :
+		>>> t = pid.threads(603)
+		>>> t.sample()
+		>>> time.sleep(1)
+		>>> t.top(5)
+	"""
+
+	def __init__(self, pids, switches = True):
+		"""
+		Desc : Prepare the sampler, nothing is read before the first sample
+		Args :	* pids : Int or List of Int (processes whose threads are sampled)
+			* switches (bool) : read /proc/<pid>/task/<tid>/status for the context switches (True by default)
+		Ret  : Objet
+		"""
+		if isinstance(pids, int):
+			pids = [pids]
+		self.pids = [int(_x) for _x in pids]
+		self.switches = switches
+		self._hz = os.sysconf('SC_CLK_TCK')
+		self._last = {}
+		self._time = None
+
+	#@wrapException
+	def sample(self):
+		"""
+		Desc : Read all the threads and compute the rates since the previous sample (rates are None at the first sample or for a new thread)
+		Args : None
+		Ret  : List of Dict
+			* pid, tid, name, state, processor (cpu number last executed on)
+			* utime, stime : clock ticks
+			* cpu : cpu usage in percent of one cpu since the previous sample
+			* voluntary, nonvoluntary : context switches (only if switches is True)
+			* voluntary_rate, nonvoluntary_rate : context switches by second since the previous sample (only if switches is True)
+		"""
+		_now = time.time()
+		_dt = _now - self._time if self._time != None else None
+		_new = {}
+		_y = []
+
+		for _pid in self.pids:
+			_taskpath = os.path.join(ProcessPath, str(_pid), 'task')
+			try:
+				_tids = os.listdir(_taskpath)
+			except OSError:
+				continue
+
+			for _tid in _tids:
+				try:
+					_stat = _parsestat(open(os.path.join(_taskpath, _tid, 'stat'), 'r').read())
+					if self.switches == True:
+						_status = statusinfo(open(os.path.join(_taskpath, _tid, 'status'), 'r').read())
+				except (IOError, OSError):
+					continue
+
+				_x = {'pid': _pid, 'tid': int(_tid), 'name': _stat[1], 'state': _stat[2], 'processor': _stat[38], 'utime': _stat[13], 'stime': _stat[14], 'cpu': None}
+				_prev = self._last.get(_x['tid'])
+				if _prev != None and _prev[0] != _stat[21]:
+					_prev = None
+
+				if _prev != None and _dt:
+					_x['cpu'] = (_x['utime'] + _x['stime'] - _prev[1] - _prev[2]) * 100.0 / self._hz / _dt
+
+				_cur = [_stat[21], _x['utime'], _x['stime']]
+				if self.switches == True:
+					_x['voluntary'] = _status.voluntary_ctxt_switches
+					_x['nonvoluntary'] = _status.nonvoluntary_ctxt_switches
+					_x['voluntary_rate'], _x['nonvoluntary_rate'] = None, None
+					if _prev != None and _dt:
+						_x['voluntary_rate'] = (_x['voluntary'] - _prev[3]) / _dt
+						_x['nonvoluntary_rate'] = (_x['nonvoluntary'] - _prev[4]) / _dt
+					_cur += [_x['voluntary'], _x['nonvoluntary']]
+
+				_new[_x['tid']] = _cur
+				_y.append(_x)
+
+		self._last = _new
+		self._time = _now
+		return _y
+
+	#@wrapException
+	def top(self, number = 10, key = 'cpu'):
+		"""
+		Desc : Take a sample and return the hottest threads
+		Args :	* number (int) : number of threads (10 by default)
+			* key : cpu (default), voluntary_rate or nonvoluntary_rate (context switch storms)
+		Ret  : List of Dict (see sample), threads without rate are skipped
+		"""
+		_x = [_y for _y in self.sample() if _y.get(key) != None]
+		_x.sort(key = lambda _y: _y[key], reverse = True)
+		return _x[:number]
+
+class iorates:
+	"""
+	Desc : I/O rates of all the processes (like iotop). Each sweep reads /proc/*/io and /proc/*/stat once and computes the rates since the previous sweep. The counters are kept in arrays indexed by the identity (pid, starttime) of the processes
+	Type : Class
+	Ret  : Object
+	Warn : /proc/<pid>/io of the processes of other users is readable only by root, these processes are skipped
+
+	Exemple :
+		>>> r = pid.iorates()
+		>>> r.sweep()
+		>>> time.sleep(1)
+		>>> r.top(10, 'write_bytes')
+	"""
+
+	_fields = ['starttime', 'delayacct_blkio_ticks', 'read_bytes', 'write_bytes', 'rchar', 'wchar', 'syscr', 'syscw']
+
+	def __init__(self, path = None):
+		"""
+		Desc : Prepare the tracker, nothing is read before the first sweep
+		Args : path : proc directory (ProcessPath by default)
+		Ret  : Objet
+		"""
+		self._path = path or ProcessPath
+		self._scan = scan(self._fields, self._path)
+		self._hz = os.sysconf('SC_CLK_TCK')
+		self._columns = None
+		self._index = {}
+		self._time = None
+
+	#@wrapException
+	def sweep(self):
+		"""
+		Desc : Read all the processes and compute the rates since the previous sweep (nothing at the first sweep)
+		Args : None
+		Ret  : List of Dict
+			* pid
+			* read_bytes, write_bytes : bytes by second read from / written to the storage
+			* rchar, wchar : bytes by second read / written by syscalls (cache included)
+			* syscr, syscw : read / write syscalls by second
+			* iowait : share of the time spent waiting for block I/O (0 to 1 for one thread, delayacct must be enabled : sysctl kernel.task_delayacct=1)
+		"""
+		_now = time.time()
+		_columns = self._scan.columns()
+		_pids, _start = _columns['pid'], _columns['starttime']
+		_index = dict([((_pids[_i], _start[_i]), _i) for _i in range(len(_pids))])
+		_y = []
+
+		if self._columns != None:
+			_dt = _now - self._time
+			_old = self._columns
+
+			for _key, _i in _index.items():
+				_j = self._index.get(_key)
+				if _j == None or _columns['read_bytes'][_i] == -1 or _old['read_bytes'][_j] == -1:
+					continue
+
+				_x = {'pid': _key[0]}
+				for _field in ('read_bytes', 'write_bytes', 'rchar', 'wchar', 'syscr', 'syscw'):
+					_x[_field] = (_columns[_field][_i] - _old[_field][_j]) / _dt
+				_x['iowait'] = (_columns['delayacct_blkio_ticks'][_i] - _old['delayacct_blkio_ticks'][_j]) / float(self._hz) / _dt
+				_y.append(_x)
+
+		self._columns, self._index, self._time = _columns, _index, _now
+		return _y
+
+	#@wrapException
+	def top(self, number = 10, key = 'read_bytes'):
+		"""
+		Desc : Sweep and return the processes with the highest rate, with their name
+		Args :	* number (int) : number of processes (10 by default)
+			* key : read_bytes (default), write_bytes, rchar, wchar, syscr, syscw or iowait
+		Ret  : List of Dict (see sweep, plus name), idle processes are skipped
+		"""
+		_x = [_y for _y in self.sweep() if _y[key] > 0]
+		_x.sort(key = lambda _y: _y[key], reverse = True)
+		_x = _x[:number]
+
+		for _y in _x:
+			try:
+				_y['name'] = open(os.path.join(self._path, str(_y['pid']), 'comm'), 'r').read().rstrip('\n')
+			except (IOError, OSError):
+				_y['name'] = None
+		return _x
+
+#@wrapException
+def _parseschedstat(data):
+	"""
+	Desc : Parse /proc/<pid>/schedstat
+	Args : data (string)
+	Ret  : List of Int [time on cpu (ns), time waiting on a runqueue (ns), number of timeslices]
+	"""
+	return [int(_x) for _x in data.split()[:3]]
+
+class schedlatency:
+	"""
+	Desc : Scheduler latency of processes. Each sample reads /proc/<pid>/task/*/schedstat and computes the time spent waiting on a runqueue (cpu contention) besides the time spent on a cpu, since the previous sample
+	Type : Class
+	Ret  : Object
+	Warn : needs CONFIG_SCHED_INFO (schedstats), /proc/<pid>/schedstat is missing otherwise
+
+	Exemple :
+		>>> s = pid.schedlatency()
+		>>> s.sample()
+		>>> time.sleep(1)
+		>>> s.top(10)
+	"""
+
+	def __init__(self, pids = None, threads = False, path = None):
+		"""
+		Desc : Prepare the collector, nothing is read before the first sample
+		Args :	* pids : Int or List of Int (None for all the processes)
+			* threads (bool) : return the rates of each thread too (False by default)
+			* path : proc directory (ProcessPath by default)
+		Ret  : Objet
+		"""
+		if isinstance(pids, int):
+			pids = [pids]
+		self.pids = [int(_x) for _x in pids] if pids != None else None
+		self.threads = threads
+		self._path = path or ProcessPath
+		self._last = {}
+		self._time = None
+
+	#@wrapException
+	def _delta(self, cur, prev):
+		"""
+		Desc : Deltas of the threads of a process between two samples. The threads which have exited are left out, the threads created since the previous sample count from 0
+		Args : cur, prev : Dict of Int (tid) -> List (see _parseschedstat)
+		Ret  : Dict of Int (tid) -> List of Int [run, delay, slices]
+		"""
+		_x = {}
+		for _tid, _cur in cur.items():
+			_prev = prev.get(_tid)
+			_x[_tid] = [max(_a - _b, 0) for _a, _b in zip(_cur, _prev)] if _prev != None else _cur
+		return _x
+
+	#@wrapException
+	def _rates(self, delta, dt):
+		"""
+		Desc : Rates of a delta of schedstat
+		Args : delta (list see _parseschedstat), dt (float)
+		Ret  : Dict
+		"""
+		_run, _delay, _slices = delta
+		return {
+			'run': _run / 1e9 / dt,
+			'delay': _delay / 1e9 / dt,
+			'slices': _slices / dt,
+			'avgslice': _run / 1e9 / _slices if _slices else None,
+			'avgdelay': _delay / 1e9 / _slices if _slices else None
+		}
+
+	#@wrapException
+	def sample(self):
+		"""
+		Desc : Read all the threads and compute the rates since the previous sample (nothing at the first sample, new processes are skipped)
+		Args : None
+		Ret  : List of Dict
+			* pid, name
+			* run : seconds on a cpu by second (1.0 = one cpu used)
+			* delay : seconds waiting on a runqueue by second (1.0 = one thread always runnable but not running)
+			* slices : timeslices by second
+			* avgslice, avgdelay : average time on cpu and average wait before running of a timeslice, in seconds (None if no timeslice)
+			* threads : List of Dict (tid, run, delay, slices, avgslice, avgdelay), only if threads is True
+		"""
+		_now = time.time()
+		_dt = _now - self._time if self._time != None else None
+		_new = {}
+		_y = []
+
+		for _pid in (self.pids if self.pids != None else ls()):
+			_pidpath = os.path.join(self._path, str(_pid))
+			_taskpath = os.path.join(_pidpath, 'task')
+			try:
+				_stat = _parsestat(open(os.path.join(_pidpath, 'stat'), 'r').read())
+				_tasks = {}
+				for _entry in os.scandir(_taskpath):
+					try:
+						_tasks[int(_entry.name)] = _parseschedstat(open(os.path.join(_entry.path, 'schedstat'), 'r').read())
+					except (IOError, OSError):
+						continue
+			except (IOError, OSError):
+				continue
+
+			_key = (_pid, _stat[21])
+			_new[_key] = _tasks
+
+			_prev = self._last.get(_key)
+			if _prev == None or not _dt:
+				continue
+
+			#Sum of the deltas of the threads, a thread which has exited does not hide the time of the others
+			_delta = self._delta(_tasks, _prev)
+			_x = self._rates([sum(_z) for _z in zip(*_delta.values())] if _delta else [0, 0, 0], _dt)
+			_x['pid'] = _pid
+			_x['name'] = _stat[1]
+			if self.threads == True:
+				_x['threads'] = []
+				for _tid, _d in _delta.items():
+					if _tid in _prev:
+						_z = self._rates(_d, _dt)
+						_z['tid'] = _tid
+						_x['threads'].append(_z)
+			_y.append(_x)
+
+		self._last = _new
+		self._time = _now
+		return _y
+
+	#@wrapException
+	def top(self, number = 10, key = 'delay'):
+		"""
+		Desc : Sample and return the processes suffering the most cpu contention
+		Args :	* number (int) : number of processes (10 by default)
+			* key : delay (default), run, slices, avgslice or avgdelay
+		Ret  : List of Dict (see sample)
+		"""
+		_x = [_y for _y in self.sample() if _y[key]]
+		_x.sort(key = lambda _y: _y[key], reverse = True)
+		return _x[:number]
+
+#Shared cache of the ancestry : (pid, starttime) -> (ppid, starttime of the ppid)
+_ancestors = {}
+_ancestorsmax = 65536
+
+#@wrapException
+def _readppid(pid):
+	"""
+	Desc : Read the starttime and the ppid of a process
+	Args : pid (int)
+	Ret  : Tuple (starttime, ppid)
+	"""
+	_x = _parsestat(open(os.path.join(ProcessPath, str(pid), 'stat'), 'r').read())
+	return (_x[21], _x[3])
+
+#@wrapException
+def _addparent(pid, starttime, ppid, ppidstart):
+	"""
+	Desc : Store the parent of a process in the ancestry cache
+	Args : pid, starttime, ppid, ppidstart (int)
+	Ret  : None
+	"""
+	if len(_ancestors) >= _ancestorsmax:
+		_ancestors.clear()
+	_ancestors[(pid, starttime)] = (ppid, ppidstart)
+
+#@wrapException
+def parents(pid, cache = True):
+	"""
+	Desc : Parents pid of a process up to the root of the tree. Only the stat of the process itself is always read, the parents come from a cache shared by all the calls
+	Args :	* pid (int)
+		* cache (bool) : use the ancestry cache (True by default)
+	Ret  : List of Int
+	Warn : The cache is keyed by (pid, starttime), a reused pid is a new process and its parents are read again. A process reparented after it has been cached (its parent has exited) keeps its old parents until clearparents() is called
+	"""
+	_pid = int(pid)
+	_start, _ppid = _readppid(_pid)
+	_x = []
+
+	while _ppid != 0:
+		_x.append(_ppid)
+		_entry = _ancestors.get((_pid, _start)) if cache == True else None
+
+		if _entry != None and _entry[0] == _ppid:
+			_parent = _ancestors.get(_entry)
+			if _parent != None:
+				_pid, _start, _ppid = _ppid, _entry[1], _parent[0]
+				continue
+
+		#Miss : the parent is read and its identity is stored with the child
+		_pstart, _pppid = _readppid(_ppid)
+		_addparent(_pid, _start, _ppid, _pstart)
+		_pid, _start, _ppid = _ppid, _pstart, _pppid
+
+	#The root of the tree ends the walk of the next calls
+	_addparent(_pid, _start, 0, None)
+	return _x
+
+#@wrapException
+def ancestry(pids, cache = True):
+	"""
+	Desc : Parents pid of many processes in one call (see parents)
+	Args :	* pids : List of Int
+		* cache (bool) : use the ancestry cache (True by default)
+	Ret  : Dict of Int -> List of Int (None if the process has disappeared)
+	"""
+	_x = {}
+	for _pid in pids:
+		try:
+			_x[_pid] = parents(_pid, cache)
+		except (IOError, OSError):
+			_x[_pid] = None
+	return _x
+
+#@wrapException
+def clearparents():
+	"""
+	Desc : Drop the ancestry cache used by parents() and ancestry()
+	Args : None
+	Ret  : None
+	"""
+	_ancestors.clear()
+
+#@wrapException
+def _pidfd(pid):
+	"""
+	Desc : Open a pidfd on a process (Linux >= 5.3 and Python >= 3.9)
+	Args : pid (int)
+	Ret  : Int (fd) or None if pidfd_open is not supported. Raises OSError (ESRCH) if the process does not exist
+	"""
+	if not hasattr(os, 'pidfd_open'):
+		return None
+	try:
+		return os.pidfd_open(pid)
+	except OSError as _e:
+		if _e.errno in (errno.ENOSYS, errno.EINVAL):
+			return None
+		raise
+
+#@wrapException
+def _wait(pids, timeout = 0, all = True, sleep = 0.1):
+	"""
+	Desc : Wait the end of processes. pidfd are polled when possible so there is no latency and no wakeup, else /proc/<pid> is checked every sleep seconds
+	Args :	* pids : List of Int
+		* timeout : time to wait in seconds (0 means infinite time)
+		* all (bool) : wait all the processes if True or return at the first end if False
+		* sleep : step time of the check if pidfd_open is not supported
+	Ret  : List of Int (pids which have finished)
+	"""
+	import select
+
+	_deadline = time.time() + timeout if timeout != 0 else None
+	_done, _fds, _polled = [], {}, []
+
+	for _pid in set(pids):
+		try:
+			_fd = _pidfd(_pid)
+		except OSError:
+			_done.append(_pid)
+			continue
+
+		if _fd == None:
+			_polled.append(_pid)
+		else:
+			_fds[_fd] = _pid
+
+	try:
+		_poll = select.poll()
+		for _fd in _fds:
+			_poll.register(_fd, select.POLLIN)
+
+		while _fds or _polled:
+			for _pid in list(_polled):
+				if not os.path.isdir(os.path.join(ProcessPath, str(_pid))):
+					_polled.remove(_pid)
+					_done.append(_pid)
+
+			if (_done and all == False) or not (_fds or _polled):
+				break
+
+			if _deadline == None:
+				_left = None
+			else:
+				_left = _deadline - time.time()
+				if _left <= 0:
+					break
+
+			if _polled:
+				_left = sleep if _left == None else min(sleep, _left)
+
+			for _fd, _event in _poll.poll(None if _left == None else _left * 1000):
+				_poll.unregister(_fd)
+				os.close(_fd)
+				_done.append(_fds.pop(_fd))
+	finally:
+		for _fd in _fds:
+			os.close(_fd)
+
+	return _done
+
+#@wrapException
+def wait_any(pids, timeout = 0, sleep = 0.1):
+	"""
+	Desc : Wait the end of at least one process of the list, all the processes are watched at the same time
+	Args :	* pids : List of Int
+		* timeout : the time to wait in seconds (default is 0 means infinite time)
+		* sleep : step time of the check if pidfd_open is not supported (see id.wait)
+	Ret  : List of Int (pids which have finished, empty if the timeout has expired)
+	"""
+	return _wait(pids, timeout, False, sleep)
+
+#@wrapException
+def wait_all(pids, timeout = 0, sleep = 0.1):
+	"""
+	Desc : Wait the end of all the processes of the list, all the processes are watched at the same time
+	Args :	* pids : List of Int
+		* timeout : the time to wait in seconds (default is 0 means infinite time)
+		* sleep : step time of the check if pidfd_open is not supported (see id.wait)
+	Ret  : Bool (True if all the processes have finished before the timeout)
+	"""
+	return len(_wait(pids, timeout, True, sleep)) == len(set(pids))
+
+_signals = {
+	'SIGHUP' : 1,
+	'SIGINT' : 2,
+	'SIGQUIT' : 3,
+	'SIGILL' : 4,
+	'SIGTRAP' : 5,
+	'SIGABRT' : 6,
+	'SIGBUS' : 7,
+	'SIGFPE' : 8,
+	'SIGKILL' : 9,
+	'SIGUSR1' : 10,
+	'SIGSEGV' : 11,
+	'SIGUSR2' : 12,
+	'SIGPIPE' : 13,
+	'SIGALRM' : 14,
+	'SIGTERM' : 15,
+	'SIGSTKFLT' : 16,
+	'SIGCHLD' : 17,
+	'SIGCONT' : 18,
+	'SIGSTOP' : 19,
+	'SIGTSTP' : 20,
+	'SIGTTIN' : 21,
+	'SIGTTOU' : 22,
+	'SIGURG' : 23,
+	'SIGXCPU' : 24,
+	'SIGXFSZ' : 25,
+	'SIGVTALRM' : 26,
+	'SIGPROF' : 27,
+	'SIGWINCH' : 28,
+	'SIGIO' : 29,
+	'SIGPWR' : 30,
+	'SIGSYS' : 31,
+	'SIGRTMIN' : 34,
+	'SIGRTMIN+1' : 35,
+	'SIGRTMIN+2' : 36,
+	'SIGRTMIN+3' : 37,
+	'SIGRTMIN+4' : 38,
+	'SIGRTMIN+5' : 39,
+	'SIGRTMIN+6' : 40,
+	'SIGRTMIN+7' : 41,
+	'SIGRTMIN+8' : 42,
+	'SIGRTMIN+9' : 43,
+	'SIGRTMIN+10' : 44,
+	'SIGRTMIN+11' : 45,
+	'SIGRTMIN+12' : 46,
+	'SIGRTMIN+13' : 47,
+	'SIGRTMIN+14' : 48,
+	'SIGRTMIN+15' : 49,
+	'SIGRTMAX-14' : 50,
+	'SIGRTMAX-13' : 51,
+	'SIGRTMAX-12' : 52,
+	'SIGRTMAX-11' : 53,
+	'SIGRTMAX-10' : 54,
+	'SIGRTMAX-9' : 55,
+	'SIGRTMAX-8' : 56,
+	'SIGRTMAX-7' : 57,
+	'SIGRTMAX-6' : 58,
+	'SIGRTMAX-5' : 59,
+	'SIGRTMAX-4' : 60,
+	'SIGRTMAX-3' : 61,
+	'SIGRTMAX-2' : 62,
+	'SIGRTMAX-1' : 63,
+	'SIGRTMAX' : 64
+}
+
+#@wrapException
+def _signum(signal):
+	"""
+	Desc : Number of a signal
+	Args : signal (Int or String, see id.signal)
+	Ret  : Int
+	"""
+	if isinstance(signal, str):
+		if signal in _signals:
+			return _signals[signal]
+		else:
+			raise ValueError("%s is not a valid signal" % signal)
+	return int(signal)
+
+#@wrapException
+def _match(pid, selector, subtree):
+	"""
+	Desc : Does the process match the selector of signal_many ?
+	Args :	* pid (int)
+		* selector (dict)
+		* subtree : Set of Int (pids of the subtree if selector has a subtree key)
+	Ret  : Bool
+	"""
+	_path = os.path.join(ProcessPath, str(pid))
+
+	if 'subtree' in selector and pid != selector['subtree']:
+		if _parsestat(open(os.path.join(_path, 'stat'), 'r').read())[3] not in subtree:
+			return False
+	if 'name' in selector:
+		if open(os.path.join(_path, 'comm'), 'r').read().rstrip('\n') != selector['name']:
+			return False
+	if 'uid' in selector:
+		if int(_parsestatus(open(os.path.join(_path, 'status'), 'r').read())['Uid'][0]) != int(selector['uid']):
+			return False
+	if 'cgroup' in selector:
+		_x = linuxutil.cgroup.of(pid)
+		_y = selector['cgroup'].rstrip('/')
+		if _x == None or (_x != _y and not _x.startswith(_y + '/')):
+			return False
+	return True
+
+#@wrapException
+def signal_many(selector, signal = 15):
+	"""
+	Desc : Send a signal to all the processes matching a selector (like pkill). All the targets are pinned with a pidfd and checked against the selector (and the starttime of a (pid, starttime) pair) before the first signal is sent with pidfd_send_signal, so a process which replaces a matched one between the check and the signal never receives it. The calling process is never signaled
+	Args :	* selector : List of pids, List of (pid, starttime) (see id.identity) or Dict with one or more of these keys (all must match)
+			-> name : name of the process (comm)
+			-> uid : real uid
+			-> subtree : pid, the process and all its descendants
+			-> cgroup : cgroup v2 path, the processes of the cgroup and of its sub cgroups (ex : /system.slice/nginx.service)
+		* signal (Int or String, see id.signal) : default is 15 (SIGTERM)
+	Ret  : Dict of Int -> Int (0 if the signal has been sent else the errno, ex : errno.EPERM or errno.ESRCH if the process has disappeared, its starttime differs or it has left the subtree). The processes of a name, uid or cgroup selector which disappear before they are checked are left out
+	Warn : A plain pid is the process which has this pid when signal_many runs, give (pid, starttime) pairs to be sure to signal the process seen before
+
+	Exemples :
+		-signal_many({'name': 'nginx', 'uid': 33}, 'SIGHUP')
+		-signal_many({'subtree': 603})
+	"""
+	import signal as _signal
+
+	signal = _signum(signal)
+	_x = {}
+	_starttimes = {}
+
+	if isinstance(selector, dict):
+		for _k in selector:
+			if _k not in ('name', 'uid', 'subtree', 'cgroup'):
+				raise ValueError("%s is not a valid selector" % _k)
+		if 'subtree' in selector:
+			_tree = tree()
+			_pids = [selector['subtree']] + _tree.descendants(selector['subtree'])
+		else:
+			_pids = ls()
+	else:
+		_starttimes = dict([(int(_y[0]), _y[1]) if isinstance(_y, tuple) else (int(_y), None) for _y in selector])
+		_pids, selector = list(_starttimes), {}
+	_subtree = set(_pids)
+	#Targets given by the caller (not found by a walk of /proc) are reported when they have disappeared
+	_given = selector == {} or list(selector) == ['subtree']
+
+	#All the targets are pinned and checked before the first signal : a signal to the root of a subtree reparents its children and they would not match any more
+	_targets = []
+	try:
+		for _pid in _pids:
+			if _pid == os.getpid():
+				continue
+
+			try:
+				_fd = _pidfd(_pid)
+			except OSError as _e:
+				if _given:
+					_x[_pid] = _e.errno
+				continue
+
+			try:
+				if not _match(_pid, selector, _subtree):
+					#A descendant seen by tree() whose parent has changed is not the same process any more
+					if _given:
+						_x[_pid] = errno.ESRCH
+					if _fd != None:
+						os.close(_fd)
+					continue
+				if _starttimes.get(_pid) != None and _parsestat(open(os.path.join(ProcessPath, str(_pid), 'stat'), 'r').read())[21] != _starttimes[_pid]:
+					raise OSError(errno.ESRCH, 'Process %d has been replaced' % _pid)
+			except (IOError, OSError) as _e:
+				if _given:
+					_x[_pid] = errno.ESRCH if _e.errno == errno.ENOENT else _e.errno
+				if _fd != None:
+					os.close(_fd)
+				continue
+			_targets.append((_pid, _fd))
+
+		for _pid, _fd in _targets:
+			try:
+				if _fd == None:
+					os.kill(_pid, signal)
+				else:
+					_signal.pidfd_send_signal(_fd, signal)
+				_x[_pid] = 0
+			except OSError as _e:
+				_x[_pid] = _e.errno
+	finally:
+		for _pid, _fd in _targets:
+			if _fd != None:
+				os.close(_fd)
+	return _x
+
+#Proc connector, see /usr/include/linux/cn_proc.h and /usr/include/linux/connector.h
+_NETLINK_CONNECTOR = 11
+_CN_IDX_PROC = 1
+_CN_VAL_PROC = 1
+_PROC_CN_MCAST_LISTEN = 1
+_PROC_CN_MCAST_IGNORE = 2
+
+_procevents = {
+	0x00000000: 'none',
+	0x00000001: 'fork',
+	0x00000002: 'exec',
+	0x00000004: 'uid',
+	0x00000040: 'gid',
+	0x00000080: 'sid',
+	0x00000100: 'ptrace',
+	0x00000200: 'comm',
+	0x40000000: 'coredump',
+	0x80000000: 'exit'
+}
+
+class events:
+	"""
+	Desc : Stream of the process events (fork, exec, uid, gid, sid, ptrace, comm, coredump, exit) sent by the kernel through the netlink proc connector. A table of the running processes is kept up to date with the events, /proc is walked only at the start and after an overflow of the socket buffer
+	Type : Class
+	Ret  : Object (iterable of Dict)
+		* table : Dict of Int (pid) -> Dict {ppid, name, uid}
+		* overflows : number of overflows (events lost then /proc walked again)
+	Warn : Needs root (CAP_NET_ADMIN) and a kernel with CONFIG_PROC_EVENTS
+
+	Exemple :
+		>>> with pid.events() as e:
+		>>> 	for _x in e: print(_x['event'], _x['pid'])
+	"""
+
+	def __init__(self, table = True, bufsize = 4194304):
+		"""
+		Desc : Subscribe to the proc connector
+		Args :	* table (bool) : keep the table of the processes (True by default)
+			* bufsize (int) : size of the socket buffer, a big buffer avoids the overflows during a burst of forks (4MB by default)
+		Ret  : Objet
+		"""
+		import socket, struct
+		self._struct = struct
+
+		self.table = {}
+		self.overflows = 0
+		self._table = table
+
+		self._socket = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_CONNECTOR)
+		try:
+			self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, bufsize)
+			self._socket.bind((0, _CN_IDX_PROC))
+			self._control(_PROC_CN_MCAST_LISTEN)
+		except:
+			self._socket.close()
+			raise
+
+		if self._table == True:
+			self.rescan()
+
+	def _control(self, op):
+		"""
+		Desc : Send a PROC_CN_MCAST_LISTEN or PROC_CN_MCAST_IGNORE message
+		Args : op (int)
+		Ret  : None
+		"""
+		#nlmsghdr (len, type = NLMSG_DONE, flags, seq, pid) + cn_msg (idx, val, seq, ack, len, flags) + op
+		self._socket.send(self._struct.pack('=IHHII', 40, 3, 0, 0, 0) + self._struct.pack('=IIIIHH', _CN_IDX_PROC, _CN_VAL_PROC, 0, 0, 4, 0) + self._struct.pack('=I', op))
+
+	#@wrapException
+	def rescan(self):
+		"""
+		Desc : Walk /proc to build the table of the processes
+		Args : None
+		Ret  : None
+		"""
+		self.table = {}
+		for _x in scan(['ppid', 'name', 'uid']):
+			self.table[_x.pid] = {'ppid': _x.ppid, 'name': _x.name, 'uid': _x.uid[0]}
+
+	def fileno(self):
+		return self._socket.fileno()
+
+	#@wrapException
+	def close(self):
+		"""
+		Desc : Unsubscribe and close the netlink socket
+		Args : None
+		Ret  : None
+		"""
+		try:
+			self._control(_PROC_CN_MCAST_IGNORE)
+		except OSError:
+			pass
+		self._socket.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def _decode(self, data):
+		"""
+		Desc : Decode the proc_event of the netlink messages
+		Args : data (bytes)
+		Ret  : List of Dict
+		"""
+		_unpack = self._struct.unpack_from
+		_y = []
+		_i = 0
+
+		while _i + 16 <= len(data):
+			_len = _unpack('=I', data, _i)[0]
+			if _len < 16:
+				break
+
+			#nlmsghdr (16) + cn_msg (20) + proc_event header : what, cpu, timestamp_ns (16)
+			_what, _cpu, _ns = _unpack('=IIQ', data, _i + 36)
+			_o = _i + 52
+			_i += (_len + 3) & ~3
+
+			if _what not in _procevents or _what == 0:
+				continue
+
+			_x = {'event': _procevents[_what], 'cpu': _cpu, 'timestamp': _ns}
+
+			if _what == 0x00000001:
+				_x['ppid'], _x['ptgid'], _x['pid'], _x['tgid'] = _unpack('=IIII', data, _o)
+			elif _what == 0x00000002 or _what == 0x00000080:
+				_x['pid'], _x['tgid'] = _unpack('=II', data, _o)
+			elif _what == 0x00000004:
+				_x['pid'], _x['tgid'], _x['ruid'], _x['euid'] = _unpack('=IIII', data, _o)
+			elif _what == 0x00000040:
+				_x['pid'], _x['tgid'], _x['rgid'], _x['egid'] = _unpack('=IIII', data, _o)
+			elif _what == 0x00000100:
+				_x['pid'], _x['tgid'], _x['tracerpid'], _x['tracertgid'] = _unpack('=IIII', data, _o)
+			elif _what == 0x00000200:
+				_x['pid'], _x['tgid'] = _unpack('=II', data, _o)
+				_x['name'] = data[_o+8:_o+24].split(b'\x00')[0].decode('utf-8', 'replace')
+			elif _what == 0x40000000:
+				_x['pid'], _x['tgid'] = _unpack('=II', data, _o)
+			elif _what == 0x80000000:
+				_x['pid'], _x['tgid'], _x['code'], _x['signal'] = _unpack('=IIII', data, _o)
+
+			_y.append(_x)
+		return _y
+
+	def _update(self, event):
+		"""
+		Desc : Update the table of the processes with an event (threads are ignored)
+		Args : event (dict)
+		Ret  : None
+		"""
+		_pid = event['pid']
+		if _pid != event['tgid']:
+			return
+
+		if event['event'] == 'fork':
+			_parent = self.table.get(event['ptgid'], {})
+			self.table[_pid] = {'ppid': event['ptgid'], 'name': _parent.get('name'), 'uid': _parent.get('uid')}
+		elif event['event'] == 'exit':
+			self.table.pop(_pid, None)
+		elif _pid in self.table:
+			if event['event'] == 'comm':
+				self.table[_pid]['name'] = event['name']
+			elif event['event'] == 'uid':
+				self.table[_pid]['uid'] = event['ruid']
+			elif event['event'] == 'exec':
+				try:
+					self.table[_pid]['name'] = open(os.path.join(ProcessPath, str(_pid), 'comm'), 'r').read().rstrip('\n')
+				except (IOError, OSError):
+					pass
+
+	#@wrapException
+	def read(self, timeout = None):
+		"""
+		Desc : Read the pending events
+		Args : timeout : the time to wait for an event in seconds (None means infinite time, 0 means no wait)
+		Ret  : List of Dict (empty if the timeout has expired). Each Dict has the keys event, cpu, timestamp (ns since boot), pid, tgid and the fields of the event (ppid/ptgid for fork, ruid/euid for uid, name for comm, code/signal for exit...)
+		"""
+		import select
+
+		_poll = select.poll()
+		_poll.register(self._socket.fileno(), select.POLLIN)
+		if not _poll.poll(None if timeout == None else timeout * 1000):
+			return []
+
+		_y = []
+		while True:
+			try:
+				_data = self._socket.recv(65536, 0x40) #MSG_DONTWAIT
+			except BlockingIOError:
+				break
+			except OSError as _e:
+				if _e.errno != errno.ENOBUFS:
+					raise
+				#Events have been lost, the table is not reliable anymore
+				self.overflows += 1
+				if self._table == True:
+					self.rescan()
+				_y.append({'event': 'overflow'})
+				continue
+
+			for _x in self._decode(_data):
+				if self._table == True:
+					self._update(_x)
+				_y.append(_x)
+		return _y
+
+	def __iter__(self):
+		while True:
+			for _x in self.read():
+				yield _x
+
+#LRU cache of the immutable attributes : (pid, starttime) -> {attribute: value}
+_immutable = collections.OrderedDict()
+_immutablemax = 4096
+#pid -> starttime of the identity cached for this pid
+_identities = {}
+
+#@wrapException
+def _cached(identity, key, func):
+	"""
+	Desc : Value of an immutable attribute of a process, func is called only if the value is not in the cache. An entry of a pid with an other starttime (the pid has been reused) is evicted
+	Args :	* identity : Tuple (pid, starttime)
+		* key : name of the attribute
+		* func : function which reads the attribute
+	Ret  : value
+	"""
+	_entry = _immutable.get(identity)
+
+	if _entry == None:
+		_old = _identities.get(identity[0])
+		if _old != None and _old != identity[1]:
+			_immutable.pop((identity[0], _old), None)
+
+		_entry = _immutable[identity] = {}
+		_identities[identity[0]] = identity[1]
+
+		if len(_immutable) > _immutablemax:
+			(_pid, _start), _x = _immutable.popitem(last = False)
+			if _identities.get(_pid) == _start:
+				del _identities[_pid]
 	else:
-		return False
+		_immutable.move_to_end(identity)
+
+	if key not in _entry:
+		_entry[key] = func()
+	return _entry[key]
+
+#@wrapException
+def clearcache():
+	"""
+	Desc : Drop the cache of the immutable attributes (exe, root, cmdline, environ)
+	Args : None
+	Ret  : None
+	"""
+	_immutable.clear()
+	_identities.clear()
 
 class id:
 	"""
@@ -48,19 +1729,26 @@ class id:
 	Ret  : Object
 	"""
 
-	def __init__(self, pid):
+	def __init__(self, pid, cache = True):
 		"""
 		Desc : Create a new Process object, raises OSError if the PID does not exist, and ValueError if the parameter is not an integer PID
-		Args : pid (int)
+		Args :	* pid (int)
+			* cache (bool) : exe, root, cmdline and environ are read only once for a process instance (pid, starttime) and kept in a cache shared by all the objects (True by default). An exec keeps the same identity, use cache = False or clearcache() to follow it
 		Ret  : Objet
 		"""
 
 		self.pid = int(pid)
+		self._cache = cache
+		self._starttime = None
+		#pidfd which pins the identity checked by _readonce (None before the first use, False if pidfd_open is not supported)
+		self._fd = None
+		self._poll = None
 
 		#if self.pid == '':
 			#self.pid = os.getpid()
 		
 		self._ProcPidPath = os.path.join(ProcessPath, str(self.pid))
+		self._record = None
 
 		#if not isinstance(self.pid, int):
 			#raise ValueError("An integer is required")
@@ -68,6 +1756,130 @@ class id:
 		if not self.isrunning:
 			raise OSError("No such process found with pid %d" % self.pid)
 
+	#@wrapException
+	def snapshot(self):
+		"""
+		Desc : Read stat, status, statm and io only once. All the properties based on these files use the snapshot until the next call of snapshot() or refresh()
+		Args : None
+		Ret  : Object record. Raises OSError (ESRCH) if the pid now belongs to another process than the identity of the object
+		"""
+		_record = record(self.pid, self._ProcPidPath)
+		if self._starttime == None:
+			self._starttime = _record.stat[21]
+		elif _record.stat[21] != self._starttime:
+			raise OSError(errno.ESRCH, 'Process %d has exited and its pid has been reused' % self.pid)
+		self._record = _record
+		return self._record
+
+	#@wrapException
+	def refresh(self):
+		"""
+		Desc : Alias of snapshot()
+		Args : None
+		Ret  : Object record
+		"""
+		return self.snapshot()
+
+	#@wrapException
+	def release(self):
+		"""
+		Desc : Drop the snapshot, properties read again the files at each call
+		Args : None
+		Ret  : None
+		"""
+		self._record = None
+
+	@property
+	#@wrapException
+	def identity(self):
+		"""
+		Desc : Identity of the process instance, a pid can be reused by the system but not with the same starttime. It is read once (and at each snapshot)
+		Args : None
+		Ret  : Tuple (pid, starttime)
+		"""
+		if self._starttime == None:
+			self._starttime = self._stat[21]
+		return (self.pid, self._starttime)
+
+	#@wrapException
+	def _check(self):
+		"""
+		Desc : Raise OSError (ESRCH) if the process of the identity has exited. A pidfd opened at the first call is polled, the starttime is read again only if pidfd_open is not supported
+		Args : None
+		Ret  : None
+		"""
+		if self._fd == None:
+			import select
+
+			#The pidfd is opened before the starttime is read, so it pins the process of the identity
+			self._fd = _pidfd(self.pid)
+			if self._fd == None:
+				self._fd = False
+			else:
+				self._poll = select.poll()
+				self._poll.register(self._fd, select.POLLIN)
+		elif self._fd != False:
+			#A pidfd is readable when its process has exited
+			if self._poll.poll(0):
+				raise OSError(errno.ESRCH, 'Process %d has exited' % self.pid)
+			return
+
+		_start = self._stat[21]
+		if self._starttime == None:
+			self._starttime = _start
+		elif _start != self._starttime:
+			raise OSError(errno.ESRCH, 'Process %d has exited and its pid has been reused' % self.pid)
+
+	def __del__(self):
+		if getattr(self, '_fd', None):
+			os.close(self._fd)
+			self._fd = None
+
+	#@wrapException
+	def _readonce(self, key, func):
+		"""
+		Desc : Read an immutable attribute through the cache (see id.__init__). Without snapshot, raises OSError (ESRCH) if the process of the identity has exited (see _check)
+		Args :	* key : name of the attribute
+			* func : function which reads the attribute
+		Ret  : value
+		"""
+		if self._cache == False:
+			return func()
+		if self._record == None:
+			self._check()
+		return _cached(self.identity, key, func)
+
+	@property
+	#@wrapException
+	def _stat(self):
+		"""
+		Desc : Fields of /proc/<pid>/stat (from the snapshot if there is one)
+		Args : None
+		Ret  : List
+		"""
+		if self._record != None:
+			return self._record.stat
+		return _parsestat(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read())
+
+	@property
+	#@wrapException
+	def statm(self):
+		"""
+		Desc : Memory usage measured in pages
+		Args : None
+		Ret  : Dict of Int
+			* size : total program size
+			* resident : resident set size
+			* shared : resident shared pages (i.e., backed by a file)
+			* text : text (code)
+			* lib : library (unused since Linux 2.6; always 0)
+			* data : data + stack
+			* dt : dirty pages (unused since Linux 2.6; always 0)
+		"""
+		if self._record != None:
+			return self._record.statm
+		return _parsestatm(open(os.path.join(self._ProcPidPath, 'statm'), 'r').read())
+
 	@property
 	#@wrapException
 	def exe(self):
@@ -76,7 +1888,7 @@ class id:
 		Args : None
 		Ret  : String
 		"""
-		return os.readlink(os.path.join(self._ProcPidPath, 'exe'))
+		return self._readonce('exe', lambda: os.readlink(os.path.join(self._ProcPidPath, 'exe')))
 
 	@property
 	#@wrapException
@@ -96,7 +1908,7 @@ class id:
 		Args : None
 		Ret  : String
 		"""
-		return os.readlink(os.path.join(self._ProcPidPath, 'root'))
+		return self._readonce('root', lambda: os.readlink(os.path.join(self._ProcPidPath, 'root')))
 
 	@property
 	#@wrapException
@@ -106,7 +1918,7 @@ class id:
 		Args : None
 		Ret  : List
 		"""
-		return open(os.path.join(self._ProcPidPath, 'cmdline'), 'r').read().split('\x00')
+		return list(self._readonce('cmdline', lambda: open(os.path.join(self._ProcPidPath, 'cmdline'), 'r').read().split('\x00')))
 
 	@property
 	#@wrapException
@@ -116,7 +1928,7 @@ class id:
 		Args : None
 		Ret  : List
 		"""
-		return open(os.path.join(self._ProcPidPath, 'environ'), 'r').read().split('\x00')
+		return list(self._readonce('environ', lambda: open(os.path.join(self._ProcPidPath, 'environ'), 'r').read().split('\x00')))
 
 	@property
 	#@wrapException
@@ -143,11 +1955,9 @@ class id:
 			* wchar : write characters
 			* rchar : read characters
 		"""
-		_x = dict([_x.replace(':','').split() for _x in open(os.path.join(self._ProcPidPath, 'io'), 'r').readlines()])
-
-		for _k,_v in _x.items(): 
-			_x[_k] = int(_v)
-		return _x
+		if self._record != None and self._record.io != None:
+			return self._record.io
+		return _parseio(open(os.path.join(self._ProcPidPath, 'io'), 'r').read())
 
 	@property
 	#@wrapException
@@ -159,6 +1969,17 @@ class id:
 		"""
 		return list(set([_x.split()[-1] for _x in open(os.path.join(self._ProcPidPath, 'maps'), 'r').readlines() if _x.split()[-1][0]=='/']))
 
+	@property
+	#@wrapException
+	def memory(self):
+		"""
+		Desc : Memory accounting (rss, pss, uss, swap, swappss, anon, huge pages...) in bytes, see linuxutil.memory.usage
+		Args : None
+		Ret  : Dict of Int
+		"""
+		import linuxutil.memory as memory
+		return memory.usage(self.pid)
+
 	@property
 	#@wrapException
 	def status(self):
@@ -167,10 +1988,21 @@ class id:
 		Args : None
 		Ret  : Dict containing List
 		"""
-		_x={}
-		for _i in [_i.replace(':', '').split() for _i in open(os.path.join(self._ProcPidPath, 'status'), 'r').readlines()]:
-			_x[_i[0]] = _i[1:]
-		return _x
+		if self._record != None:
+			return self._record.status
+		return _parsestatus(open(os.path.join(self._ProcPidPath, 'status'), 'r').read())
+
+	@property
+	#@wrapException
+	def statusinfo(self):
+		"""
+		Desc : Typed information about process (see statusinfo), from the snapshot if there is one
+		Args : None
+		Ret  : Object statusinfo
+		"""
+		if self._record != None:
+			return self._record.statusinfo
+		return statusinfo(open(os.path.join(self._ProcPidPath, 'status'), 'r').read())
 
 	@property
 	#@wrapException
@@ -180,7 +2012,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(self.status['Tgid'][0])
+		return self.statusinfo.tgid
 
 	@property
 	#@wrapException
@@ -190,7 +2022,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(self.status['TracerPid'][0])
+		return self.statusinfo.tracerpid
 
 	@property
 	#@wrapException
@@ -203,8 +2035,8 @@ class id:
 			-> saved
 			-> filesystem
 		"""
-		_real, _effective, _saved, _filesystem =  self.status['Uid']
-		return {'real': int(_real), 'effective': int(_effective), 'saved': int(_saved), 'filesystem': int(_filesystem)}
+		_real, _effective, _saved, _filesystem = self.statusinfo.uid
+		return {'real': _real, 'effective': _effective, 'saved': _saved, 'filesystem': _filesystem}
 
 	@property
 	#@wrapException
@@ -217,8 +2049,8 @@ class id:
 			-> saved
 			-> filesystem
 		"""
-		_real, _effective, _saved, _filesystem =  self.status['Gid']
-		return {'real': int(_real), 'effective': int(_effective), 'saved': int(_saved), 'filesystem': int(_filesystem)}
+		_real, _effective, _saved, _filesystem = self.statusinfo.gid
+		return {'real': _real, 'effective': _effective, 'saved': _saved, 'filesystem': _filesystem}
 
 	@property
 	#@wrapException
@@ -228,7 +2060,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(self.status['FDSize'][0])
+		return self.statusinfo.fdsize
 
 	@property
 	#@wrapException
@@ -238,8 +2070,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmPeak']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmpeak)
 
 	@property
 	#@wrapException
@@ -249,8 +2080,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmSize']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmsize)
 
 	@property
 	#@wrapException
@@ -260,8 +2090,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmLck']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmlck)
 
 	@property
 	#@wrapException
@@ -271,8 +2100,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmHWM']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmhwm)
 
 	@property
 	#@wrapException
@@ -282,8 +2110,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmRSS']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmrss)
 
 	@property
 	#@wrapException
@@ -293,8 +2120,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmData']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmdata)
 
 	@property
 	#@wrapException
@@ -304,8 +2130,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit = self.status['VmLib']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmlib)
 
 	@property
 	#@wrapException
@@ -315,8 +2140,7 @@ class id:
 		Args : None
 		Ret  : Dict
 		"""
-		_value, _unit =  self.status['VmPTE']
-		return {'value': int(_value), 'unit': _unit}
+		return _kbdict(self.statusinfo.vmpte)
 
 	@property
 	#@wrapException
@@ -328,8 +2152,8 @@ class id:
 			short : one letter description
 			long : one word description
 		"""
-		_short, _long = self.status['State']
-		return {'short': _short, 'long': _long[1:-1]}
+		_x = self.statusinfo
+		return {'short': _x.state, 'long': _x.statelong}
 
 	@property
 	#@wrapException
@@ -339,7 +2163,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[3])
+		return self._stat[3]
 
 	@property
 	#@wrapException
@@ -349,7 +2173,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[4])
+		return self._stat[4]
 
 	@property
 	#@wrapException
@@ -359,7 +2183,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[5])
+		return self._stat[5]
 
 	@property
 	#@wrapException
@@ -369,7 +2193,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[6])
+		return self._stat[6]
 
 	@property
 	#@wrapException
@@ -379,13 +2203,13 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[7])
+		return self._stat[7]
 
 	@property
 	#@wrapException
 	def flags(self):
 		"""The kernel flags word of the process."""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[8])
+		return self._stat[8]
 
 	@property
 	#@wrapException
@@ -395,7 +2219,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[9])
+		return self._stat[9]
 
 	@property
 	#@wrapException
@@ -405,7 +2229,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[10])
+		return self._stat[10]
 
 	@property
 	#@wrapException
@@ -415,7 +2239,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[11])
+		return self._stat[11]
 
 	@property
 	#@wrapException
@@ -425,7 +2249,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[12])
+		return self._stat[12]
 
 	@property
 	#@wrapException
@@ -435,7 +2259,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[13])
+		return self._stat[13]
 
 	@property
 	#@wrapException
@@ -445,7 +2269,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[14])
+		return self._stat[14]
 
 	@property
 	#@wrapException
@@ -455,7 +2279,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[15])
+		return self._stat[15]
 
 	@property
 	#@wrapException
@@ -465,13 +2289,13 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[16])
+		return self._stat[16]
 
 	@property
 	#@wrapException
 	def priority(self):
 		"""The kernel stores nice values as numbers in the range 0 (high) to 39 (low), corresponding to the user-visible nice range of -20 to 19."""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[17])
+		return self._stat[17]
 
 	@property
 	#@wrapException
@@ -481,7 +2305,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[18])
+		return self._stat[18]
 
 	@property
 	#@wrapException
@@ -491,7 +2315,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[19])
+		return self._stat[19]
 
 	@property
 	#@wrapException
@@ -501,7 +2325,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[20])
+		return self._stat[20]
 
 	@property
 	#@wrapException
@@ -511,7 +2335,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[21])
+		return self.identity[1]
 
 	@property
 	#@wrapException
@@ -521,7 +2345,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[21])
+		return self._stat[22]
 
 	@property
 	#@wrapException
@@ -531,7 +2355,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[23])
+		return self._stat[23]
 
 	@property
 	#@wrapException
@@ -541,7 +2365,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[24])
+		return self._stat[24]
 
 	@property
 	#@wrapException
@@ -551,7 +2375,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[25])
+		return self._stat[25]
 
 	@property
 	#@wrapException
@@ -561,7 +2385,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[26])
+		return self._stat[26]
 
 	@property
 	#@wrapException
@@ -571,7 +2395,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[27])
+		return self._stat[27]
 
 	@property
 	#@wrapException
@@ -581,7 +2405,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[28])
+		return self._stat[28]
 
 	@property
 	#@wrapException
@@ -591,7 +2415,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[29])
+		return self._stat[29]
 
 	@property
 	#@wrapException
@@ -601,7 +2425,30 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[34])
+		return self._stat[34]
+
+	@property
+	#@wrapException
+	def waitchannel(self):
+		"""
+		Desc : Name of the kernel function in which the process is sleeping (/proc/<pid>/wchan), see linuxutil.offcpu to sample it
+		Args : None
+		Ret  : String (None if the process is running or if the kernel hides it)
+		"""
+		_x = open(os.path.join(self._ProcPidPath, 'wchan'), 'r').read().strip()
+		if _x == '0' or _x == '':
+			return None
+		return _x
+
+	@property
+	#@wrapException
+	def cgroup(self):
+		"""
+		Desc : cgroup v2 of the process, see linuxutil.cgroup to read its counters
+		Args : None
+		Ret  : String (None if the process is only in cgroup v1 hierarchies)
+		"""
+		return linuxutil.cgroup.of(self.pid)
 
 	@property
 	#@wrapException
@@ -611,7 +2458,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[37])
+		return self._stat[37]
 
 	@property
 	#@wrapException
@@ -621,7 +2468,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[38])
+		return self._stat[38]
 
 	@property
 	#@wrapException
@@ -631,7 +2478,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[39])
+		return self._stat[39]
 
 	@property
 	#@wrapException
@@ -641,7 +2488,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[40])
+		return self._stat[40]
 
 	@property
 	#@wrapException
@@ -651,7 +2498,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[41])
+		return self._stat[41]
 
 	@property
 	#@wrapException
@@ -661,7 +2508,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[42])
+		return self._stat[42]
 
 	@property
 	#@wrapException
@@ -671,7 +2518,7 @@ class id:
 		Args : None
 		Ret  : Int
 		"""
-		return int(open(os.path.join(self._ProcPidPath, 'stat'), 'r').read().split()[43])
+		return self._stat[43]
 
 	#@wrapException
 	def signal(self, signal = 15):
@@ -698,124 +2545,34 @@ class id:
 
 		Ret  : Bool
 		"""
-		_signal = {
-			'SIGHUP' : 1,
-			'SIGINT' : 2,
-			'SIGQUIT' : 3,
-			'SIGILL' : 4,
-			'SIGTRAP' : 5,
-			'SIGABRT' : 6,
-			'SIGBUS' : 7,
-			'SIGFPE' : 8,
-			'SIGKILL' : 9,
-			'SIGUSR1' : 10,
-			'SIGSEGV' : 11,
-			'SIGUSR2' : 12,
-			'SIGPIPE' : 13,
-			'SIGALRM' : 14,
-			'SIGTERM' : 15,
-			'SIGSTKFLT' : 16,
-			'SIGCHLD' : 17,
-			'SIGCONT' : 18,
-			'SIGSTOP' : 19,
-			'SIGTSTP' : 20,
-			'SIGTTIN' : 21,
-			'SIGTTOU' : 22,
-			'SIGURG' : 23,
-			'SIGXCPU' : 24,
-			'SIGXFSZ' : 25,
-			'SIGVTALRM' : 26,
-			'SIGPROF' : 27,
-			'SIGWINCH' : 28,
-			'SIGIO' : 29,
-			'SIGPWR' : 30,
-			'SIGSYS' : 31,
-			'SIGRTMIN' : 34,
-			'SIGRTMIN+1' : 35,
-			'SIGRTMIN+2' : 36,
-			'SIGRTMIN+3' : 37,
-			'SIGRTMIN+4' : 38,
-			'SIGRTMIN+5' : 39,
-			'SIGRTMIN+6' : 40,
-			'SIGRTMIN+7' : 41,
-			'SIGRTMIN+8' : 42,
-			'SIGRTMIN+9' : 43,
-			'SIGRTMIN+10' : 44,
-			'SIGRTMIN+11' : 45,
-			'SIGRTMIN+12' : 46,
-			'SIGRTMIN+13' : 47,
-			'SIGRTMIN+14' : 48,
-			'SIGRTMIN+15' : 49,
-			'SIGRTMAX-14' : 50,
-			'SIGRTMAX-13' : 51,
-			'SIGRTMAX-12' : 52,
-			'SIGRTMAX-11' : 53,
-			'SIGRTMAX-10' : 54,
-			'SIGRTMAX-9' : 55,
-			'SIGRTMAX-8' : 56,
-			'SIGRTMAX-7' : 57,
-			'SIGRTMAX-6' : 58,
-			'SIGRTMAX-5' : 59,
-			'SIGRTMAX-4' : 60,
-			'SIGRTMAX-3' : 61,
-			'SIGRTMAX-2' : 62,
-			'SIGRTMAX-1' : 63,
-			'SIGRTMAX' : 64
-		}
-
-		if isinstance(signal, str):
-			if signal in _signal:
-				signal = _signal[signal]
-			else:
-				raise ValueError("%s is not a valid signal" % signal)
+		signal = _signum(signal)
 
-		os.kill(self.pid, int(signal))
+		os.kill(self.pid, signal)
 		return True
 
 	#@wrapException
-	def renice(self, prio = 0):
+	def renice(self, prio = 0, threads = False):
 		"""
 		Desc : Change the cpu prority of the process between -20 to 19. Return True if success or False is not
-		Args : Priority (int) beetween -20 and 19
+		Args :	* Priority (int) beetween -20 and 19
+			* threads (bool) : change the priority of every thread of the process (False by default)
 		Ret  : Bool
 		"""
-		return renice(self.pid, prio, 0)
+		return renice_many([self.pid], prio, threads)[self.pid]
 
 	#@wrapException
-	def iorenice(self, ioclass = 0, iolevel = 0):
+	def iorenice(self, ioclass = 0, iolevel = 0, threads = False):
 		"""
 		Desc : Alter io priority of running processes. Default priority is None
 		Args : 	* iolevel (int) : scheduling class data -> 0-7 for realtime and best-effort classes
 			* ioclass (int) : scheduling class name or number -> 0: none, 1: realtime, 2: best-effort, 3: idle
+			* threads (bool) : alter every thread of the process (False by default)
 		Ret  : Bool
 		Warn : Only CFQ scheduler is compatible with io priority, see what is your is scheduler in /sys/block/<disk>/queue/scheduler
-		Arch : i386, x86_64, ppc, ia64
-		"""
-
-		import ctypes, ctypes.util
-		libc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('c'))
-		_score = ioclass * 8192 + iolevel
-		_myarch = os.uname()[-1].lower()
-
-		#See id syscall in /usr/src/`uname -r`/Documentation/block/ioprio.txt
-		_syscallId = {
-			'i386': 289,
-			'i586': 289,
-			'i686': 289,
-			'x86_64': 251,
-			'ppc': 273,
-			'ia64': 1274
-		}
-		
-		if _myarch not in _syscallId:
-			raise OSError("Architecture %s is not yet supported" % _myarch)
-		
-		_ret = libc.syscall(_syscallId[_myarch], 1, self.pid, _score, 0)
+		Arch : i386, x86_64, ppc, ia64, arm, aarch64, s390x
+		"""
 
-		if _ret == 0:
-			return True
-		else:
-			return False
+		return ionice_many([self.pid], ioclass, iolevel, threads)[self.pid]
 
 	@property
 	#@wrapException
@@ -826,24 +2583,11 @@ class id:
 		Ret  :	* id dor the priority. Exemple io priority with class 2 and level 5 have an id of 16389
 			* class (int) : scheduling class name or number -> 0: none, 1: realtime, 2: best-effort, 3: idle
 			* level (int) : scheduling class data -> 0-7 for realtime and best-effort classes
-		Arch : i386, x86_64, ppc, ia64.
+		Arch : i386, x86_64, ppc, ia64, arm, aarch64, s390x.
 		Warn : only CFQ scheduler is compatible with io priority, see what is your is scheduler in /sys/block/<disk>/queue/scheduler
 		"""
 		
-		import ctypes, ctypes.util
-		libc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('c'))
-
-		#See id syscall in /usr/src/`uname -r`/Documentation/block/ioprio.txt
-		_syscallId = {
-			'i386': 290,
-			'i586': 290,
-			'i686': 290,
-			'x86_64': 252,
-			'ppc': 274,
-			'ia64': 1275
-		}
-
-		_ret = libc.syscall(_syscallId[os.uname()[-1].lower()], 1, self.pid, self.pid, 0)
+		_ret = linuxutil._syscall.ioprio_get(self.pid)
 
 		if _ret == None or _ret == -1:
 			return False
@@ -855,18 +2599,10 @@ class id:
 		"""
 		Desc : Wait the end of a process, or wait a process for a specific time. The step time is 0.1 by default
 		Args :	* wtime : the time to wait for the process (default is 0 means infinite time)
-			* sleep : the schecdule check to wait if the process is running (default is 0.1 means check if process is running all the 0.1sec)
+			* sleep : the schecdule check to wait if the process is running (default is 0.1 means check if process is running all the 0.1sec). Only used if pidfd_open is not supported, else the end of the process is notified by the kernel
 		Ret  : Bool (True is the process has finish before the wtime, Fale if process is stiil running before the wtime)
 		"""
-		_x = time.time()
-
-		while self.isrunning:
-			time.sleep(sleep)
-			_y = time.time() - _x
-			if _y > wtime and wtime != 0:
-				return False
-		
-		return True
+		return self.pid in _wait([self.pid], wtime, True, sleep)
 
 	@property
 	#@wrapException
@@ -876,7 +2612,20 @@ class id:
 		Args : None
 		Ret  : List of strings
 		"""
-		return set([ _x['name'] for _x in self.fd.values() if os.isatty(os.open(_x['name'], os.O_RDONLY)) and _x['name'].startswith('/')])
+		_y = set()
+		for _fd, _x in self.fds(types = ['file']):
+			if not _x['name'].startswith('/dev/') or _x['name'] in _y:
+				continue
+			try:
+				_i = os.open(_x['name'], os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+			except OSError:
+				continue
+			try:
+				if os.isatty(_i):
+					_y.add(_x['name'])
+			finally:
+				os.close(_i)
+		return _y
 		
 	@property
 	#@wrapException
@@ -898,6 +2647,51 @@ class id:
 		"""
 		return [int(_x) for _x in os.listdir(os.path.join(self._ProcPidPath, 'task'))]
 
+	#@wrapException
+	def fds(self, types = None, info = False):
+		"""
+		Desc : Generator over the fd of the process. Only readlink is done for each fd, fdinfo is read only if info is True and only for the fd of the wanted types
+		Args :	* types : List of types to keep (socket, pipe, anon_inode, file...), None for all (default)
+			* info (bool) : read /proc/<pid>/fdinfo/<fd> too (False by default)
+		Ret  : Generator of Tuple (Int, Dict {type: value, name: value, [fdinfo keys: value]})
+		"""
+		_fdpath = os.path.join(self._ProcPidPath, 'fd')
+
+		for _fd in os.listdir(_fdpath):
+			try: #For correct a bug (if os.listdir browse the current python fd directory, it will generate a new fd (just for os.readlink) and it will impossible to read the link because it will have disappeared !). Solution : just pass the ghost fd
+				_x = os.readlink(os.path.join(_fdpath, _fd))
+			except OSError:
+				continue
+
+			_i = _x.find(':')
+			if _x.startswith('/') or _i == -1:
+				_y = {'type': 'file', 'name': _x}
+			elif _x[-1] == ']':
+				_y = {'type': _x[0:_i], 'name': _x[_i+2:-1]}
+			else:
+				_y = {'type': _x[0:_i], 'name': _x[_i+1:]}
+
+			if types != None and _y['type'] not in types:
+				continue
+
+			if info == True:
+				try:
+					_y.update(_parsefdinfo(open(os.path.join(self._ProcPidPath, 'fdinfo', _fd), 'r').read()))
+				except (IOError, OSError):
+					continue
+
+			yield (int(_fd), _y)
+
+	@property
+	#@wrapException
+	def numfd(self):
+		"""
+		Desc : Number of opened fd (only the directory /proc/<pid>/fd is listed)
+		Args : None
+		Ret  : Int
+		"""
+		return len(os.listdir(os.path.join(self._ProcPidPath, 'fd')))
+
 	@property
 	#@wrapException
 	def fd(self):
@@ -906,31 +2700,7 @@ class id:
 		Args : None
 		Ret  : Dict of Int -> id {info: value}
 		"""
-		_y = {}
-
-		for _fd in os.listdir(os.path.join(self._ProcPidPath, 'fd')):
-			try: #For correct a bug (if os.listdir browse the current python fd directory, it will generate a new fd (just for os.readlink) and it will impossible to read the link because it will have disappeared !). Solution : just pass the ghost fd
-				_x = os.readlink(os.path.join(self._ProcPidPath, 'fd', _fd))
-			except:
-				continue
-			
-			_y[int(_fd)] = {}
-			
-			try:
-				_i = _x.index(':')
-				_y[int(_fd)]['type'] = _x[0:_i]
-				if _x[-1] == ']':
-					_y[int(_fd)]['name'] = _x[_i+2:-1]
-				else:
-					_y[int(_fd)]['name'] = _x[_i+1:]
-			except:
-				_y[int(_fd)]['type'] = 'file'
-				_y[int(_fd)]['name'] = _x
-
-			for l in open(os.path.join(self._ProcPidPath, 'fdinfo', _fd)).readlines():
-				_k, _v = l.split(':')
-				_y[int(_fd)][_k] = int(_v.strip())
-		return _y
+		return dict(self.fds(info = True))
 
 	@property
 	#@wrapException
@@ -974,14 +2744,7 @@ class id:
 		if not self.isrunning:
 			return False
 
-		_y = self.pid
-		_x = []		
-
-		while id(_y).pid != 1:
-			_y = id(_y).ppid
-			_x.append(_y)
-
-		return _x
+		return parents(self.pid)
 
 	@property
 	#@wrapException
@@ -1001,7 +2764,7 @@ class id:
 		Args : None
 		Ret : List of Int
 		"""
-		return [_x for _x in ls() if id(_x).ppid == self.pid]
+		return tree().children(self.pid)
 
 	@property
 	#@wrapException
@@ -1021,16 +2784,23 @@ class id:
 		Args : None
 		Ret  : List of Objets
 		"""
-		return [id(_x) for _x in ls() if id(_x).ppid == self.pid]
+		_x = []
+		for _y in self.cpid:
+			try:
+				_x.append(id(_y))
+			except OSError:
+				continue
+		return _x
 
 	#@wrapException
-	def setcpu(self, cpus):
+	def setcpu(self, cpus, threads = False):
 		"""
 		Desc : Set authorized cpu(s) 
-		Args : cpus = List of processor id (int)
+		Args :	* cpus = List of processor id (int) or cpu list string (ex 0-3,8-11)
+			* threads (bool) : apply to every thread of /proc/<pid>/task, not only the main thread (False by default)
 		Ret  : bool
 		"""
-		return linuxutil._cpuAffinity.set_cpu_affinity(cpus, self.pid)
+		return _many(lambda _tid: linuxutil._cpuAffinity.set_cpu_affinity(cpus, _tid), [self.pid], threads)[self.pid]
 
 	@property
 	#@wrapException
@@ -1042,6 +2812,28 @@ class id:
 		"""
 		return linuxutil._cpuAffinity.get_cpu_affinity(self.pid)
 
+	@property
+	#@wrapException
+	def cpulist(self):
+		"""
+		Desc : Get authorized cpu(s) as a cpu list string
+		Args : None
+		Ret  : String ex 0-3,8-11
+		"""
+		return linuxutil._cpuAffinity.format_cpulist(self.getcpu)
+
+	#@wrapException
+	def place(self, dev = None, node = None, cpus = None, threads = True):
+		"""
+		Desc : Pin all the threads of the process to the cpus local to a network device or to a NUMA node
+		Args :	* dev (string) : network device, the cpus of net.dev(dev).localcpulist
+			* node (int) : NUMA node
+			* cpus : List of Int or cpu list string (used if dev and node are None)
+			* threads (bool) : apply to every thread (True by default)
+		Ret  : bool
+		"""
+		return setcpu_many([self.pid], _placement(dev, node, cpus), threads)[self.pid]
+
 	#@wrapException
 	def socket(self, fd = False):
 		"""
@@ -1050,6 +2842,6 @@ class id:
 		Ret  : List of Int if fd set to False or Dict
 		"""
 		if fd == True :
-			return dict([(_k, int(_v['name'])) for _k, _v  in self.fd.items() if _v['type'] == 'socket'])
+			return dict([(_k, int(_v['name'])) for _k, _v in self.fds(types = ['socket'])])
 		else :
-			return [int(_x['name']) for _x  in self.fd.values() if _x['type'] == 'socket']
+			return [int(_v['name']) for _k, _v in self.fds(types = ['socket'])]
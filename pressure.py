@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Pressure stall information (PSI, Linux >= 4.20) of the host in
+/proc/pressure and of the cgroups v2 in <cgroup>/{cpu,memory,io}.pressure.
+Triggers are armed in the kernel, so the monitor sleeps until a stall time
+crosses a budget instead of polling the files.
+
+Exemple :
+	>>> import linuxutil.pressure as pressure
+	>>> pressure.read('memory')['some']['avg10']
+	>>> with pressure.monitor() as m:
+	>>> 	m.add('memory', 150000, 2000000)
+	>>> 	m.add('io', 100000, 2000000, cgroup = '/sys/fs/cgroup/system.slice')
+	>>> 	for _t in m: print(_t.resource, _t.cgroup, pressure.read(_t.resource, _t.cgroup))"""
+
+import os
+from linuxutil._common import *
+
+_pressurePath = os.path.join(ProcessPath, 'pressure')
+
+def _setroot():
+	"""
+	Desc : Build again the paths from ProcessPath (called by setroot)
+	Args : None
+	Ret  : None
+	"""
+	global _pressurePath
+
+	_pressurePath = os.path.join(ProcessPath, 'pressure')
+
+resources = ['cpu', 'memory', 'io', 'irq']
+
+#@wrapException
+def _parse(data):
+	"""
+	Desc : Parse a pressure file
+	Args : data (string)
+	Ret  : Dict of String (some, full) -> Dict {avg10, avg60, avg300 (percent of the time stalled), total (microseconds stalled)}
+	"""
+	_x = {}
+	for _line in data.splitlines():
+		_y = _line.split()
+		if not _y:
+			continue
+		_x[_y[0]] = dict([(_k, int(_v) if _k == 'total' else float(_v)) for _k, _s, _v in [_z.partition('=') for _z in _y[1:]]])
+	return _x
+
+#@wrapException
+def _path(resource, cgroup = None):
+	"""
+	Desc : Path of a pressure file
+	Args :	* resource : cpu, memory, io or irq
+		* cgroup : path of a cgroup v2 directory (None for the host)
+	Ret  : String
+	"""
+	if resource not in resources:
+		raise ValueError('%s is not a pressure resource (%s)' % (resource, ', '.join(resources)))
+	if cgroup == None:
+		return os.path.join(_pressurePath, resource)
+	return os.path.join(cgroup, '%s.pressure' % resource)
+
+#@wrapException
+def read(resource = 'cpu', cgroup = None):
+	"""
+	Desc : Pressure of a resource
+	Args :	* resource : cpu (default), memory, io or irq
+		* cgroup : path of a cgroup v2 directory (None for the host)
+	Ret  : Dict of String (some, full) -> Dict {avg10, avg60, avg300, total}
+		* some : share of the time where at least one task was stalled
+		* full : share of the time where all the non-idle tasks were stalled (host cpu.pressure has full only since Linux 5.13)
+	"""
+	return _parse(open(_path(resource, cgroup), 'r').read())
+
+#@wrapException
+def readall(cgroup = None):
+	"""
+	Desc : Pressure of all the resources available (irq needs CONFIG_IRQ_TIME_ACCOUNTING)
+	Args : cgroup : path of a cgroup v2 directory (None for the host)
+	Ret  : Dict of String (resource) -> see read()
+	"""
+	_x = {}
+	for _resource in resources:
+		try:
+			_x[_resource] = read(_resource, cgroup)
+		except (IOError, OSError):
+			continue
+	return _x
+
+class trigger:
+	"""
+	Desc : PSI trigger, the kernel wakes up the pollers when the tasks have been stalled more than stall microseconds during a window of microseconds. The trigger exists as long as its file is open
+	Type : Class
+	Ret  : Object
+	Warn : Unprivileged users (without CAP_SYS_RESOURCE) can only use windows multiple of 2 seconds. Window is between 500ms and 10s
+
+	Exemple :
+		>>> with pressure.trigger('memory', 150000, 2000000) as t:
+		>>> 	t.wait()
+	"""
+
+	def __init__(self, resource, stall, window = 2000000, kind = 'some', cgroup = None):
+		"""
+		Desc : Arm the trigger
+		Args :	* resource : cpu, memory, io or irq
+			* stall (int) : threshold of stall time in microseconds
+			* window (int) : window in microseconds (2s by default, the shortest window allowed without CAP_SYS_RESOURCE)
+			* kind : some (default) or full
+			* cgroup : path of a cgroup v2 directory (None for the host)
+		Ret  : Objet
+		"""
+		self.resource = resource
+		self.stall = int(stall)
+		self.window = int(window)
+		self.kind = kind
+		self.cgroup = cgroup
+		self.path = _path(resource, cgroup)
+		self.events = 0
+
+		self._fd = os.open(self.path, os.O_RDWR | os.O_NONBLOCK | os.O_CLOEXEC)
+		try:
+			os.write(self._fd, ('%s %d %d\0' % (kind, self.stall, self.window)).encode())
+		except:
+			os.close(self._fd)
+			raise
+
+	def __repr__(self):
+		return 'trigger(%s, %s %d %d, cgroup=%s)' % (self.resource, self.kind, self.stall, self.window, self.cgroup)
+
+	def fileno(self):
+		return self._fd
+
+	#@wrapException
+	def close(self):
+		"""
+		Desc : Disarm the trigger
+		Args : None
+		Ret  : None
+		"""
+		if self._fd != None:
+			os.close(self._fd)
+			self._fd = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	#@wrapException
+	def wait(self, timeout = None):
+		"""
+		Desc : Wait the next event of the trigger
+		Args : timeout : time to wait in seconds (None means infinite time)
+		Ret  : Bool (False if the timeout has expired). Raises OSError (ENODEV) if the cgroup has been removed
+		"""
+		import select, errno
+
+		_poll = select.poll()
+		_poll.register(self._fd, select.POLLPRI)
+		for _fd, _event in _poll.poll(None if timeout == None else timeout * 1000):
+			if _event & select.POLLERR:
+				raise OSError(errno.ENODEV, 'The monitored cgroup has been removed', self.path)
+			if _event & select.POLLPRI:
+				self.events += 1
+				return True
+		return False
+
+class monitor:
+	"""
+	Desc : Many triggers multiplexed in one epoll
+	Type : Class
+	Ret  : Object (iterable of trigger, the triggers which fire)
+		* triggers : Dict of Int (fd) -> trigger
+		* removed : List of trigger, the triggers whose cgroup has been removed (they are closed)
+	"""
+
+	def __init__(self):
+		"""
+		Desc : Create the epoll
+		Args : None
+		Ret  : Objet
+		"""
+		import select
+		self._select = select
+		self._epoll = select.epoll()
+		self.triggers = {}
+		self.removed = []
+
+	#@wrapException
+	def add(self, resource, stall, window = 2000000, kind = 'some', cgroup = None):
+		"""
+		Desc : Arm a trigger and watch it
+		Args : see trigger
+		Ret  : trigger
+		"""
+		_x = trigger(resource, stall, window, kind, cgroup)
+		self.register(_x)
+		return _x
+
+	#@wrapException
+	def register(self, trigger):
+		"""
+		Desc : Watch a trigger armed by the caller
+		Args : trigger
+		Ret  : None
+		"""
+		self._epoll.register(trigger.fileno(), self._select.EPOLLPRI)
+		self.triggers[trigger.fileno()] = trigger
+
+	#@wrapException
+	def remove(self, trigger):
+		"""
+		Desc : Stop watching a trigger and disarm it
+		Args : trigger
+		Ret  : None
+		"""
+		_fd = trigger.fileno()
+		if _fd in self.triggers:
+			self._epoll.unregister(_fd)
+			del self.triggers[_fd]
+		trigger.close()
+
+	def fileno(self):
+		return self._epoll.fileno()
+
+	#@wrapException
+	def close(self):
+		"""
+		Desc : Disarm all the triggers and close the epoll
+		Args : None
+		Ret  : None
+		"""
+		for _x in list(self.triggers.values()):
+			self.remove(_x)
+		self._epoll.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	#@wrapException
+	def read(self, timeout = None):
+		"""
+		Desc : Wait the next events
+		Args : timeout : time to wait in seconds (None means infinite time)
+		Ret  : List of trigger (empty if the timeout has expired). The triggers whose cgroup has been removed are moved to removed
+		"""
+		_y = []
+		for _fd, _event in self._epoll.poll(-1 if timeout == None else timeout):
+			_x = self.triggers.get(_fd)
+			if _x == None:
+				continue
+			if _event & self._select.EPOLLERR:
+				self.remove(_x)
+				self.removed.append(_x)
+			elif _event & self._select.EPOLLPRI:
+				_x.events += 1
+				_y.append(_x)
+		return _y
+
+	def __iter__(self):
+		while self.triggers:
+			for _x in self.read():
+				yield _x
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""CPU topology of the host (packages, cores, SMT siblings, caches and NUMA
+nodes) read in /sys/devices/system/cpu and /sys/devices/system/node, and a
+planner placing pinned workers on it.
+
+Exemple :
+	>>> import linuxutil.topology as topology
+	>>> topology.host().cores
+	>>> plan = topology.plan(4, node = 0)
+	>>> topology.apply([1201, 1202, 1203, 1204], plan)"""
+
+import os, collections
+from linuxutil._common import *
+import linuxutil._cpuAffinity, linuxutil.pid
+
+_cpuPath = os.path.join(SysPath, 'devices', 'system', 'cpu')
+_nodePath = os.path.join(SysPath, 'devices', 'system', 'node')
+
+#Cache of host()
+_host = None
+
+def _setroot():
+	"""
+	Desc : Build again the paths from SysPath and drop the cached topology (called by setroot)
+	Args : None
+	Ret  : None
+	"""
+	global _cpuPath, _nodePath, _host
+
+	_cpuPath = os.path.join(SysPath, 'devices', 'system', 'cpu')
+	_nodePath = os.path.join(SysPath, 'devices', 'system', 'node')
+	_host = None
+
+cache = collections.namedtuple('cache', ['level', 'type', 'size', 'line', 'cpus'])
+
+class cpu:
+	"""
+	Desc : A logical cpu
+	Type : Class
+	Ret  : Object
+		* id, core, package, die, node (int, die and node are None if unknown)
+		* siblings : List of Int, the SMT threads of the same physical core (this cpu included)
+	"""
+
+	__slots__ = ('id', 'core', 'package', 'die', 'node', 'siblings')
+
+	def __init__(self, id, core, package, die = None, node = None, siblings = None):
+		self.id = id
+		self.core = core
+		self.package = package
+		self.die = die
+		self.node = node
+		self.siblings = siblings or [id]
+
+	def __repr__(self):
+		return 'cpu(id=%d, core=%d, package=%d, node=%s, siblings=%s)' % (self.id, self.core, self.package, self.node, linuxutil._cpuAffinity.format_cpulist(self.siblings))
+
+#@wrapException
+def _readint(path, default = None):
+	try:
+		return int(open(path, 'r').read())
+	except (IOError, OSError, ValueError):
+		return default
+
+#@wrapException
+def _readlist(path):
+	try:
+		return linuxutil._cpuAffinity.parse_cpulist(open(path, 'r').read())
+	except (IOError, OSError):
+		return []
+
+#@wrapException
+def _size(data):
+	"""
+	Desc : Size of a cache (ex 48K, 16M)
+	Args : data (string)
+	Ret  : Int (bytes)
+	"""
+	data = data.strip()
+	_unit = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+	if data and data[-1] in _unit:
+		return int(data[:-1]) * _unit[data[-1]]
+	return int(data)
+
+class topology:
+	"""
+	Desc : CPU topology of the host, use host() to get the cached instance
+	Type : Class
+	Ret  : Object
+		* cpus : Dict of Int (cpu id) -> cpu, online cpus only
+		* nodes : Dict of Int (node) -> List of Int (cpus)
+		* distances : Dict of Int (node) -> List of Int (NUMA distance to each node)
+		* caches : List of cache (one entry for each cache, shared caches are listed once)
+	"""
+
+	def __init__(self, cpupath = None, nodepath = None):
+		"""
+		Desc : Read the topology
+		Args :	* cpupath : /sys/devices/system/cpu by default
+			* nodepath : /sys/devices/system/node by default
+		Ret  : Objet
+		"""
+		cpupath = cpupath or _cpuPath
+		nodepath = nodepath or _nodePath
+		self.cpus = {}
+		self.nodes = {}
+		self.distances = {}
+		self.caches = []
+
+		if os.path.isdir(nodepath):
+			for _entry in os.scandir(nodepath):
+				if _entry.name.startswith('node') and _entry.name[4:].isdigit():
+					_node = int(_entry.name[4:])
+					self.nodes[_node] = _readlist(os.path.join(_entry.path, 'cpulist'))
+					try:
+						self.distances[_node] = [int(_x) for _x in open(os.path.join(_entry.path, 'distance'), 'r').read().split()]
+					except (IOError, OSError):
+						pass
+
+		_nodeof = dict([(_cpu, _node) for _node, _cpus in self.nodes.items() for _cpu in _cpus])
+		_seen = set()
+
+		for _id in _readlist(os.path.join(cpupath, 'online')):
+			_path = os.path.join(cpupath, 'cpu%d' % _id, 'topology')
+			_siblings = _readlist(os.path.join(_path, 'thread_siblings_list'))
+			self.cpus[_id] = cpu(_id, _readint(os.path.join(_path, 'core_id'), _id), _readint(os.path.join(_path, 'physical_package_id'), 0), _readint(os.path.join(_path, 'die_id')), _nodeof.get(_id), _siblings)
+
+			_cachepath = os.path.join(cpupath, 'cpu%d' % _id, 'cache')
+			if not os.path.isdir(_cachepath):
+				continue
+			for _entry in os.scandir(_cachepath):
+				if not _entry.name.startswith('index'):
+					continue
+				try:
+					_level = int(open(os.path.join(_entry.path, 'level'), 'r').read())
+					_type = open(os.path.join(_entry.path, 'type'), 'r').read().strip()
+					_shared = tuple(_readlist(os.path.join(_entry.path, 'shared_cpu_list')))
+					_key = (_level, _type, _shared)
+					if _key in _seen:
+						continue
+					_seen.add(_key)
+					self.caches.append(cache(_level, _type, _size(open(os.path.join(_entry.path, 'size'), 'r').read()), _readint(os.path.join(_entry.path, 'coherency_line_size')), list(_shared)))
+				except (IOError, OSError, ValueError):
+					continue
+
+		self.caches.sort(key = lambda _x: (_x.level, _x.type, _x.cpus))
+
+	@property
+	#@wrapException
+	def cores(self):
+		"""
+		Desc : Physical cores
+		Args : None
+		Ret  : Dict of Tuple (package, die, core) -> List of Int (online SMT threads of the core)
+		"""
+		_x = {}
+		for _cpu in sorted(self.cpus.values(), key = lambda _y: _y.id):
+			_x.setdefault((_cpu.package, _cpu.die, _cpu.core), []).append(_cpu.id)
+		return _x
+
+	@property
+	#@wrapException
+	def packages(self):
+		"""
+		Desc : Sockets
+		Args : None
+		Ret  : Dict of Int (package) -> List of Int (cpus)
+		"""
+		_x = {}
+		for _cpu in sorted(self.cpus.values(), key = lambda _y: _y.id):
+			_x.setdefault(_cpu.package, []).append(_cpu.id)
+		return _x
+
+	@property
+	#@wrapException
+	def smt(self):
+		"""
+		Desc : True if at least one core runs many threads
+		Args : None
+		Ret  : Bool
+		"""
+		return any([len(_x) > 1 for _x in self.cores.values()])
+
+	#@wrapException
+	def sharing(self, id, level = None):
+		"""
+		Desc : Caches used by a cpu
+		Args :	* id (int) : cpu
+			* level (int) : only the caches of this level (None for all)
+		Ret  : List of cache
+		"""
+		return [_x for _x in self.caches if id in _x.cpus and (level == None or _x.level == level)]
+
+	#@wrapException
+	def plan(self, workers, node = None, smt = True, cpus = None):
+		"""
+		Desc : Choose one cpu for each worker. The workers are spread on the physical cores (one thread of each core) before using the SMT siblings, the cores of the node are used first, then the nearest nodes
+		Args :	* workers (int) : number of workers
+			* node (int) : preferred NUMA node (None for no preference)
+			* smt (bool) : use the SMT siblings when there are more workers than cores (True by default), else the cores are reused
+			* cpus : List of Int or cpu list string, the allowed cpus (None for all the online cpus)
+		Ret  : List of Int (cpu of each worker)
+		"""
+		if isinstance(cpus, str):
+			cpus = linuxutil._cpuAffinity.parse_cpulist(cpus)
+		_allowed = set(cpus) if cpus != None else set(self.cpus)
+
+		_distance = self.distances.get(node, [])
+		_coremap = self.cores
+		def _rank(_key):
+			_node = self.cpus[_coremap[_key][0]].node
+			if node == None or _node == None:
+				return (0,) + _key
+			return (_distance[_node] if _node < len(_distance) else (0 if _node == node else 255),) + _key
+
+		#Round i takes the i-th thread of each core, so the siblings are used only when all the cores have a worker
+		_cores = [[_y for _y in _coremap[_key] if _y in _allowed] for _key in sorted(_coremap, key = _rank)]
+		_cores = [_x for _x in _cores if _x]
+		if not _cores:
+			raise ValueError('No cpu allowed')
+
+		_order = []
+		for _round in range(max([len(_x) for _x in _cores]) if smt == True else 1):
+			_order += [_x[_round] for _x in _cores if _round < len(_x)]
+
+		return [_order[_i % len(_order)] for _i in range(workers)]
+
+#@wrapException
+def host(refresh = False):
+	"""
+	Desc : Topology of the host, read once and cached (use refresh after a cpu hotplug)
+	Args : refresh (bool) : read the topology again (False by default)
+	Ret  : topology
+	"""
+	global _host
+
+	if _host == None or refresh == True:
+		_host = topology()
+	return _host
+
+#@wrapException
+def plan(workers, node = None, smt = True, cpus = None):
+	"""
+	Desc : topology.plan() of the host
+	Args : see topology.plan
+	Ret  : List of Int (cpu of each worker)
+	"""
+	return host().plan(workers, node, smt, cpus)
+
+#@wrapException
+def apply(pids, plan, threads = False):
+	"""
+	Desc : Pin each process (or thread id) to the cpu planned for it with pid.id.setcpu
+	Args :	* pids : List of Int, the workers
+		* plan : List of Int, cpu of each worker (see plan())
+		* threads (bool) : pin all the threads of each process (False by default)
+	Ret  : Dict of Int (pid) -> Bool
+	"""
+	if len(plan) < len(pids):
+		raise ValueError('%d workers but %d cpus planned' % (len(pids), len(plan)))
+
+	_x = {}
+	for _pid, _cpu in zip(pids, plan):
+		try:
+			_x[int(_pid)] = linuxutil.pid.id(_pid, cache = False).setcpu([_cpu], threads)
+		except (IOError, OSError):
+			_x[int(_pid)] = False
+	return _x